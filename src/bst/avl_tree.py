@@ -1,32 +1,64 @@
 # src/bst/avl_tree.py
 
 class AVLNode:
+    __slots__ = ('key', 'left', 'right', 'height', 'size')
+
     def __init__(self, key):
         self.key = key
         self.left = None
         self.right = None
         self.height = 1  # Altura del nodo
+        self.size = 1  # Número de nodos del subárbol (para rank/select)
 
 class AVLTree:
     def __init__(self):
         self.root = None
 
+    @classmethod
+    def from_sorted(cls, keys):
+        """
+        Construye en O(n) un árbol perfectamente balanceado a partir de claves
+        ya ordenadas, tomando siempre el elemento central como raíz.
+        """
+        tree = cls()
+
+        def build(lo, hi):
+            if lo > hi:
+                return None
+            mid = (lo + hi) // 2
+            node = AVLNode(keys[mid])
+            node.left = build(lo, mid - 1)
+            node.right = build(mid + 1, hi)
+            tree._update(node)
+            return node
+
+        tree.root = build(0, len(keys) - 1)
+        return tree
+
+    def __len__(self):
+        return self._size(self.root)
+
     def _height(self, node):
         return node.height if node else 0
 
+    def _size(self, node):
+        return node.size if node else 0
+
     def _balance_factor(self, node):
         return self._height(node.left) - self._height(node.right)
 
-    def _update_height(self, node):
+    def _update(self, node):
+        # Recalcula los campos aumentados (altura y tamaño) a partir de los hijos.
         node.height = 1 + max(self._height(node.left), self._height(node.right))
+        node.size = 1 + self._size(node.left) + self._size(node.right)
 
     def _rotate_right(self, y):
         x = y.left
         T2 = x.right
         x.right = y
         y.left = T2
-        self._update_height(y)
-        self._update_height(x)
+        self._update(y)
+        self._update(x)
         return x
 
     def _rotate_left(self, x):
@@ -34,8 +66,8 @@ class AVLTree:
         T2 = y.left
         y.left = x
         x.right = T2
-        self._update_height(x)
-        self._update_height(y)
+        self._update(x)
+        self._update(y)
         return y
 
     def _rebalance(self, node):
@@ -50,18 +82,79 @@ class AVLTree:
             return self._rotate_left(node)
         return node  # No balancing needed
 
-    def _insert(self, node, key):
-        if not node:
-            return AVLNode(key)
-        if key < node.key:
-            node.left = self._insert(node.left, key)
-        else:
-            node.right = self._insert(node.right, key)
-        self._update_height(node)
-        return self._rebalance(node)
+    def _rebalance_path(self, path):
+        """
+        Recorre el camino desde el nodo más profundo hasta path[0] actualizando
+        altura y tamaño, rebalanceando y volviendo a enlazar cada subárbol con su padre.
+
+        :return: La nueva raíz del subárbol que encabezaba path[0].
+        """
+        subtree = None
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            self._update(node)
+            subtree = self._rebalance(node)
+            if subtree is not node and i > 0:
+                if path[i - 1].left is node:
+                    path[i - 1].left = subtree
+                else:
+                    path[i - 1].right = subtree
+        return subtree
 
     def insert(self, key):
-        self.root = self._insert(self.root, key)
+        """
+        Inserta una clave sin recursión. Las claves repetidas van a la derecha.
+        """
+        if self.root is None:
+            self.root = AVLNode(key)
+            return
+        path = []
+        node = self.root
+        while node:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = AVLNode(key)
+        else:
+            parent.right = AVLNode(key)
+        self.root = self._rebalance_path(path)
+
+    def delete(self, key):
+        """
+        Elimina una aparición de la clave sin recursión.
+
+        :return: True si la clave estaba en el árbol, False en caso contrario.
+        """
+        path = []
+        node = self.root
+        while node and key != node.key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if node is None:
+            return False
+
+        if node.left and node.right:
+            # Dos hijos: se copia el sucesor y se elimina el sucesor, que no
+            # tiene hijo izquierdo.
+            path.append(node)
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+            node.key = successor.key
+            node = successor
+
+        child = node.left if node.left else node.right
+        if not path:
+            self.root = child
+            return True
+        if path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        self.root = self._rebalance_path(path)
+        return True
 
     def search(self, key):
         node = self.root
@@ -73,3 +166,197 @@ class AVLTree:
             else:
                 node = node.right
         return False
+
+    def rank(self, key):
+        """
+        Devuelve cuántas claves del árbol son estrictamente menores que `key`.
+        """
+        rank = 0
+        node = self.root
+        while node:
+            if key <= node.key:
+                node = node.left
+            else:
+                rank += self._size(node.left) + 1
+                node = node.right
+        return rank
+
+    def select(self, i):
+        """
+        Devuelve la i-ésima clave más pequeña (0-indexada).
+        """
+        if not 0 <= i < self._size(self.root):
+            raise IndexError("Índice fuera de rango en select().")
+        node = self.root
+        while True:
+            left_size = self._size(node.left)
+            if i < left_size:
+                node = node.left
+            elif i == left_size:
+                return node.key
+            else:
+                i -= left_size + 1
+                node = node.right
+
+    def range(self, lo, hi):
+        """
+        Genera en orden las claves k con lo <= k <= hi, visitando solo los
+        subárboles que pueden contenerlas.
+        """
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                if node.key < lo:
+                    node = node.right  # Todo el subárbol izquierdo es < lo
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.key > hi:
+                return
+            yield node.key
+            node = node.right
+
+    # --- Operaciones de conjuntos basadas en join ---
+    # Todas trabajan sobre nodos y los reutilizan: los árboles operandos se
+    # consumen. Suponen claves únicas (semántica de conjunto).
+
+    def _join(self, left, node, right):
+        """
+        Une dos subárboles AVL usando `node` como pivote, con todas las claves de
+        `left` < node.key < todas las de `right`. Cuesta O(|h(left) - h(right)| + 1).
+        """
+        hl, hr = self._height(left), self._height(right)
+        if hl > hr + 1:
+            # Se desciende por la espina derecha de `left` hasta una altura
+            # compatible con `right` y se cuelga ahí el pivote.
+            path = []
+            c = left
+            while self._height(c) > hr + 1:
+                path.append(c)
+                c = c.right
+            node.left, node.right = c, right
+            self._update(node)
+            path[-1].right = node
+            return self._rebalance_path(path)
+        if hr > hl + 1:
+            path = []
+            c = right
+            while self._height(c) > hl + 1:
+                path.append(c)
+                c = c.left
+            node.left, node.right = left, c
+            self._update(node)
+            path[-1].left = node
+            return self._rebalance_path(path)
+        node.left, node.right = left, right
+        self._update(node)
+        return node
+
+    def _split(self, node, key):
+        """
+        Divide un subárbol en (claves < key, encontrado, claves > key).
+        """
+        if node is None:
+            return None, False, None
+        left, right = node.left, node.right
+        if key == node.key:
+            return left, True, right
+        if key < node.key:
+            less, found, greater = self._split(left, key)
+            return less, found, self._join(greater, node, right)
+        less, found, greater = self._split(right, key)
+        return self._join(left, node, less), found, greater
+
+    def _split_last(self, node):
+        """
+        Separa el nodo con la clave máxima: devuelve (resto, nodo máximo).
+        """
+        if node.right is None:
+            return node.left, node
+        rest, last = self._split_last(node.right)
+        return self._join(node.left, node, rest), last
+
+    def _join2(self, left, right):
+        # Unión de dos subárboles sin pivote: se usa el máximo de `left`.
+        if left is None:
+            return right
+        rest, last = self._split_last(left)
+        return self._join(rest, last, right)
+
+    def _union(self, t1, t2):
+        if t1 is None:
+            return t2
+        if t2 is None:
+            return t1
+        less, _, greater = self._split(t2, t1.key)
+        left = self._union(t1.left, less)
+        right = self._union(t1.right, greater)
+        return self._join(left, t1, right)
+
+    def _intersection(self, t1, t2):
+        if t1 is None or t2 is None:
+            return None
+        less, found, greater = self._split(t2, t1.key)
+        left = self._intersection(t1.left, less)
+        right = self._intersection(t1.right, greater)
+        if found:
+            return self._join(left, t1, right)
+        return self._join2(left, right)
+
+    def _difference(self, t1, t2):
+        if t1 is None or t2 is None:
+            return t1
+        less, _, greater = self._split(t1, t2.key)
+        left = self._difference(less, t2.left)
+        right = self._difference(greater, t2.right)
+        return self._join2(left, right)
+
+    @classmethod
+    def join(cls, left_tree, key, right_tree):
+        """
+        Crea un árbol con las claves de `left_tree`, `key` y las de `right_tree`,
+        suponiendo que todas las de `left_tree` son menores que `key` y todas las
+        de `right_tree` mayores. Los dos árboles de entrada quedan vacíos.
+        """
+        tree = cls()
+        tree.root = tree._join(left_tree.root, AVLNode(key), right_tree.root)
+        left_tree.root = right_tree.root = None
+        return tree
+
+    def split(self, key):
+        """
+        Divide el árbol en O(log n).
+
+        :return: Tupla (árbol con claves < key, True si key estaba, árbol con claves > key).
+                 Este árbol queda vacío.
+        """
+        less, greater = type(self)(), type(self)()
+        less.root, found, greater.root = self._split(self.root, key)
+        self.root = None
+        return less, found, greater
+
+    def union(self, other):
+        """
+        Agrega a este árbol las claves de `other` en O(m log(n/m + 1)), con m el
+        tamaño del menor. `other` queda vacío.
+        """
+        self.root = self._union(self.root, other.root)
+        other.root = None
+
+    def intersection(self, other):
+        """
+        Deja en este árbol solo las claves que también están en `other`. `other` queda vacío.
+        """
+        self.root = self._intersection(self.root, other.root)
+        other.root = None
+
+    def difference(self, other):
+        """
+        Quita de este árbol las claves que están en `other`. `other` queda vacío.
+        """
+        self.root = self._difference(self.root, other.root)
+        other.root = None
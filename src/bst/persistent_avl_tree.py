@@ -0,0 +1,114 @@
+# src/bst/persistent_avl_tree.py
+
+class PersistentAVLNode:
+    """
+    Nodo inmutable: nunca se modifica después de crearlo, así que puede ser
+    compartido por muchas versiones del árbol a la vez.
+    """
+    __slots__ = ('key', 'left', 'right', 'height', 'size')
+
+    def __init__(self, key, left, right):
+        self.key = key
+        self.left = left
+        self.right = right
+        self.height = 1 + max(_height(left), _height(right))
+        self.size = 1 + _size(left) + _size(right)
+
+def _height(node):
+    return node.height if node else 0
+
+def _size(node):
+    return node.size if node else 0
+
+def _balance(key, left, right):
+    """
+    Crea un nodo con `key`, `left` y `right` aplicando, si hace falta, una
+    rotación simple o doble. Solo se crean nodos nuevos: los hijos se comparten.
+    """
+    hl, hr = _height(left), _height(right)
+    if hl > hr + 1:  # Left heavy
+        if _height(left.left) >= _height(left.right):
+            return PersistentAVLNode(left.key, left.left, PersistentAVLNode(key, left.right, right))
+        lr = left.right  # Left-Right case
+        return PersistentAVLNode(lr.key,
+                                 PersistentAVLNode(left.key, left.left, lr.left),
+                                 PersistentAVLNode(key, lr.right, right))
+    if hr > hl + 1:  # Right heavy
+        if _height(right.right) >= _height(right.left):
+            return PersistentAVLNode(right.key, PersistentAVLNode(key, left, right.left), right.right)
+        rl = right.left  # Right-Left case
+        return PersistentAVLNode(rl.key,
+                                 PersistentAVLNode(key, left, rl.left),
+                                 PersistentAVLNode(right.key, rl.right, right.right))
+    return PersistentAVLNode(key, left, right)
+
+def _insert(node, key):
+    if node is None:
+        return PersistentAVLNode(key, None, None)
+    if key < node.key:
+        left = _insert(node.left, key)
+        return node if left is node.left else _balance(node.key, left, node.right)
+    if key > node.key:
+        right = _insert(node.right, key)
+        return node if right is node.right else _balance(node.key, node.left, right)
+    return node  # La clave ya existe: se comparte el subárbol entero
+
+def _delete_min(node):
+    # Devuelve (clave mínima, subárbol sin ella).
+    if node.left is None:
+        return node.key, node.right
+    key, left = _delete_min(node.left)
+    return key, _balance(node.key, left, node.right)
+
+def _delete(node, key):
+    if node is None:
+        return None
+    if key < node.key:
+        left = _delete(node.left, key)
+        return node if left is node.left else _balance(node.key, left, node.right)
+    if key > node.key:
+        right = _delete(node.right, key)
+        return node if right is node.right else _balance(node.key, node.left, right)
+    if node.left is None:
+        return node.right
+    if node.right is None:
+        return node.left
+    successor, right = _delete_min(node.right)
+    return _balance(successor, node.left, right)
+
+class PersistentAVLTree:
+    """
+    Árbol AVL persistente por copia de camino: `insert` y `delete` devuelven un
+    árbol nuevo que comparte con el anterior todos los subárboles que no están
+    en el camino modificado (O(log n) nodos nuevos por actualización).
+
+    Como ninguna versión se modifica nunca, los lectores pueden conservar una
+    instantánea y seguir buscando sin bloqueos mientras un escritor publica
+    versiones nuevas (reasignar una referencia es atómico).
+    """
+    __slots__ = ('root',)
+
+    def __init__(self, root=None):
+        self.root = root
+
+    def __len__(self):
+        return _size(self.root)
+
+    def insert(self, key):
+        root = _insert(self.root, key)
+        return self if root is self.root else PersistentAVLTree(root)
+
+    def delete(self, key):
+        root = _delete(self.root, key)
+        return self if root is self.root else PersistentAVLTree(root)
+
+    def search(self, key):
+        node = self.root
+        while node:
+            if key == node.key:
+                return True
+            elif key < node.key:
+                node = node.left
+            else:
+                node = node.right
+        return False
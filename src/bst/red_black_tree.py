@@ -1,7 +1,14 @@
 # src/bst/red_black_tree.py (Versión Corregida)
 
+# Colores como booleanos: comparar un bool es más barato que comparar cadenas
+# y no obliga a guardar una referencia a un str en cada nodo.
+RED = True
+BLACK = False
+
 class RBNode:
-    def __init__(self, key, color="red"):
+    __slots__ = ('key', 'left', 'right', 'parent', 'color')
+
+    def __init__(self, key, color=RED):
         self.key = key
         self.left = None
         self.right = None
@@ -11,16 +18,47 @@ class RBNode:
 class RedBlackTree:
     def __init__(self):
         self.TNULL = RBNode(0)
-        self.TNULL.color = "black"
+        self.TNULL.color = BLACK
         self.root = self.TNULL
 
+    @classmethod
+    def from_sorted(cls, keys):
+        """
+        Construye en O(n) un árbol rojo-negro válido a partir de claves ya ordenadas.
+
+        Tomando el elemento central como raíz, todas las hojas quedan en los dos
+        últimos niveles. Si el árbol no es perfecto, los nodos del nivel más
+        profundo se colorean de rojo y el resto de negro, así todos los caminos
+        tienen la misma altura negra y ningún rojo tiene un hijo rojo.
+        """
+        tree = cls()
+        n = len(keys)
+        if n == 0:
+            return tree
+        deepest = n.bit_length() - 1  # Profundidad máxima (la raíz está en 0)
+        perfect = (n + 1) & n == 0    # n + 1 es potencia de dos
+
+        def build(lo, hi, depth, parent):
+            if lo > hi:
+                return tree.TNULL
+            mid = (lo + hi) // 2
+            color = RED if depth == deepest and not perfect else BLACK
+            node = RBNode(keys[mid], color)
+            node.parent = parent
+            node.left = build(lo, mid - 1, depth + 1, node)
+            node.right = build(mid + 1, hi, depth + 1, node)
+            return node
+
+        tree.root = build(0, n - 1, 0, tree.TNULL)
+        return tree
+
     def rotate_left(self, x):
         y = x.right
         x.right = y.left
-        if y.left != self.TNULL:
+        if y.left is not self.TNULL:
             y.left.parent = x
         y.parent = x.parent
-        if x.parent == self.TNULL: # Ahora esta condición funcionará siempre
+        if x.parent is self.TNULL: # Ahora esta condición funcionará siempre
             self.root = y
         elif x == x.parent.left:
             x.parent.left = y
@@ -32,10 +70,10 @@ class RedBlackTree:
     def rotate_right(self, x):
         y = x.left
         x.left = y.right
-        if y.right != self.TNULL:
+        if y.right is not self.TNULL:
             y.right.parent = x
         y.parent = x.parent
-        if x.parent == self.TNULL: # Y esta también
+        if x.parent is self.TNULL: # Y esta también
             self.root = y
         elif x == x.parent.right:
             x.parent.right = y
@@ -45,38 +83,38 @@ class RedBlackTree:
         x.parent = y
 
     def fix_insert(self, k):
-        while k.parent.color == "red":
+        while k.parent.color is RED:
             if k.parent == k.parent.parent.left:
                 u = k.parent.parent.right
-                if u.color == "red":
-                    u.color = "black"
-                    k.parent.color = "black"
-                    k.parent.parent.color = "red"
+                if u.color is RED:
+                    u.color = BLACK
+                    k.parent.color = BLACK
+                    k.parent.parent.color = RED
                     k = k.parent.parent
                 else:
                     if k == k.parent.right:
                         k = k.parent
                         self.rotate_left(k)
-                    k.parent.color = "black"
-                    k.parent.parent.color = "red"
+                    k.parent.color = BLACK
+                    k.parent.parent.color = RED
                     self.rotate_right(k.parent.parent)
             else:
                 u = k.parent.parent.left
-                if u.color == "red":
-                    u.color = "black"
-                    k.parent.color = "black"
-                    k.parent.parent.color = "red"
+                if u.color is RED:
+                    u.color = BLACK
+                    k.parent.color = BLACK
+                    k.parent.parent.color = RED
                     k = k.parent.parent
                 else:
                     if k == k.parent.left:
                         k = k.parent
                         self.rotate_right(k)
-                    k.parent.color = "black"
-                    k.parent.parent.color = "red"
+                    k.parent.color = BLACK
+                    k.parent.parent.color = RED
                     self.rotate_left(k.parent.parent)
             if k == self.root:
                 break
-        self.root.color = "black"
+        self.root.color = BLACK
 
     def insert(self, key):
         """
@@ -85,12 +123,12 @@ class RedBlackTree:
         node = RBNode(key)
         node.left = self.TNULL
         node.right = self.TNULL
-        node.color = "red" # Los nodos nuevos son rojos
+        node.color = RED # Los nodos nuevos son rojos
 
         y = self.TNULL
         x = self.root
 
-        while x != self.TNULL:
+        while x is not self.TNULL:
             y = x
             if node.key < x.key:
                 x = x.left
@@ -98,7 +136,7 @@ class RedBlackTree:
                 x = x.right
 
         node.parent = y
-        if y == self.TNULL:
+        if y is self.TNULL:
             self.root = node
         elif node.key < y.key:
             y.left = node
@@ -106,12 +144,12 @@ class RedBlackTree:
             y.right = node
 
         # Si el nuevo nodo es la raíz, simplemente lo coloreamos de negro.
-        if node.parent == self.TNULL:
-            node.color = "black"
+        if node.parent is self.TNULL:
+            node.color = BLACK
             return
 
         # Si el abuelo es TNULL, no hay posible violación de la propiedad rojo-rojo.
-        if node.parent.parent == self.TNULL:
+        if node.parent.parent is self.TNULL:
             return
 
         # Arregla el árbol si se violan las propiedades.
@@ -119,7 +157,7 @@ class RedBlackTree:
 
     def search(self, key):
         node = self.root
-        while node != self.TNULL:
+        while node is not self.TNULL:
             if key == node.key:
                 return True
             elif key < node.key:
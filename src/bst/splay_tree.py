@@ -0,0 +1,158 @@
+# src/bst/splay_tree.py
+
+class SplayNode:
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+
+class SplayTree:
+    """
+    Árbol splay (Sleator y Tarjan) con splay descendente: cada acceso sube el nodo
+    buscado (o el último visitado) a la raíz, adaptándose a la distribución real
+    de las consultas sin conocerla de antemano.
+    """
+    def __init__(self):
+        self.root = None
+        self.comparisons = 0  # Comparaciones de claves acumuladas
+
+    def _splay(self, key):
+        t = self.root
+        if t is None:
+            return
+        header = SplayNode(None)
+        left_max = right_min = header
+
+        # Al mirar un hijo por adelantado ya se compara su clave; si luego se
+        # baja a él sin rotar, no se vuelve a contar (un nodo visitado = una
+        # comparación, el mismo criterio que en los árboles estáticos).
+        ya_comparado = False
+        while True:
+            if not ya_comparado:
+                self.comparisons += 1
+            ya_comparado = False
+            if key < t.key:
+                if t.left is None:
+                    break
+                self.comparisons += 1
+                if key < t.left.key:  # Zig-zig: rotar a la derecha
+                    y = t.left
+                    t.left = y.right
+                    y.right = t
+                    t = y
+                    if t.left is None:
+                        break
+                else:
+                    ya_comparado = True
+                right_min.left = t  # Enlazar a la derecha
+                right_min = t
+                t = t.left
+            elif key > t.key:
+                if t.right is None:
+                    break
+                self.comparisons += 1
+                if key > t.right.key:  # Zig-zig: rotar a la izquierda
+                    y = t.right
+                    t.right = y.left
+                    y.left = t
+                    t = y
+                    if t.right is None:
+                        break
+                else:
+                    ya_comparado = True
+                left_max.right = t  # Enlazar a la izquierda
+                left_max = t
+                t = t.right
+            else:
+                break
+
+        # Reensamblar: los árboles izquierdo y derecho cuelgan de la nueva raíz.
+        left_max.right = t.left
+        right_min.left = t.right
+        t.left = header.right
+        t.right = header.left
+        self.root = t
+
+    def insert(self, key):
+        if self.root is None:
+            self.root = SplayNode(key)
+            return
+        self._splay(key)
+        if key == self.root.key:
+            return  # La clave ya existe
+        node = SplayNode(key)
+        if key < self.root.key:
+            node.left = self.root.left
+            node.right = self.root
+            self.root.left = None
+        else:
+            node.right = self.root.right
+            node.left = self.root
+            self.root.right = None
+        self.root = node
+
+    def search(self, key):
+        self._splay(key)
+        return self.root is not None and key == self.root.key
+
+class MoveToRootTree:
+    """
+    Variante "mover a la raíz" (Allen y Munro): el nodo accedido sube a la raíz
+    con rotaciones simples. Es más barata por acceso que el splay, pero sin su
+    garantía amortizada O(log n).
+    """
+    def __init__(self):
+        self.root = None
+        self.comparisons = 0  # Comparaciones de claves acumuladas
+
+    def _move_to_root(self, path):
+        # `path` va desde la raíz hasta el nodo a subir; se rota con su padre
+        # mientras haya uno.
+        node = path.pop()
+        while path:
+            parent = path.pop()
+            if parent.left is node:
+                parent.left = node.right
+                node.right = parent
+            else:
+                parent.right = node.left
+                node.left = parent
+            if path:
+                grandparent = path[-1]
+                if grandparent.left is parent:
+                    grandparent.left = node
+                else:
+                    grandparent.right = node
+        self.root = node
+
+    def insert(self, key):
+        path = []
+        node = self.root
+        while node:
+            path.append(node)
+            self.comparisons += 1
+            if key == node.key:
+                self._move_to_root(path)
+                return  # La clave ya existe
+            node = node.left if key < node.key else node.right
+        new_node = SplayNode(key)
+        if path:
+            parent = path[-1]
+            if key < parent.key:
+                parent.left = new_node
+            else:
+                parent.right = new_node
+        path.append(new_node)
+        self._move_to_root(path)
+
+    def search(self, key):
+        path = []
+        node = self.root
+        while node:
+            path.append(node)
+            self.comparisons += 1
+            if key == node.key:
+                self._move_to_root(path)
+                return True
+            node = node.left if key < node.key else node.right
+        return False
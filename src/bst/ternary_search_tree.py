@@ -0,0 +1,148 @@
+# src/bst/ternary_search_tree.py
+
+class TSTNode:
+    __slots__ = ('char', 'left', 'mid', 'right', 'is_end')
+
+    def __init__(self, char):
+        self.char = char
+        self.left = None  # Caracteres menores en la misma posición
+        self.mid = None  # Siguiente carácter de la clave
+        self.right = None  # Caracteres mayores en la misma posición
+        self.is_end = False  # Marca el final de una clave
+
+class TernarySearchTree:
+    """
+    Árbol ternario de búsqueda (Bentley y Sedgewick) para diccionarios de términos.
+
+    Cada nodo compara un solo carácter, en lugar de la cadena completa como en
+    un BST, y las claves con prefijo común comparten el camino, lo que permite
+    consultas por prefijo y autocompletado.
+    """
+    def __init__(self):
+        self.root = None
+        self.comparisons = 0  # Comparaciones de caracteres acumuladas
+        self._size = 0
+        self._has_empty = False  # La cadena vacía no tiene nodo propio
+
+    def __len__(self):
+        return self._size
+
+    def _find_node(self, key):
+        """
+        Devuelve (nodo del último carácter de `key` o None, nodos visitados).
+        """
+        node = self.root
+        i = 0
+        visited = 0
+        while node:
+            visited += 1
+            self.comparisons += 1
+            c = key[i]
+            if c < node.char:
+                node = node.left
+            elif c > node.char:
+                node = node.right
+            elif i == len(key) - 1:
+                return node, visited
+            else:
+                i += 1
+                node = node.mid
+        return None, visited
+
+    def insert(self, key):
+        """
+        Inserta una clave sin recursión. Las claves repetidas se ignoran.
+        """
+        if not key:
+            if not self._has_empty:
+                self._has_empty = True
+                self._size += 1
+            return
+        if self.root is None:
+            self.root = TSTNode(key[0])
+        node = self.root
+        i = 0
+        while True:
+            c = key[i]
+            if c < node.char:
+                if node.left is None:
+                    node.left = TSTNode(c)
+                node = node.left
+            elif c > node.char:
+                if node.right is None:
+                    node.right = TSTNode(c)
+                node = node.right
+            elif i == len(key) - 1:
+                break
+            else:
+                i += 1
+                if node.mid is None:
+                    node.mid = TSTNode(key[i])
+                node = node.mid
+        if not node.is_end:
+            node.is_end = True
+            self._size += 1
+
+    def search(self, key):
+        return self.search_depth(key)[0]
+
+    def search_depth(self, key):
+        """
+        :return: Tupla (found, depth) como `search_tree`, donde `depth` es el
+                 número de nodos (comparaciones de caracteres) visitados.
+        """
+        if not key:
+            return (True, 0) if self._has_empty else (False, -1)
+        node, visited = self._find_node(key)
+        if node is not None and node.is_end:
+            return True, visited
+        return False, -1
+
+    def starts_with(self, prefix):
+        """
+        Indica si alguna clave del árbol empieza por `prefix`.
+        """
+        if not prefix:
+            return self._size > 0
+        return self._find_node(prefix)[0] is not None
+
+    def autocomplete(self, prefix, limit=None):
+        """
+        Devuelve en orden las claves que empiezan por `prefix` (como mucho `limit`).
+        """
+        results = []
+        if limit is not None and limit <= 0:
+            return results
+        if not prefix:
+            if self._has_empty:
+                results.append('')
+            start = self.root
+        else:
+            node, _ = self._find_node(prefix)
+            if node is None:
+                return results
+            if node.is_end:
+                results.append(prefix)
+            start = node.mid
+
+        # Recorrido inorden iterativo: izquierda, el propio carácter (y su
+        # subárbol central) y derecha. Cada entrada de la pila guarda el
+        # prefijo acumulado antes del nodo.
+        stack = [(start, prefix, False)] if start else []
+        while stack:
+            node, acc, expanded = stack.pop()
+            if limit is not None and len(results) >= limit:
+                break
+            if expanded:
+                word = acc + node.char
+                if node.is_end:
+                    results.append(word)
+                continue
+            if node.right:
+                stack.append((node.right, acc, False))
+            if node.mid:
+                stack.append((node.mid, acc + node.char, False))
+            stack.append((node, acc, True))
+            if node.left:
+                stack.append((node.left, acc, False))
+        return results[:limit] if limit is not None else results
@@ -2,11 +2,14 @@
 
 import time
 import random
+import tracemalloc
 from ..bst.avl_tree import AVLTree
 from ..bst.red_black_tree import RedBlackTree
-from ..utils.search_engine import search_tree
+from ..bst.ternary_search_tree import TernarySearchTree
+from ..utils.search_engine import search_tree, search_many, costo_esperado_arbol
 from ..obst.obst import optimal_bst
 from ..utils.probability_calculator import obtener_probabilidades_de_documento
+from ..utils.corpus_cache import CorpusCache
 
 # --- CONFIGURACIÓN DEL BENCHMARK ---
 # 1. Cambia esta ruta al archivo PDF que quieras analizar.
@@ -22,9 +25,61 @@ TOP_N_TERMINOS = 5000
 # 3. Define qué porcentaje de la probabilidad total corresponde a búsquedas exitosas.
 #    Por ejemplo, 0.90 significa que el 90% de las búsquedas encontrarán una clave.
 PROBABILIDAD_EXITO_TOTAL = 0.90
+
+# 4. Número de consultas (muestreadas según p) para comparar la búsqueda clave a
+#    clave con la búsqueda por lotes `search_many`.
+NUM_CONSULTAS_LOTE = 1000000
 # --- FIN DE LA CONFIGURACIÓN ---
 
 
+def medir_memoria_e_insercion(clase_arbol, claves):
+    """
+    Mide la memoria por nodo y el rendimiento de inserción de un tipo de árbol.
+
+    La memoria se mide con `tracemalloc` en una construcción aparte, porque el
+    rastreo de memoria ralentiza la inserción y falsearía el tiempo.
+
+    :return: Tupla (bytes por nodo, inserciones por segundo)
+    """
+    tracemalloc.start()
+    arbol = clase_arbol()
+    base, _ = tracemalloc.get_traced_memory()
+    for clave in claves:
+        arbol.insert(clave)
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    bytes_por_nodo = (actual - base) / len(claves) if claves else 0.0
+
+    arbol = clase_arbol()
+    start_time = time.time()
+    for clave in claves:
+        arbol.insert(clave)
+    tiempo = time.time() - start_time
+    inserciones_por_segundo = len(claves) / tiempo if tiempo > 0 else float('inf')
+
+    return bytes_por_nodo, inserciones_por_segundo
+
+
+def comparaciones_de_caracteres_bst(root, clave, centinela=None):
+    """
+    Cuenta los caracteres comparados al buscar `clave` en un BST: en cada nodo,
+    comparar dos cadenas cuesta la longitud de su prefijo común más uno.
+    """
+    total = 0
+    node = root
+    while node is not None and node is not centinela:
+        otra = node.key
+        comunes = 0
+        limite = min(len(clave), len(otra))
+        while comunes < limite and clave[comunes] == otra[comunes]:
+            comunes += 1
+        total += comunes + 1
+        if clave == otra:
+            break
+        node = node.left if clave < otra else node.right
+    return total
+
+
 def ejecutar_benchmark_con_datos_reales():
     """
     Ejecuta el benchmark completo usando datos extraídos de un documento PDF.
@@ -41,7 +96,8 @@ def ejecutar_benchmark_con_datos_reales():
         claves, p, q = obtener_probabilidades_de_documento(
             RUTA_PDF, 
             top_n=TOP_N_TERMINOS, 
-            prob_exito_total=PROBABILIDAD_EXITO_TOTAL
+            prob_exito_total=PROBABILIDAD_EXITO_TOTAL,
+            cache=CorpusCache()  # Las ejecuciones repetidas no vuelven a leer el PDF
         )
     except FileNotFoundError:
         print(f"\n❌ ERROR CRÍTICO: No se pudo encontrar el archivo PDF en la ruta especificada.")
@@ -86,27 +142,63 @@ def ejecutar_benchmark_con_datos_reales():
     tiempo_rb = time.time() - start_time
     print(f"   - Red-Black (Inserción): {tiempo_rb:.6f}s")
 
+    # Árbol ternario (Inserción)
+    tst = TernarySearchTree()
+    start_time = time.time()
+    for clave in claves_aleatorias:
+        tst.insert(clave)
+    tiempo_tst = time.time() - start_time
+    print(f"   - Ternario (Inserción):  {tiempo_tst:.6f}s")
+
+    # Construcción en bloque a partir de las claves ya ordenadas (línea base rápida)
+    start_time = time.time()
+    AVLTree.from_sorted(claves)
+    print(f"   - AVL (from_sorted):       {time.time() - start_time:.6f}s")
+    start_time = time.time()
+    RedBlackTree.from_sorted(claves)
+    print(f"   - Red-Black (from_sorted): {time.time() - start_time:.6f}s")
+
+    # Memoria por nodo y rendimiento de inserción
+    for nombre, clase in (("AVL", AVLTree), ("Red-Black", RedBlackTree)):
+        bytes_por_nodo, inserciones = medir_memoria_e_insercion(clase, claves_aleatorias)
+        print(f"   - {nombre + ':':<22} {bytes_por_nodo:.1f} bytes/nodo, {inserciones:,.0f} inserciones/s")
+
     # --- 3. Costos de Búsqueda ---
     print("\n[Paso 3/3] Calculando costos de búsqueda esperados...")
     
     # Costo teórico del OBST (el óptimo)
     print(f"   - OBST Costo Teórico:      {costo_obst_teorico:.6f}")
     
-    # Costo real del AVL
-    costo_avl_real = 0
-    for i, clave in enumerate(claves):
-        found, depth = search_tree(avl_tree.root, clave)
-        if found:
-            costo_avl_real += depth * p[i]
+    # Costo real del AVL y del Red-Black, incluyendo las búsquedas fallidas (q)
+    # para que la comparación con el costo del OBST sea equivalente.
+    costo_avl_real = costo_esperado_arbol(avl_tree.root, p, q)
     print(f"   - AVL Costo Real:          {costo_avl_real:.6f}")
     
-    # Costo real del Red-Black
-    costo_rb_real = 0
-    for i, clave in enumerate(claves):
-        found, depth = search_tree(rb_tree.root, clave)
-        if found:
-            costo_rb_real += depth * p[i]
+    costo_rb_real = costo_esperado_arbol(rb_tree.root, p, q, centinela=rb_tree.TNULL)
     print(f"   - Red-Black Costo Real:    {costo_rb_real:.6f}")
+
+    # Caracteres comparados por búsqueda exitosa, ponderados por p: en el árbol
+    # ternario cada nodo visitado compara un único carácter.
+    suma_p = sum(p)
+    caracteres_avl = sum(pi * comparaciones_de_caracteres_bst(avl_tree.root, clave)
+                         for clave, pi in zip(claves, p)) / suma_p
+    caracteres_rb = sum(pi * comparaciones_de_caracteres_bst(rb_tree.root, clave, rb_tree.TNULL)
+                        for clave, pi in zip(claves, p)) / suma_p
+    caracteres_tst = sum(pi * tst.search_depth(clave)[1] for clave, pi in zip(claves, p)) / suma_p
+    print(f"   - Caracteres comparados por búsqueda: AVL {caracteres_avl:.2f} | "
+          f"Red-Black {caracteres_rb:.2f} | Ternario {caracteres_tst:.2f}")
+
+    # Búsqueda por lotes frente al bucle clave a clave, con consultas ordenadas
+    consultas = sorted(random.choices(claves, weights=p, k=NUM_CONSULTAS_LOTE))
+    start_time = time.time()
+    for consulta in consultas:
+        search_tree(avl_tree.root, consulta)
+    tiempo_bucle = time.time() - start_time
+    start_time = time.time()
+    search_many(avl_tree.root, consultas)
+    tiempo_lote = time.time() - start_time
+    print(f"\n   - {NUM_CONSULTAS_LOTE:,} búsquedas en el AVL: clave a clave {tiempo_bucle:.3f}s | "
+          f"search_many {tiempo_lote:.3f}s ({tiempo_bucle / tiempo_lote:.1f}x)")
     print("\n" + "="*60)
     print("✅ Benchmark Finalizado.")
     print("="*60)
@@ -0,0 +1,114 @@
+# src/experiments/multiway_benchmarks.py
+
+import time
+import random
+from ..obst.obst import optimal_bst, reconstruir_arbol
+from ..obst.multiway_obst import (
+    optimal_multiway_bst, reconstruir_multiway, aplanar_multiway, buscar_multiway
+)
+from ..utils.search_engine import search_tree, costo_esperado_arbol
+
+# --- CONFIGURACIÓN DEL BENCHMARK ---
+# 1. Número de claves sintéticas (la programación dinámica es O(k·n³)).
+NUM_CLAVES = 200
+
+# 2. Aridades a comparar contra el OBST binario.
+ARIDADES = [3, 4, 8, 16]
+
+# 3. Número de búsquedas muestreadas según p y q para medir el tiempo.
+NUM_BUSQUEDAS = 100000
+
+# 4. Probabilidad total de búsqueda exitosa.
+PROBABILIDAD_EXITO_TOTAL = 0.90
+# --- FIN DE LA CONFIGURACIÓN ---
+
+
+def generar_datos_zipf(n, prob_exito_total, semilla=42):
+    """
+    Genera claves ordenadas con probabilidades tipo Zipf (como las frecuencias de
+    palabras de un documento) repartidas en orden aleatorio.
+    """
+    rng = random.Random(semilla)
+    claves = [f"t{i:06d}" for i in range(n)]
+    rangos = list(range(1, 2 * n + 2))
+    rng.shuffle(rangos)
+    pesos = [1.0 / r for r in rangos]
+    total_p = sum(pesos[:n])
+    total_q = sum(pesos[n:])
+    p = [w / total_p * prob_exito_total for w in pesos[:n]]
+    q = [w / total_q * (1 - prob_exito_total) for w in pesos[n:]]
+    return claves, p, q
+
+
+def muestrear_busquedas(claves, p, q, cantidad, semilla=7):
+    """
+    Muestrea consultas según p (claves existentes) y q (valores entre claves).
+    Un fallo en el hueco i se representa con claves[i-1] + '~', que queda entre
+    k_i y k_{i+1}; el hueco 0 se representa con la cadena vacía.
+    """
+    rng = random.Random(semilla)
+    n = len(claves)
+    eventos = list(range(2 * n + 1))
+    pesos = p + q
+    consultas = []
+    for e in rng.choices(eventos, weights=pesos, k=cantidad):
+        if e < n:
+            consultas.append(claves[e])
+        else:
+            hueco = e - n
+            consultas.append(claves[hueco - 1] + '~' if hueco > 0 else '')
+    return consultas
+
+
+def ejecutar_benchmark_multiway():
+    """
+    Compara las visitas a nodos esperadas y el tiempo de búsqueda del OBST
+    binario frente a árboles multivía óptimos de distintas aridades.
+    """
+    print("="*60)
+    print(f"🚀 Benchmark de árboles multivía óptimos ({NUM_CLAVES} claves)")
+    print("="*60)
+
+    claves, p, q = generar_datos_zipf(NUM_CLAVES, PROBABILIDAD_EXITO_TOTAL)
+    consultas = muestrear_busquedas(claves, p, q, NUM_BUSQUEDAS)
+    suma_q = sum(q)
+
+    # OBST binario de referencia. El costo cuenta la hoja ficticia como una
+    # visita más, así que las visitas reales a nodos son costo - sum(q).
+    start_time = time.time()
+    _, root_table = optimal_bst(claves, p, q)
+    raiz_binaria = reconstruir_arbol(root_table, claves, 1, len(claves))
+    tiempo_construccion = time.time() - start_time
+    visitas_binario = costo_esperado_arbol(raiz_binaria, p, q) - suma_q
+
+    start_time = time.time()
+    for consulta in consultas:
+        search_tree(raiz_binaria, consulta)
+    tiempo_binario = time.time() - start_time
+
+    print(f"\n   - OBST binario:  visitas esperadas {visitas_binario:.4f} | "
+          f"construcción {tiempo_construccion:.3f}s | búsquedas {tiempo_binario:.3f}s")
+
+    for k in ARIDADES:
+        start_time = time.time()
+        costo, tablas = optimal_multiway_bst(claves, p, q, k)
+        plano = aplanar_multiway(reconstruir_multiway(tablas, claves, k))
+        tiempo_construccion = time.time() - start_time
+
+        start_time = time.time()
+        for consulta in consultas:
+            buscar_multiway(plano, consulta)
+        tiempo_busqueda = time.time() - start_time
+
+        visitas = costo - suma_q
+        print(f"   - Multivía k={k:<3} visitas esperadas {visitas:.4f} "
+              f"({visitas / visitas_binario:.0%} del binario) | "
+              f"construcción {tiempo_construccion:.3f}s | búsquedas {tiempo_busqueda:.3f}s")
+
+    print("\n" + "="*60)
+    print("✅ Benchmark Finalizado.")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark_multiway()
@@ -0,0 +1,156 @@
+# src/experiments/replay.py
+
+import time
+import random
+from ..bst.avl_tree import AVLTree
+from ..bst.red_black_tree import RedBlackTree
+from ..bst.splay_tree import SplayTree, MoveToRootTree
+from ..obst.obst import optimal_bst, reconstruir_arbol
+from ..utils.search_engine import search_tree
+from .multiway_benchmarks import generar_datos_zipf, muestrear_busquedas
+
+# --- CONFIGURACIÓN DEL BENCHMARK ---
+# 1. Número de claves sintéticas y de consultas a reproducir.
+NUM_CLAVES = 500
+NUM_CONSULTAS = 200000
+
+# 2. Para la carga con localidad: tamaño del conjunto de trabajo y cuántas
+#    consultas seguidas se hacen sobre él antes de cambiar a otro.
+TAM_CONJUNTO_TRABAJO = 8
+CONSULTAS_POR_RAFAGA = 2000
+
+# 3. Ruta opcional a un registro real de consultas (una por línea).
+RUTA_REGISTRO = None
+
+PROBABILIDAD_EXITO_TOTAL = 0.90
+# --- FIN DE LA CONFIGURACIÓN ---
+
+
+def cargar_consultas(ruta):
+    """
+    Carga una secuencia de consultas grabada, una clave por línea.
+    """
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        return [linea.rstrip('\n') for linea in archivo if linea.strip()]
+
+
+def muestrear_consultas_en_rafagas(claves, cantidad, tam_conjunto, por_rafaga, semilla=13):
+    """
+    Genera consultas con localidad temporal: ráfagas sobre un pequeño conjunto
+    de trabajo que cambia cada `por_rafaga` consultas. Es el caso en que una
+    estructura adaptativa puede superar a un OBST estático.
+    """
+    rng = random.Random(semilla)
+    consultas = []
+    while len(consultas) < cantidad:
+        conjunto = rng.sample(claves, min(tam_conjunto, len(claves)))
+        consultas.extend(rng.choice(conjunto) for _ in range(min(por_rafaga, cantidad - len(consultas))))
+    return consultas
+
+
+def _contar_comparaciones(root, key, centinela=None):
+    """
+    Cuenta los nodos visitados al buscar `key` en un árbol estático, tanto si la
+    clave está como si no (mismo criterio que `SplayTree.comparisons`).
+    """
+    comparaciones = 0
+    node = root
+    while node is not None and node is not centinela:
+        comparaciones += 1
+        if key == node.key:
+            break
+        node = node.left if key < node.key else node.right
+    return comparaciones
+
+
+def reproducir_consultas(consultas, claves, p, q):
+    """
+    Reproduce la misma secuencia de consultas sobre cada estructura y mide el
+    total de comparaciones y el tiempo de pared.
+
+    :param consultas: Secuencia de claves a buscar (pueden no existir)
+    :param claves: Claves ordenadas con las que se construyen las estructuras
+    :param p: Probabilidades de búsqueda usadas para construir el OBST
+    :param q: Probabilidades de fallo usadas para construir el OBST
+    :return: Diccionario nombre -> {"comparaciones": int, "tiempo": float}
+    """
+    _, root_table = optimal_bst(claves, p, q)
+    raiz_obst = reconstruir_arbol(root_table, claves, 1, len(claves))
+
+    claves_aleatorias = list(claves)
+    random.Random(1).shuffle(claves_aleatorias)
+    avl_tree, rb_tree = AVLTree(), RedBlackTree()
+    for clave in claves_aleatorias:
+        avl_tree.insert(clave)
+        rb_tree.insert(clave)
+
+    resultados = {}
+
+    # Estructuras estáticas: las comparaciones se cuentan recorriendo el camino
+    # y el tiempo se mide aparte, con la búsqueda normal sin instrumentar.
+    estaticas = [
+        ("OBST", raiz_obst, None, lambda clave: search_tree(raiz_obst, clave)),
+        ("AVL", avl_tree.root, None, avl_tree.search),
+        ("Red-Black", rb_tree.root, rb_tree.TNULL, rb_tree.search),
+    ]
+    for nombre, raiz, centinela, buscar in estaticas:
+        comparaciones = sum(_contar_comparaciones(raiz, clave, centinela) for clave in consultas)
+        start_time = time.time()
+        for clave in consultas:
+            buscar(clave)
+        resultados[nombre] = {"comparaciones": comparaciones, "tiempo": time.time() - start_time}
+
+    # Estructuras adaptativas: cuentan sus propias comparaciones (incluida la
+    # reestructuración), que dependen del orden de las consultas.
+    for nombre, clase in (("Splay", SplayTree), ("Move-to-root", MoveToRootTree)):
+        arbol = clase()
+        for clave in claves_aleatorias:
+            arbol.insert(clave)
+        arbol.comparisons = 0
+        start_time = time.time()
+        for clave in consultas:
+            arbol.search(clave)
+        resultados[nombre] = {"comparaciones": arbol.comparisons, "tiempo": time.time() - start_time}
+
+    return resultados
+
+
+def _imprimir_resultados(titulo, resultados, num_consultas):
+    print(f"\n   {titulo}")
+    for nombre, datos in sorted(resultados.items(), key=lambda par: par[1]["comparaciones"]):
+        promedio = datos["comparaciones"] / num_consultas if num_consultas else 0.0
+        print(f"   - {nombre:<13} {promedio:8.3f} comparaciones/consulta | {datos['tiempo']:.3f}s")
+
+
+def ejecutar_replay():
+    """
+    Compara el OBST estático con AVL, Red-Black y las estructuras adaptativas
+    sobre consultas estacionarias (muestreadas de p y q), con localidad y,
+    opcionalmente, sobre un registro real.
+    """
+    print("="*60)
+    print(f"🚀 Reproducción de consultas ({NUM_CLAVES} claves, {NUM_CONSULTAS} consultas)")
+    print("="*60)
+
+    claves, p, q = generar_datos_zipf(NUM_CLAVES, PROBABILIDAD_EXITO_TOTAL)
+
+    consultas = muestrear_busquedas(claves, p, q, NUM_CONSULTAS)
+    _imprimir_resultados("Carga estacionaria (según p y q):",
+                         reproducir_consultas(consultas, claves, p, q), len(consultas))
+
+    consultas = muestrear_consultas_en_rafagas(claves, NUM_CONSULTAS, TAM_CONJUNTO_TRABAJO, CONSULTAS_POR_RAFAGA)
+    _imprimir_resultados("Carga con localidad (ráfagas):",
+                         reproducir_consultas(consultas, claves, p, q), len(consultas))
+
+    if RUTA_REGISTRO:
+        consultas = cargar_consultas(RUTA_REGISTRO)
+        _imprimir_resultados(f"Registro real ({RUTA_REGISTRO}):",
+                             reproducir_consultas(consultas, claves, p, q), len(consultas))
+
+    print("\n" + "="*60)
+    print("✅ Reproducción Finalizada.")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    ejecutar_replay()
@@ -1,48 +1,95 @@
 # src/integration/api.py
 
 import os
-from ..projects_management.project_manager import cargar_proyectos
-from ..obst.obst import optimal_bst, reconstruir_arbol
-from ..lcs_detector.lcs_weighted import lcs_weighted
-from ..lcs_detector.comparator import CodeComparator 
-from ..utils.probability_calculator import obtener_probabilidades_de_documento
-from ..obst.tree_utils import dibujar_arbol
+import threading
+from ..projects_management.project_registry import RegistroProyectos
+
+# Los módulos de análisis (OBST, LCS, PDF/NLTK, Graphviz) se importan dentro de
+# cada función de la API: así listar o registrar proyectos arranca al instante.
+
+# Límite de nodos a dibujar: con miles de términos la imagen completa es ilegible
+# y tarda demasiado, así que se dibuja el subárbol más probable.
+MAX_NODOS_DIBUJO = 127
+
+# Árbol adaptativo de cada proyecto analizado: aprende de las búsquedas reales.
+_indices_adaptativos = {}
+
+# Registro de proyectos compartido (se abre en la primera llamada; la primera
+# vez importa los proyectos de data/proyectos.json). Todos los hilos usan la
+# misma conexión; sus transacciones se serializan con el candado de la conexión.
+_registro = None
+_lock_registro = threading.Lock()
+
+def _obtener_registro():
+    global _registro
+    with _lock_registro:
+        if _registro is None:
+            _registro = RegistroProyectos()
+        return _registro
 
 # --- API de Gestión de Proyectos ---
 
 def registrar_proyecto_api(nombre, ruta_codigo, ruta_documento):
-    from ..projects_management.project_manager import registrar_proyecto
-    registrar_proyecto(nombre, ruta_codigo, ruta_documento)
-    return {"status": "success", "message": f"Proyecto '{nombre}' registrado exitosamente."}
+    nuevo = _obtener_registro().guardar(nombre, ruta_codigo, ruta_documento)
+    accion = "registrado" if nuevo else "actualizado"
+    return {"status": "success", "message": f"Proyecto '{nombre}' {accion} exitosamente."}
 
 def listar_proyectos_api():
-    proyectos = cargar_proyectos()
+    proyectos = _obtener_registro().listar()
     proyectos_listados = [{"nombre": p.nombre, "ruta_codigo": p.ruta_codigo, "ruta_documento": p.ruta_documento} for p in proyectos]
     return {"status": "success", "proyectos": proyectos_listados}
 
 def eliminar_proyecto_api(nombre):
-    from ..projects_management.project_manager import eliminar_proyecto
-    # La función original imprime, la API debe devolver el estado.
-    proyectos_antes = len(cargar_proyectos())
-    eliminar_proyecto(nombre)
-    proyectos_despues = len(cargar_proyectos())
-    
-    if proyectos_antes == proyectos_despues:
+    if not _obtener_registro().eliminar(nombre):
         return {"status": "error", "message": f"El proyecto '{nombre}' no se encontró."}
+    _indices_adaptativos.pop(nombre, None)
     return {"status": "success", "message": f"Proyecto '{nombre}' eliminado exitosamente."}
 
+def indexar_codigo_api(proyecto_nombre):
+    """
+    Actualiza el índice incremental del código del proyecto y devuelve qué
+    archivos cambiaron desde la indexación anterior.
+    """
+    from ..projects_management.code_index import IndiceCodigo
+
+    proyecto = _obtener_registro().obtener(proyecto_nombre)
+    if not proyecto:
+        return {"status": "error", "message": "Proyecto no encontrado"}
+    if not os.path.isdir(proyecto.ruta_codigo):
+        return {"status": "error", "message": f"La carpeta '{proyecto.ruta_codigo}' no existe."}
+    with IndiceCodigo() as indice:
+        cambios = indice.indexar(proyecto.nombre, proyecto.ruta_codigo)
+    return {
+        "status": "success",
+        "generacion": cambios.generacion,
+        "agregados": cambios.agregados,
+        "modificados": cambios.modificados,
+        "eliminados": cambios.eliminados
+    }
+
 # --- API de Análisis (Modificada y Extendida) ---
 
-def analizar_documentacion_api(proyecto_nombre):
+def analizar_documentacion_api(proyecto_nombre, al_terminar=None):
     """
     Analiza la documentación de un proyecto usando OBST con términos dinámicos.
+
+    :param al_terminar: Función opcional que recibe la ruta del PNG del árbol (o
+                        None si no se pudo dibujar). Se llama desde el hilo de
+                        dibujo, así que una interfaz gráfica debe pasar el
+                        resultado a su propio hilo antes de usarlo.
     """
-    proyecto = next((p for p in cargar_proyectos() if p.nombre == proyecto_nombre), None)
+    from ..obst.obst import optimal_bst, reconstruir_arbol
+    from ..obst.tree_utils import dibujar_arbol_async
+    from ..utils.probability_calculator import obtener_probabilidades_de_documento
+    from ..utils.corpus_cache import CorpusCache
+    from ..utils.query_log import OBSTAdaptativo
+
+    proyecto = _obtener_registro().obtener(proyecto_nombre)
     if not proyecto:
         return {"status": "error", "message": "Proyecto no encontrado"}
 
     # Ahora usamos la generación dinámica de términos y probabilidades.
-    terminos, p, q = obtener_probabilidades_de_documento(proyecto.ruta_documento)
+    terminos, p, q = obtener_probabilidades_de_documento(proyecto.ruta_documento, cache=CorpusCache())
 
     if not terminos:
         return {"status": "error", "message": "No se pudieron extraer términos clave del documento."}
@@ -53,15 +100,30 @@ def analizar_documentacion_api(proyecto_nombre):
     print("Reconstruyendo el árbol para visualización...")
     n = len(terminos)
     arbol_reconstruido_root = reconstruir_arbol(root_table, terminos, 1, n)
+    _indices_adaptativos[proyecto.nombre] = OBSTAdaptativo(
+        terminos, p, q, arbol_inicial=(arbol_reconstruido_root, costo)
+    )
 
-    # 3. Dibujar el árbol reconstruido
+    # 3. Dibujar el árbol reconstruido en segundo plano (no bloquea la respuesta)
     if arbol_reconstruido_root:
         print("Iniciando la visualización del árbol...")
         # El nombre del archivo puede ser dinámico para no sobreescribir
         nombre_archivo_arbol = f"obst_{proyecto_nombre}" 
-        dibujar_arbol(arbol_reconstruido_root, filename=nombre_archivo_arbol)
+        render_arbol = dibujar_arbol_async(
+            arbol_reconstruido_root,
+            filename=nombre_archivo_arbol,
+            max_nodos=MAX_NODOS_DIBUJO,
+            probabilidades=dict(zip(terminos, p))
+        )
+        if al_terminar is not None:
+            # Un fallo del dibujo ya lo registra dibujar_arbol_async; aquí se avisa con None.
+            render_arbol.add_done_callback(
+                lambda futuro: al_terminar(None if futuro.cancelled() or futuro.exception() else futuro.result())
+            )
     else:
         print("No se pudo reconstruir el árbol para dibujarlo.")
+        if al_terminar is not None:
+            al_terminar(None)
 
     return {
         "status": "success",
@@ -71,6 +133,23 @@ def analizar_documentacion_api(proyecto_nombre):
     }
 
 
+def buscar_termino_api(proyecto_nombre, termino):
+    """
+    Busca un término en el OBST del proyecto (ya analizado con
+    `analizar_documentacion_api`). Cada búsqueda, exitosa o no, se registra y el
+    árbol se reconstruye en segundo plano cuando las consultas reales se alejan
+    de las probabilidades con las que se construyó.
+    """
+    indice = _indices_adaptativos.get(proyecto_nombre)
+    if indice is None:
+        return {"status": "error", "message": "El proyecto no ha sido analizado todavía."}
+    encontrado, profundidad = indice.buscar(termino.lower())
+    return {
+        "status": "success",
+        "encontrado": encontrado,
+        "profundidad": profundidad,
+        "reconstrucciones": indice.reconstrucciones
+    }
 
 def comparar_archivos_codigo_api(ruta_archivo1: str, ruta_archivo2: str, custom_weights: dict = None):
     """
@@ -83,6 +162,8 @@ def comparar_archivos_codigo_api(ruta_archivo1: str, ruta_archivo2: str, custom_
                                           sobrescribir los pesos por defecto en esta
                                           comparación específica.
     """
+    from ..lcs_detector.comparator import CodeComparator
+
     if not os.path.exists(ruta_archivo1) or not os.path.exists(ruta_archivo2):
         return {"status": "error", "message": "Uno o ambos archivos no existen."}
 
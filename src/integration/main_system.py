@@ -1,6 +1,7 @@
 # src/integration/main_system.py
 
 import os
+import queue
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from .api import (
@@ -237,14 +238,29 @@ class ProjectAnalysisFrame(tk.Frame):
             messagebox.showwarning("Advertencia", "No hay proyectos para analizar.")
             return
         
-        response = analizar_documentacion_api(nombre_proyecto)
+        # El árbol se dibuja en un hilo de fondo; la ruta del PNG llega por una
+        # cola y se abre desde el hilo de Tk, que es el único que toca la interfaz.
+        imagen_lista = queue.Queue()
+        response = analizar_documentacion_api(nombre_proyecto, al_terminar=imagen_lista.put)
         if response['status'] == 'success':
+            self._esperar_imagen(imagen_lista)
             terminos_str = ', '.join(response['terminos_analizados']) if response['terminos_analizados'] else "Ninguno"
             message = f"Análisis OBST completado para '{response['proyecto']}'.\n\nCosto Óptimo: {response['costo_obst']:.4f}\nTérminos ({len(response['terminos_analizados'])}): {terminos_str}"
             messagebox.showinfo("Resultado Análisis OBST", message)
         else:
             messagebox.showerror("Error de Análisis", response['message'])
 
+    def _esperar_imagen(self, imagen_lista):
+        """Revisa cada 200 ms si el dibujo del árbol terminó y, si es así, lo abre."""
+        try:
+            ruta_png = imagen_lista.get_nowait()
+        except queue.Empty:
+            self.after(200, self._esperar_imagen, imagen_lista)
+            return
+        if ruta_png:
+            from ..obst.tree_utils import abrir_imagen
+            abrir_imagen(ruta_png)
+
     def run_lcs(self):
         nombre_proyecto = self.project_combo.get()
         if not nombre_proyecto:
@@ -0,0 +1,275 @@
+# src/integration/watch.py
+import argparse
+import os
+import time
+
+from ..lcs_detector.lcs_weighted import lcs_weighted
+from ..projects_management.code_index import IndiceCodigo, instantanea_de_carpeta, CODE_INDEX_DB_PATH
+from ..projects_management.project_registry import RegistroProyectos
+from ..utils.sqlite_wal import conectar, Lectura, Transaccion
+
+# Ruta de la base de datos con los resultados de similitud
+RESULTADOS_DB_PATH = 'data/similitudes.db'
+
+# Segundos entre dos sondeos de las carpetas de código.
+INTERVALO_SONDEO = 2.0
+
+# Segundos sin cambios que se esperan antes de recalcular (una entrega suele
+# escribir varios archivos seguidos; así se recalcula una sola vez).
+ESPERA_ESTABLE = 1.0
+
+# Umbral a partir del cual un par se informa como sospechoso.
+UMBRAL_SIMILITUD = 0.8
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS similitudes (
+    proyecto1 TEXT NOT NULL,
+    ruta1 TEXT NOT NULL,
+    proyecto2 TEXT NOT NULL,
+    ruta2 TEXT NOT NULL,
+    score REAL NOT NULL,
+    actualizado REAL NOT NULL,
+    PRIMARY KEY (proyecto1, ruta1, proyecto2, ruta2)
+);
+CREATE INDEX IF NOT EXISTS similitudes_por_segundo ON similitudes (proyecto2, ruta2);
+CREATE INDEX IF NOT EXISTS similitudes_por_score ON similitudes (score);
+CREATE TABLE IF NOT EXISTS procesado (
+    proyecto TEXT PRIMARY KEY,
+    generacion INTEGER NOT NULL
+);
+"""
+
+
+class TablaSimilitudes:
+    """
+    Tabla persistente de scores entre pares de archivos de proyectos distintos.
+
+    Cada par se guarda una sola vez con sus extremos en orden (proyecto, ruta).
+    Además se recuerda hasta qué generación del índice de código se procesó
+    cada proyecto, de modo que tras un reinicio solo se recalcula lo pendiente.
+    """
+    def __init__(self, ruta_db=RESULTADOS_DB_PATH):
+        self._conexion = conectar(ruta_db)
+        self._conexion.executescript(_ESQUEMA)
+
+    def generacion_procesada(self, proyecto):
+        with Lectura(self._conexion) as conexion:
+            fila = conexion.execute(
+                "SELECT generacion FROM procesado WHERE proyecto = ?", (proyecto,)
+            ).fetchone()
+        return fila[0] if fila else 0
+
+    def actualizar(self, scores, archivos_eliminados, proyectos_eliminados, generaciones):
+        """
+        Aplica en una sola transacción los scores recalculados, borra los pares
+        de archivos o proyectos que ya no existen y registra las generaciones
+        procesadas.
+
+        :param scores: Lista de ((proyecto, ruta), (proyecto, ruta), score)
+        :param archivos_eliminados: Lista de (proyecto, ruta)
+        :param proyectos_eliminados: Nombres de proyectos que ya no están registrados
+        :param generaciones: Diccionario proyecto -> generación procesada
+        """
+        ahora = time.time()
+        with Transaccion(self._conexion) as cursor:
+            cursor.executemany(
+                "INSERT OR REPLACE INTO similitudes "
+                "(proyecto1, ruta1, proyecto2, ruta2, score, actualizado) VALUES (?, ?, ?, ?, ?, ?)",
+                [a + b + (score, ahora) for a, b, score in scores]
+            )
+            for proyecto, ruta in archivos_eliminados:
+                cursor.execute("DELETE FROM similitudes WHERE proyecto1 = ? AND ruta1 = ?", (proyecto, ruta))
+                cursor.execute("DELETE FROM similitudes WHERE proyecto2 = ? AND ruta2 = ?", (proyecto, ruta))
+            for proyecto in proyectos_eliminados:
+                cursor.execute("DELETE FROM similitudes WHERE proyecto1 = ? OR proyecto2 = ?", (proyecto, proyecto))
+                cursor.execute("DELETE FROM procesado WHERE proyecto = ?", (proyecto,))
+            cursor.executemany(
+                "INSERT OR REPLACE INTO procesado (proyecto, generacion) VALUES (?, ?)",
+                list(generaciones.items())
+            )
+
+    def proyectos_procesados(self):
+        with Lectura(self._conexion) as conexion:
+            return [fila[0] for fila in conexion.execute("SELECT proyecto FROM procesado")]
+
+    def score(self, archivo1, archivo2):
+        """
+        :return: Score guardado del par ((proyecto, ruta), (proyecto, ruta)), o None.
+        """
+        a, b = sorted((tuple(archivo1), tuple(archivo2)))
+        with Lectura(self._conexion) as conexion:
+            fila = conexion.execute(
+                "SELECT score FROM similitudes WHERE proyecto1 = ? AND ruta1 = ? AND proyecto2 = ? AND ruta2 = ?",
+                a + b
+            ).fetchone()
+        return fila[0] if fila else None
+
+    def mayores(self, umbral=UMBRAL_SIMILITUD, limite=20):
+        """
+        :return: Lista de (proyecto1, ruta1, proyecto2, ruta2, score) con score >= umbral,
+                 de mayor a menor.
+        """
+        with Lectura(self._conexion) as conexion:
+            return conexion.execute(
+                "SELECT proyecto1, ruta1, proyecto2, ruta2, score FROM similitudes "
+                "WHERE score >= ? ORDER BY score DESC LIMIT ?", (umbral, limite)
+            ).fetchall()
+
+    def __len__(self):
+        with Lectura(self._conexion) as conexion:
+            return conexion.execute("SELECT COUNT(*) FROM similitudes").fetchone()[0]
+
+    def cerrar(self):
+        self._conexion.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+class VigilanteSimilitud:
+    """
+    Vigila por sondeo (solo biblioteca estándar) las carpetas de código de los
+    proyectos registrados y mantiene al día la tabla de similitudes.
+
+    En cada sondeo se toma una instantánea barata (solo `stat`) de cada carpeta.
+    Cuando una carpeta cambió y lleva `espera_estable` segundos sin cambiar, se
+    reindexa y se recalculan los scores únicamente de los pares que incluyen un
+    archivo modificado, contra los archivos de los demás proyectos. Los tokens
+    salen del índice, así que ningún archivo sin cambios se vuelve a leer.
+    """
+    def __init__(self, registro=None, indice=None, tabla=None,
+                 intervalo=INTERVALO_SONDEO, espera_estable=ESPERA_ESTABLE):
+        self.registro = registro if registro is not None else RegistroProyectos()
+        self.indice = indice if indice is not None else IndiceCodigo(CODE_INDEX_DB_PATH)
+        self.tabla = tabla if tabla is not None else TablaSimilitudes()
+        self.intervalo = intervalo
+        self.espera_estable = espera_estable
+        self._instantaneas = {}  # proyecto -> última instantánea vista
+        self._pendientes = {}  # proyecto -> momento del último cambio detectado
+
+    def _score(self, tokens1, tokens2):
+        # Mismo cálculo que CodeComparator.compare, con los tokens ya indexados.
+        (seq1, pesos1), (seq2, pesos2) = tokens1, tokens2
+        if not seq1 or not seq2:
+            return 0.0
+        score, _ = lcs_weighted(seq1, pesos1, seq2, pesos2)
+        return score
+
+    def procesar(self, proyectos=None):
+        """
+        Reindexa los proyectos indicados (por defecto, todos) y recalcula los
+        pares afectados por lo que cambió desde la última vez que se procesaron.
+
+        :return: Número de pares recalculados.
+        """
+        registrados = {p.nombre: p for p in self.registro.listar()}
+        a_indexar = registrados if proyectos is None else {n: registrados[n] for n in proyectos if n in registrados}
+        for nombre, proyecto in a_indexar.items():
+            if os.path.isdir(proyecto.ruta_codigo):
+                self.indice.indexar(nombre, proyecto.ruta_codigo)
+
+        # Cambios pendientes de cada proyecto según su generación procesada.
+        cambiados, eliminados, generaciones = [], [], {}
+        for nombre in registrados:
+            procesada = self.tabla.generacion_procesada(nombre)
+            actual = self.indice.generacion(nombre)
+            if actual == procesada:
+                continue
+            modificados, borrados = self.indice.cambios_desde(nombre, procesada)
+            cambiados.extend((nombre, ruta) for ruta in modificados)
+            eliminados.extend((nombre, ruta) for ruta in borrados)
+            generaciones[nombre] = actual
+        proyectos_eliminados = [p for p in self.tabla.proyectos_procesados() if p not in registrados]
+
+        tokens = {}
+        def tokens_de(archivo):
+            if archivo not in tokens:
+                tokens[archivo] = self.indice.tokens(*archivo)
+            return tokens[archivo]
+
+        archivos = {nombre: self.indice.archivos(nombre) for nombre in registrados}
+        scores = []
+        calculados = set()
+        for archivo in cambiados:
+            for otro_proyecto, rutas in archivos.items():
+                if otro_proyecto == archivo[0]:
+                    continue  # Solo se comparan proyectos distintos
+                for ruta in rutas:
+                    par = tuple(sorted((archivo, (otro_proyecto, ruta))))
+                    if par in calculados:
+                        continue
+                    calculados.add(par)
+                    scores.append((par[0], par[1], self._score(tokens_de(par[0]), tokens_de(par[1]))))
+
+        if scores or eliminados or proyectos_eliminados or generaciones:
+            self.tabla.actualizar(scores, eliminados, proyectos_eliminados, generaciones)
+        return len(scores)
+
+    def sondear(self, ahora=None):
+        """
+        Un ciclo de sondeo: detecta cambios y procesa los proyectos cuyas carpetas
+        ya están estables.
+
+        :return: Número de pares recalculados en este ciclo.
+        """
+        ahora = time.monotonic() if ahora is None else ahora
+        registrados = {p.nombre: p for p in self.registro.listar()}
+        for nombre, proyecto in registrados.items():
+            instantanea = instantanea_de_carpeta(proyecto.ruta_codigo, self.indice.extensiones) \
+                if os.path.isdir(proyecto.ruta_codigo) else {}
+            if self._instantaneas.get(nombre) != instantanea:
+                self._instantaneas[nombre] = instantanea
+                self._pendientes[nombre] = ahora
+        for nombre in list(self._instantaneas):
+            if nombre not in registrados:
+                del self._instantaneas[nombre]
+                self._pendientes[nombre] = ahora
+
+        listos = [n for n, momento in self._pendientes.items() if ahora - momento >= self.espera_estable]
+        if not listos:
+            return 0
+        for nombre in listos:
+            del self._pendientes[nombre]
+        return self.procesar([n for n in listos if n in registrados])
+
+    def ejecutar(self, max_ciclos=None, umbral=UMBRAL_SIMILITUD):
+        """
+        Bucle principal: sondea cada `intervalo` segundos hasta Ctrl+C (o
+        `max_ciclos`) e informa los pares que superan el umbral.
+        """
+        print(f"👀 Vigilando {len(self.registro.listar())} proyectos (Ctrl+C para salir)...")
+        recalculados = self.procesar()
+        print(f"   -> Estado inicial: {recalculados} pares recalculados, {len(self.tabla)} pares en la tabla.")
+        ciclos = 0
+        try:
+            while max_ciclos is None or ciclos < max_ciclos:
+                time.sleep(self.intervalo)
+                ciclos += 1
+                recalculados = self.sondear()
+                if recalculados:
+                    print(f"\n   -> {recalculados} pares recalculados.")
+                    for p1, r1, p2, r2, score in self.tabla.mayores(umbral):
+                        print(f"      ⚠️  {score:.2%}  {p1}/{r1}  <->  {p2}/{r2}")
+        except KeyboardInterrupt:
+            print("\nVigilancia detenida.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Recalcula la similitud de código de los proyectos registrados a medida que cambian."
+    )
+    parser.add_argument('--intervalo', type=float, default=INTERVALO_SONDEO,
+                        help="Segundos entre sondeos (por defecto %(default)s)")
+    parser.add_argument('--espera', type=float, default=ESPERA_ESTABLE,
+                        help="Segundos sin cambios antes de recalcular (por defecto %(default)s)")
+    parser.add_argument('--umbral', type=float, default=UMBRAL_SIMILITUD,
+                        help="Score a partir del cual se informa un par (por defecto %(default)s)")
+    args = parser.parse_args(argv)
+    VigilanteSimilitud(intervalo=args.intervalo, espera_estable=args.espera).ejecutar(umbral=args.umbral)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+# src/obst/garsia_wachs.py
+import heapq
+
+from .tree_utils import Node
+
+
+# Montículo zurdo (leftist heap) sobre listas [clave, izq, der, rango, valor]:
+# fusionar dos montículos cuesta O(log n), lo que permite unir los bloques de
+# Hu–Tucker cuando desaparece una hoja terminal.
+def _fusionar(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if b[0] < a[0]:
+        a, b = b, a
+    a[2] = _fusionar(a[2], b)
+    if a[1] is None or a[1][3] < a[2][3]:
+        a[1], a[2] = a[2], a[1]
+    a[3] = (a[2][3] + 1) if a[2] is not None else 1
+    return a
+
+
+def _sacar_minimo(monticulo):
+    return monticulo[4], _fusionar(monticulo[1], monticulo[2])
+
+
+def _mejor_par(bloque, hojas):
+    """
+    Par compatible de menor peso dentro de un bloque, desempatando por la
+    posición del elemento izquierdo y luego la del derecho.
+
+    :return: Tupla ((peso, pos_izq, pos_der), tipo) o None si no hay par posible
+    """
+    izq, der, monticulo = bloque
+    candidatos = []
+    if monticulo is not None:
+        peso1, pos1, _ = monticulo[4]
+        hijos = [h for h in (monticulo[1], monticulo[2]) if h is not None]
+        if hijos:
+            peso2, pos2, _ = min(hijos, key=lambda h: h[0])[4]
+            candidatos.append(((peso1 + peso2, min(pos1, pos2), max(pos1, pos2)), 'cc'))
+        if izq is not None:
+            candidatos.append(((hojas[izq] + peso1, izq, pos1), 'tc'))
+        if der is not None:
+            candidatos.append(((peso1 + hojas[der], pos1, der), 'ct'))
+    if izq is not None and der is not None:
+        candidatos.append(((hojas[izq] + hojas[der], izq, der), 'tt'))
+    return min(candidatos) if candidatos else None
+
+
+def _combinar_hu_tucker(q):
+    """
+    Fase 1 (Hu–Tucker): combina pesos hasta obtener un único árbol (no
+    necesariamente alfabético) cuyas profundidades de hoja son óptimas.
+
+    Las hojas originales son "terminales": dos nodos son compatibles si no hay
+    ninguna terminal entre ellos. En cada paso se combina el par compatible de
+    menor peso (desempatando por posición) y el resultado es un nodo
+    "transparente" en la posición del izquierdo. Las terminales dividen la
+    secuencia en bloques; cada bloque guarda sus nodos transparentes en un
+    montículo zurdo y un montículo global guarda el mejor par de cada bloque.
+    Cuando una terminal se combina, los bloques vecinos se fusionan en
+    O(log n), así que el total es O(n log n) para cualquier distribución de pesos.
+
+    :param q: Pesos de las hojas (q_0, ..., q_n)
+    :return: Árbol anidado de tuplas (izq, der) cuyas hojas son los índices de q
+    """
+    m = len(q)
+    if m == 1:
+        return 0
+    hojas = list(q)
+    # Bloque b está entre las terminales b y b + 1: [terminal izq, terminal der, montículo].
+    bloques = [[b, b + 1, None] for b in range(m - 1)]
+    version = [0] * (m - 1)
+    bloque_izq = [None] + list(range(m - 1))  # Bloque a la izquierda de cada terminal
+    bloque_der = list(range(m - 1)) + [None]  # Bloque a la derecha de cada terminal
+
+    global_ = []
+
+    def publicar(b):
+        version[b] += 1
+        mejor = _mejor_par(bloques[b], hojas)
+        if mejor is not None:
+            heapq.heappush(global_, (mejor[0], b, version[b], mejor[1]))
+
+    def quitar_terminal(t, b):
+        # La terminal t se combinó dentro del bloque b: el bloque del otro lado
+        # de t se fusiona con b.
+        izq, der = bloque_izq[t], bloque_der[t]
+        otro = izq if der == b else der
+        if otro is None:
+            bloques[b][0 if der == b else 1] = None  # t era un extremo de la secuencia
+        elif otro == izq:
+            bloques[b][0] = bloques[otro][0]
+            if bloques[b][0] is not None:
+                bloque_der[bloques[b][0]] = b
+        else:
+            bloques[b][1] = bloques[otro][1]
+            if bloques[b][1] is not None:
+                bloque_izq[bloques[b][1]] = b
+        if otro is not None:
+            bloques[b][2] = _fusionar(bloques[b][2], bloques[otro][2])
+            version[otro] += 1  # Invalida las entradas del bloque absorbido
+        bloque_izq[t] = bloque_der[t] = None
+
+    for b in range(m - 1):
+        publicar(b)
+
+    arbol = None
+    for _ in range(m - 1):
+        while True:
+            (peso, pos_izq, pos_der), b, ver, tipo = heapq.heappop(global_)
+            if ver == version[b]:
+                break
+        bloque = bloques[b]
+        if tipo == 'cc':
+            (_, pos1, sub1), bloque[2] = _sacar_minimo(bloque[2])
+            (_, pos2, sub2), bloque[2] = _sacar_minimo(bloque[2])
+            subarbol = (sub1, sub2) if pos1 < pos2 else (sub2, sub1)
+        elif tipo == 'tc':
+            (_, _, sub), bloque[2] = _sacar_minimo(bloque[2])
+            subarbol = (pos_izq, sub)
+            quitar_terminal(pos_izq, b)
+        elif tipo == 'ct':
+            (_, _, sub), bloque[2] = _sacar_minimo(bloque[2])
+            subarbol = (sub, pos_der)
+            quitar_terminal(pos_der, b)
+        else:
+            subarbol = (pos_izq, pos_der)
+            quitar_terminal(pos_izq, b)
+            quitar_terminal(pos_der, b)
+        arbol = subarbol
+        clave = (peso, pos_izq)
+        bloque[2] = _fusionar(bloque[2], [clave, None, None, 1, (peso, pos_izq, subarbol)])
+        publicar(b)
+
+    return arbol
+
+
+def _profundidades_de_hojas(arbol, num_hojas):
+    """
+    Fase 2: calcula la profundidad de cada hoja del árbol combinado.
+    """
+    profundidades = [0] * num_hojas
+    pila = [(arbol, 0)]
+    while pila:
+        nodo, profundidad = pila.pop()
+        if isinstance(nodo, tuple):
+            pila.append((nodo[0], profundidad + 1))
+            pila.append((nodo[1], profundidad + 1))
+        else:
+            profundidades[nodo] = profundidad
+    return profundidades
+
+
+def _construir_alfabetico(keys, profundidades):
+    """
+    Fase 3: construye el árbol alfabético cuyas hojas, de izquierda a derecha,
+    tienen las profundidades dadas. Cada nodo interno recibe la clave que separa
+    la última hoja de su subárbol izquierdo de la primera del derecho.
+    """
+    # Cada elemento de la pila es [profundidad, subárbol, última hoja cubierta].
+    pila = []
+    for hoja, profundidad in enumerate(profundidades):
+        pila.append([profundidad, None, hoja])
+        while len(pila) >= 2 and pila[-1][0] == pila[-2][0]:
+            prof, der, ultima = pila.pop()
+            _, izq, ultima_izq = pila.pop()
+            nodo = Node(keys[ultima_izq])  # Clave k_{b+1} tras la hoja d_b
+            nodo.left = izq
+            nodo.right = der
+            pila.append([prof - 1, nodo, ultima])
+
+    if len(pila) != 1 or pila[0][0] != 0:
+        raise ValueError("Las profundidades no describen un árbol alfabético válido.")
+    return pila[0][1]
+
+
+def arbol_alfabetico_optimo(keys, q):
+    """
+    Construye el árbol alfabético óptimo (OBST con p = 0) en O(n log n) con el
+    algoritmo de Hu–Tucker (las mismas profundidades de hoja que Garsia–Wachs).
+    Es útil cuando solo importan las probabilidades de los huecos entre claves,
+    p. ej. tablas de rutas o partición por rangos.
+
+    :param keys: Lista de claves ordenadas (k_1, ..., k_n).
+    :param q: Lista de probabilidades de los huecos (q_0, ..., q_n).
+
+    :return: Tupla con el costo esperado (mismo criterio que `optimal_bst`) y la
+             raíz del árbol como `Node`, compatible con `tree_utils`.
+    """
+    n = len(keys)
+    if len(q) != n + 1:
+        raise ValueError("q debe tener exactamente len(keys) + 1 elementos.")
+    if n == 0:
+        return q[0], None
+
+    arbol = _combinar_hu_tucker(q)
+    profundidades = _profundidades_de_hojas(arbol, n + 1)
+    raiz = _construir_alfabetico(keys, profundidades)
+
+    # Una hoja a profundidad d (en aristas) cuesta d + 1 comparaciones.
+    costo = sum(peso * (d + 1) for peso, d in zip(q, profundidades))
+    return costo, raiz
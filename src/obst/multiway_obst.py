@@ -0,0 +1,189 @@
+# src/obst/multiway_obst.py
+from array import array
+from bisect import bisect_left
+
+from .tree_utils import NodoMultiway
+
+
+def optimal_multiway_bst(keys, p, q, k):
+    """
+    Calcula el árbol de búsqueda multivía óptimo, donde cada nodo guarda hasta
+    k - 1 claves, extendiendo la programación dinámica de `optimal_bst`.
+
+    Un nodo sobre el intervalo (i, j) se elige como una secuencia de hasta k - 1
+    separadores r_1 < ... < r_m. Para no enumerar todas las combinaciones se usa
+    una tabla auxiliar H[m][a][b]: el costo mínimo de cubrir las claves a..b del
+    nodo actual usando a lo sumo m separadores más, donde cada tramo entre
+    separadores es un subárbol de costo C. Con k = 2 se obtiene exactamente el OBST.
+
+    :param keys: Lista de claves ordenadas (k_1, ..., k_n).
+    :param p: Lista de probabilidades de búsqueda para cada clave (p_1, ..., p_n).
+    :param q: Lista de probabilidades de búsqueda fallida (q_0, ..., q_n).
+    :param k: Aridad máxima de los nodos (k >= 2).
+
+    :return: Tupla con el costo esperado (visitas a nodos, contando la hoja
+             ficticia como en `optimal_bst`) y las tablas de decisión (RAIZ, ELEC)
+             que necesita `reconstruir_multiway`.
+    """
+    if k < 2:
+        raise ValueError("La aridad k debe ser al menos 2.")
+    n = len(keys)
+    extra = k - 2  # Separadores adicionales al primero que admite un nodo
+
+    # Indexado desde 1, igual que en optimal_bst. C es la tabla de costos y
+    # H[0] es la propia C (ningún separador adicional: el tramo es un subárbol).
+    C = [[0.0] * (n + 2) for _ in range(n + 2)]
+    W = [[0.0] * (n + 2) for _ in range(n + 2)]
+    H = [C] + [[[0.0] * (n + 2) for _ in range(n + 2)] for _ in range(extra)]
+    RAIZ = [[0] * (n + 2) for _ in range(n + 2)]
+    # ELEC[m][a][b] = primer separador elegido en H[m][a][b], 0 si no se elige ninguno.
+    ELEC = [None] + [[[0] * (n + 2) for _ in range(n + 2)] for _ in range(extra)]
+
+    # Casos base: intervalos vacíos (solo la hoja ficticia).
+    for i in range(1, n + 2):
+        C[i][i - 1] = q[i - 1]
+        W[i][i - 1] = q[i - 1]
+        for m in range(1, extra + 1):
+            H[m][i][i - 1] = q[i - 1]
+
+    for length in range(1, n + 1):
+        for i in range(1, n - length + 2):
+            j = i + length - 1
+            W[i][j] = W[i][j - 1] + p[j - 1] + q[j]
+
+            # Costo del nodo: primer separador r más el resto del nodo con
+            # hasta `extra` separadores en (r+1, j).
+            resto = H[extra]
+            mejor = float('inf')
+            for r in range(i, j + 1):
+                cost = C[i][r - 1] + resto[r + 1][j]
+                if cost < mejor:
+                    mejor = cost
+                    RAIZ[i][j] = r
+            C[i][j] = mejor + W[i][j]
+
+            # Ahora que C[i][j] existe, se completan las tablas auxiliares.
+            for m in range(1, extra + 1):
+                anterior = H[m - 1]
+                mejor = C[i][j]
+                eleccion = 0
+                for r in range(i, j + 1):
+                    cost = C[i][r - 1] + anterior[r + 1][j]
+                    if cost < mejor:
+                        mejor = cost
+                        eleccion = r
+                H[m][i][j] = mejor
+                ELEC[m][i][j] = eleccion
+
+    return C[1][n], (RAIZ, ELEC)
+
+
+def reconstruir_multiway(tablas, keys, k):
+    """
+    Reconstruye el árbol multivía óptimo a partir de las tablas de decisión.
+
+    :param tablas: Tupla (RAIZ, ELEC) devuelta por `optimal_multiway_bst`
+    :param keys: Lista de claves ordenadas
+    :param k: Aridad máxima usada al calcular las tablas
+
+    :return: Raíz del árbol (NodoMultiway) o None si no hay claves
+    """
+    RAIZ, ELEC = tablas
+    n = len(keys)
+    if n == 0:
+        return None
+
+    raiz = NodoMultiway()
+    # Pila de (i, j, nodo): intervalos pendientes y el nodo que los representa.
+    pila = [(1, n, raiz)]
+    while pila:
+        i, j, nodo = pila.pop()
+        r = RAIZ[i][j]
+        claves_nodo = [keys[r - 1]]
+        tramos = [(i, r - 1)]
+
+        a, m = r + 1, k - 2
+        while m > 0 and a <= j and ELEC[m][a][j] != 0:
+            r = ELEC[m][a][j]
+            claves_nodo.append(keys[r - 1])
+            tramos.append((a, r - 1))
+            a, m = r + 1, m - 1
+        tramos.append((a, j))
+
+        nodo.keys = claves_nodo
+        nodo.children = []
+        for inicio, fin in tramos:
+            if inicio > fin:
+                nodo.children.append(None)
+            else:
+                hijo = NodoMultiway()
+                nodo.children.append(hijo)
+                pila.append((inicio, fin, hijo))
+
+    return raiz
+
+
+class ArbolMultiwayPlano:
+    """
+    Representación aplanada de un árbol multivía para búsquedas con pocos saltos
+    de memoria: todas las claves en un único arreglo y los hijos como índices.
+
+    - claves[inicio[t]:inicio[t+1]] son las claves del nodo t.
+    - hijos[inicio[t] + t + pos] es el hijo pos-ésimo del nodo t (-1 si está vacío).
+    """
+    def __init__(self, claves, inicio, hijos):
+        self.claves = claves
+        self.inicio = inicio
+        self.hijos = hijos
+
+
+def aplanar_multiway(raiz):
+    """
+    Aplana un árbol de NodoMultiway en orden por niveles (BFS).
+
+    :param raiz: Raíz del árbol multivía
+    :return: ArbolMultiwayPlano equivalente
+    """
+    claves, inicio, hijos = [], array('i', [0]), array('i')
+    if raiz is None:
+        return ArbolMultiwayPlano(claves, inicio, hijos)
+
+    orden = [raiz]
+    indice = {id(raiz): 0}
+    t = 0
+    # Primera pasada: numerar los nodos en orden por niveles.
+    while t < len(orden):
+        for hijo in orden[t].children:
+            if hijo is not None:
+                indice[id(hijo)] = len(orden)
+                orden.append(hijo)
+        t += 1
+
+    for nodo in orden:
+        claves.extend(nodo.keys)
+        inicio.append(len(claves))
+        hijos.extend(indice[id(h)] if h is not None else -1 for h in nodo.children)
+
+    return ArbolMultiwayPlano(claves, inicio, hijos)
+
+
+def buscar_multiway(plano, clave):
+    """
+    Busca una clave en un árbol multivía aplanado.
+
+    :param plano: ArbolMultiwayPlano
+    :param clave: Clave que estamos buscando
+    :return: Tupla (found, visitas) donde `visitas` es el número de nodos
+             consultados, tanto si la clave se encuentra como si no.
+    """
+    claves, inicio, hijos = plano.claves, plano.inicio, plano.hijos
+    visitas = 0
+    t = 0 if claves else -1
+    while t != -1:
+        visitas += 1
+        lo, hi = inicio[t], inicio[t + 1]
+        pos = bisect_left(claves, clave, lo, hi)
+        if pos < hi and claves[pos] == clave:
+            return True, visitas
+        t = hijos[pos + t]
+    return False, visitas
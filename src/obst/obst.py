@@ -50,19 +50,13 @@ def optimal_bst(keys, p, q):
     # El resultado final se encuentra en E[1][n]
     return E[1][n], ROOT
 
-def reconstruir_arbol(ROOT, keys, i, j):
+def _indice_raiz(ROOT, i, j):
     """
-    Reconstruye el árbol óptimo de búsqueda binaria (OBST) a partir de la tabla de raíces.
-
-    :param ROOT: Tabla que contiene las raíces de cada subárbol
-    :param keys: Lista de claves ordenadas
-    :param i: Índice inicial del subárbol
-    :param j: Índice final del subárbol
-
-    :return: Nodo raíz del subárbol reconstruido
+    Devuelve el índice (1-indexado) de la raíz del subárbol (i, j), o 0 si el
+    intervalo está vacío o no tiene raíz en la tabla.
     """
     if i > j:
-        return None
+        return 0
     
     # Los índices de ROOT y keys deben ser consistentes.
     # Si ROOT es 1-indexado (como en este caso), la raíz es ROOT[i-1][j-1] o ROOT[i][j]
@@ -70,17 +64,41 @@ def reconstruir_arbol(ROOT, keys, i, j):
     # La clave está en keys[r-1] porque `keys` es 0-indexada.
     
     if i == 0 or j == 0 or i > len(ROOT) or j > len(ROOT[0]):
-         return None # No hay raíz para este rango
+         return 0 # No hay raíz para este rango
     
-    r_index = ROOT[i-1][j-1] # Asumimos que ROOT fue llenada 0-indexada
+    return ROOT[i-1][j-1] # Asumimos que ROOT fue llenada 0-indexada
+
+def reconstruir_arbol(ROOT, keys, i, j):
+    """
+    Reconstruye el árbol óptimo de búsqueda binaria (OBST) a partir de la tabla de raíces.
+    Usa una pila explícita, por lo que no depende del límite de recursión aunque
+    el árbol esté muy sesgado.
+
+    :param ROOT: Tabla que contiene las raíces de cada subárbol
+    :param keys: Lista de claves ordenadas
+    :param i: Índice inicial del subárbol
+    :param j: Índice final del subárbol
+
+    :return: Nodo raíz del subárbol reconstruido
+    """
+    r_index = _indice_raiz(ROOT, i, j)
     if r_index == 0:
         return None
 
-    r = keys[r_index - 1]
-    nodo = Node(r)
-    
-    nodo.left = reconstruir_arbol(ROOT, keys, i, r_index - 1)
-    nodo.right = reconstruir_arbol(ROOT, keys, r_index + 1, j)
+    raiz = Node(keys[r_index - 1])
+    # Pila de (nodo, índice de su raíz, i, j) cuyos hijos faltan por construir.
+    pila = [(raiz, r_index, i, j)]
+    while pila:
+        nodo, r_index, i, j = pila.pop()
+
+        r_izq = _indice_raiz(ROOT, i, r_index - 1)
+        if r_izq != 0:
+            nodo.left = Node(keys[r_izq - 1])
+            pila.append((nodo.left, r_izq, i, r_index - 1))
 
-    return nodo
+        r_der = _indice_raiz(ROOT, r_index + 1, j)
+        if r_der != 0:
+            nodo.right = Node(keys[r_der - 1])
+            pila.append((nodo.right, r_der, r_index + 1, j))
 
+    return raiz
@@ -0,0 +1,132 @@
+# src/obst/parallel_obst.py
+import os
+from multiprocessing import Pool, shared_memory
+
+from .obst import optimal_bst
+
+# Por debajo de este número de claves el costo de crear los procesos supera
+# la ganancia, así que se delega directamente al solucionador serial.
+UMBRAL_SERIAL = 300
+
+# Estado de cada proceso trabajador (se inicializa una vez por proceso).
+_tablas = {}
+
+
+def _adjuntar_tablas(nombre_E, nombre_W, nombre_ROOT, n, p, q):
+    """
+    Inicializador de los procesos trabajadores: se adjunta a los bloques de
+    memoria compartida por nombre, sin copiar las tablas.
+    """
+    shm_E = shared_memory.SharedMemory(name=nombre_E)
+    shm_W = shared_memory.SharedMemory(name=nombre_W)
+    shm_ROOT = shared_memory.SharedMemory(name=nombre_ROOT)
+    _tablas.update(
+        shms=(shm_E, shm_W, shm_ROOT),
+        E=shm_E.buf.cast('d'),
+        W=shm_W.buf.cast('d'),
+        ROOT=shm_ROOT.buf.cast('q'),
+        n=n, p=p, q=q,
+    )
+
+
+def _resolver_bloque(args):
+    """
+    Calcula las celdas (i, i + length - 1) de una diagonal para i en [inicio, fin).
+    Las tablas E y W son planas de (n+2)x(n+2) y ROOT de (n+1)x(n+1), con los
+    mismos índices que `optimal_bst`.
+    """
+    length, inicio, fin = args
+    E, W, ROOT = _tablas['E'], _tablas['W'], _tablas['ROOT']
+    n, p, q = _tablas['n'], _tablas['p'], _tablas['q']
+    ancho = n + 2
+
+    for i in range(inicio, fin):
+        j = i + length - 1
+        fila_i = i * ancho
+
+        # Mismas operaciones y en el mismo orden que la versión serial,
+        # para que los resultados sean idénticos bit a bit.
+        w = W[fila_i + j - 1] + p[j - 1] + q[j]
+        W[fila_i + j] = w
+
+        mejor = float('inf')
+        raiz = 0
+        for r in range(i, j + 1):
+            cost = E[fila_i + r - 1] + E[(r + 1) * ancho + j] + w
+            if cost < mejor:
+                mejor = cost
+                raiz = r
+        E[fila_i + j] = mejor
+        ROOT[(i - 1) * (n + 1) + (j - 1)] = raiz
+
+
+def optimal_bst_paralelo(keys, p, q, num_procesos=None, umbral_serial=UMBRAL_SERIAL):
+    """
+    Calcula el OBST repartiendo cada diagonal de la tabla entre varios procesos.
+
+    Todos los intervalos de una misma longitud son independientes entre sí, así
+    que cada diagonal se divide en bloques contiguos que los trabajadores
+    resuelven en paralelo. Las tablas viven en `multiprocessing.shared_memory`,
+    por lo que ninguna fila se copia entre procesos.
+
+    :param keys: Lista de claves ordenadas (k_1, ..., k_n).
+    :param p: Lista de probabilidades de búsqueda para cada clave (p_1, ..., p_n).
+    :param q: Lista de probabilidades de búsqueda fallida (q_0, ..., q_n).
+    :param num_procesos: Número de procesos trabajadores (por defecto, os.cpu_count()).
+    :param umbral_serial: Para n menor que este valor se usa `optimal_bst` directamente.
+
+    :return: Tupla con el costo mínimo esperado y la tabla de raíces, idéntica
+             a la que devuelve `optimal_bst`.
+    """
+    n = len(keys)
+    num_procesos = num_procesos or os.cpu_count() or 1
+    if n < umbral_serial or n == 0:
+        return optimal_bst(keys, p, q)
+
+    p = [float(x) for x in p]
+    q = [float(x) for x in q]
+    ancho = n + 2
+
+    shm_E = shared_memory.SharedMemory(create=True, size=ancho * ancho * 8)
+    shm_W = shared_memory.SharedMemory(create=True, size=ancho * ancho * 8)
+    shm_ROOT = shared_memory.SharedMemory(create=True, size=(n + 1) * (n + 1) * 8)
+    try:
+        E = shm_E.buf.cast('d')
+        W = shm_W.buf.cast('d')
+        ROOT = shm_ROOT.buf.cast('q')
+        try:
+            # Los bloques recién creados vienen en cero; solo faltan los casos base.
+            for i in range(1, n + 2):
+                E[i * ancho + i - 1] = q[i - 1]
+                W[i * ancho + i - 1] = q[i - 1]
+
+            with Pool(
+                num_procesos,
+                initializer=_adjuntar_tablas,
+                initargs=(shm_E.name, shm_W.name, shm_ROOT.name, n, p, q),
+            ) as pool:
+                for length in range(1, n + 1):
+                    celdas = n - length + 1
+                    # Bloques grandes para amortizar el costo de comunicación,
+                    # pero suficientes para mantener ocupados a todos los procesos.
+                    tam_bloque = max(1, -(-celdas // num_procesos))
+                    bloques = [
+                        (length, inicio, min(inicio + tam_bloque, celdas + 1))
+                        for inicio in range(1, celdas + 1, tam_bloque)
+                    ]
+                    pool.map(_resolver_bloque, bloques)
+
+            costo = E[ancho + n]
+            tabla_raices = [
+                list(ROOT[fila * (n + 1):(fila + 1) * (n + 1)]) for fila in range(n + 1)
+            ]
+        finally:
+            E.release()
+            W.release()
+            ROOT.release()
+    finally:
+        for shm in (shm_E, shm_W, shm_ROOT):
+            shm.close()
+            shm.unlink()
+
+    return costo, tabla_raices
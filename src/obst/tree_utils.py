@@ -1,6 +1,14 @@
 # src/obst/tree_utils.py
-import graphviz
+import heapq
+import logging
 import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Un único hilo de fondo: los dibujos se encolan en lugar de competir entre sí.
+_EJECUTOR_DIBUJO = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dibujar_arbol')
+
+_log = logging.getLogger(__name__)
 
 class Node:
     """
@@ -11,83 +19,205 @@ class Node:
         self.left = None  # Subárbol izquierdo
         self.right = None  # Subárbol derecho
 
+class NodoMultiway:
+    """
+    Clase para representar un nodo de un árbol de búsqueda multivía (estilo B-tree).
+    Un nodo con m claves ordenadas tiene m + 1 hijos (None si el subárbol está vacío).
+    """
+    def __init__(self, keys=None, children=None):
+        self.keys = keys if keys is not None else []  # Claves ordenadas del nodo
+        self.children = children if children is not None else [None]  # Subárboles entre claves
+
+def iterar_inorden(nodo):
+    """
+    Genera las claves del árbol en inorden de forma perezosa, con una pila
+    explícita (memoria O(altura) y sin límite de recursión).
+
+    :param nodo: Raíz del árbol
+    """
+    pila = []
+    while pila or nodo is not None:
+        while nodo is not None:
+            pila.append(nodo)
+            nodo = nodo.left
+        nodo = pila.pop()
+        yield nodo.key
+        nodo = nodo.right
+
 def imprimir_arbol(root):
     """
     Imprime el árbol binario en orden (inorden).
     
     :param root: Raíz del árbol
     """
-    if root is not None:
-        imprimir_arbol(root.left)
-        print(root.key)
-        imprimir_arbol(root.right)
+    for key in iterar_inorden(root):
+        print(key)
 
 def obtener_recorrido_inorden(nodo):
     """
     Realiza un recorrido inorden del árbol y devuelve una lista de claves.
     Esta es la forma correcta de verificar la estructura de un BST.
     """
-    resultado = []
-    if nodo:
-        resultado.extend(obtener_recorrido_inorden(nodo.left))
-        resultado.append(nodo.key)
-        resultado.extend(obtener_recorrido_inorden(nodo.right))
-    return resultado        
+    return list(iterar_inorden(nodo))
 
-def dibujar_arbol(root_node, filename='obst_tree'):
+def _etiqueta(key):
     """
-    Dibuja un árbol binario usando Graphviz con alta resolución y lo muestra.
+    Devuelve la etiqueta DOT de una clave, acortada y con las comillas escapadas.
     """
-    if not root_node:
-        print("El árbol está vacío, no se puede dibujar.")
-        return
+    texto = str(key)
+    # Para claves muy largas, las acortamos para la visualización
+    if len(texto) > 10:
+        texto = texto[:10] + '...'
+    return texto.replace('\\', '\\\\').replace('"', '\\"')
+
+def _seleccionar_mas_probables(root_node, max_nodos, probabilidades):
+    """
+    Elige los `max_nodos` nodos del subárbol conexo (desde la raíz) de mayor
+    probabilidad, expandiendo siempre primero el nodo más probable de la frontera.
+
+    :return: Conjunto con los id() de los nodos elegidos.
+    """
+    elegidos = set()
+    frontera = [(0.0, 0, root_node)]
+    orden = 1
+    while frontera and len(elegidos) < max_nodos:
+        _, _, nodo = heapq.heappop(frontera)
+        elegidos.add(id(nodo))
+        for hijo in (nodo.left, nodo.right):
+            if hijo is not None:
+                heapq.heappush(frontera, (-probabilidades.get(hijo.key, 0.0), orden, hijo))
+                orden += 1
+    return elegidos
+
+def generar_dot(root_node, max_niveles=None, max_nodos=None, probabilidades=None, dpi='300'):
+    """
+    Genera el texto DOT del árbol línea por línea, con un recorrido por niveles
+    sin recursión que emite cada nodo una sola vez.
+
+    :param root_node: Raíz del árbol
+    :param max_niveles: Si se indica, solo se dibujan los primeros N niveles.
+    :param max_nodos: Si se indica, se dibujan a lo sumo N nodos.
+    :param probabilidades: Diccionario clave -> probabilidad. Junto con `max_nodos`
+                           se dibuja el subárbol conexo más probable en lugar de
+                           los primeros niveles.
+    :param dpi: Resolución de la imagen generada.
+    :return: Generador de líneas de texto DOT.
+    """
+    yield 'digraph {'
+    yield '\t// Árbol de Búsqueda Binaria Óptimo'
+    # 'ordering=out' conserva el hijo izquierdo a la izquierda aunque falte el derecho.
+    yield f'\tgraph [dpi="{dpi}" nodesep="0.5" ordering=out rankdir=TB ranksep="1.0"]'
+    yield '\tnode [fillcolor=lightblue fontsize=10 shape=circle style=filled]'
+    yield '\tedge [color=gray]'
+
+    if root_node is not None:
+        elegidos = None
+        if probabilidades is not None and max_nodos is not None:
+            elegidos = _seleccionar_mas_probables(root_node, max_nodos, probabilidades)
+
+        # Cola de (nodo, id, id del padre, nivel); los ids son secuenciales para
+        # que el DOT sea estable, y cada arista se emite junto con su nodo hijo.
+        cola = deque([(root_node, 0, None, 1)])
+        siguiente_id = 1
+        emitidos = 0
+        while cola and (max_nodos is None or emitidos < max_nodos):
+            nodo, id_nodo, id_padre, nivel = cola.popleft()
+            yield f'\tn{id_nodo} [label="{_etiqueta(nodo.key)}"]'
+            if id_padre is not None:
+                yield f'\tn{id_padre} -> n{id_nodo}'
+            emitidos += 1
+
+            if max_niveles is not None and nivel >= max_niveles:
+                continue
+            for hijo in (nodo.left, nodo.right):
+                if hijo is None or (elegidos is not None and id(hijo) not in elegidos):
+                    continue
+                cola.append((hijo, siguiente_id, id_nodo, nivel + 1))
+                siguiente_id += 1
+
+    yield '}'
+
+def _renderizar_dot(lineas, output_path, view):
+    """
+    Escribe las líneas DOT en disco a medida que se generan y las renderiza a PNG.
+
+    :return: Ruta del PNG generado, o None si Graphviz no está disponible.
+    """
+    ruta_dot = output_path + '.gv'
+    with open(ruta_dot, 'w', encoding='utf-8') as archivo:
+        for linea in lineas:
+            archivo.write(linea)
+            archivo.write('\n')
+
+    import graphviz  # Se carga solo al dibujar: importarlo retrasa el arranque
 
-    output_directory = os.path.join(os.path.dirname(__file__), 'temp_trees')
-    if not os.path.exists(output_directory):
-        os.makedirs(output_directory)
-    
-    output_path = os.path.join(output_directory, filename)
-
-    # --- MEJORAS DE CALIDAD ---
-    dot = graphviz.Digraph(
-        comment='Árbol de Búsqueda Binaria Óptimo',
-        graph_attr={
-            'dpi': '300',  # <-- 1. AUMENTA LA RESOLUCIÓN (DPI)
-            'ranksep': '1.0', # <-- 2. AUMENTA LA SEPARACIÓN VERTICAL
-            'nodesep': '0.5'  # <-- 3. AUMENTA LA SEPARACIÓN HORIZONTAL
-        }
-    )
-
-    dot.attr('node', shape='circle', style='filled', fillcolor='lightblue', fontsize='10')
-    dot.attr('edge', color='gray')
-    dot.attr(rankdir='TB') # Ya no es necesario 'size' al controlar DPI
-
-    def add_nodes_edges(node):
-        if node:
-            # Para claves muy largas, podemos acortarlas para la visualización
-            display_key = (str(node.key)[:10] + '...') if len(str(node.key)) > 10 else str(node.key)
-            dot.node(str(id(node)), display_key)
-            
-            if node.left:
-                display_key_left = (str(node.left.key)[:10] + '...') if len(str(node.left.key)) > 10 else str(node.left.key)
-                dot.node(str(id(node.left)), display_key_left)
-                dot.edge(str(id(node)), str(id(node.left)))
-                add_nodes_edges(node.left)
-            
-            if node.right:
-                display_key_right = (str(node.right.key)[:10] + '...') if len(str(node.right.key)) > 10 else str(node.right.key)
-                dot.node(str(id(node.right)), display_key_right)
-                dot.edge(str(id(node)), str(id(node.right)))
-                add_nodes_edges(node.right)
-
-    add_nodes_edges(root_node)
-    
     try:
-        # Renderiza el gráfico y lo abre. 'cleanup=True' borra los archivos fuente.
-        dot.render(output_path, view=True, cleanup=True, format='png')
-        print(f"Árbol de alta resolución guardado temporalmente y mostrado.")
+        ruta_png = graphviz.render('dot', 'png', ruta_dot, outfile=output_path + '.png')
+        if view:
+            graphviz.view(ruta_png)
+        return ruta_png
     except graphviz.backend.ExecutableNotFound:
         print("\n--- ERROR ---")
         print("Graphviz no encontrado en el PATH del sistema.")
         print("Asegúrate de haber instalado Graphviz y añadido su carpeta 'bin' a las variables de entorno.")
         print("El resultado se mostrará sin el gráfico.")
+        return None
+    finally:
+        # Igual que 'cleanup=True': se borra el archivo fuente.
+        os.remove(ruta_dot)
+
+def _ruta_de_salida(filename):
+    output_directory = os.path.join(os.path.dirname(__file__), 'temp_trees')
+    if not os.path.exists(output_directory):
+        os.makedirs(output_directory)
+    return os.path.join(output_directory, filename)
+
+def _registrar_error_de_dibujo(futuro):
+    # Callback del Future: si nadie consulta el resultado, un fallo de Graphviz
+    # (p. ej. CalledProcessError) no debe perderse en silencio.
+    if not futuro.cancelled() and futuro.exception() is not None:
+        _log.error("No se pudo dibujar el árbol.", exc_info=futuro.exception())
+
+def dibujar_arbol_async(root_node, filename='obst_tree', max_niveles=None, max_nodos=None,
+                        probabilidades=None, view=False):
+    """
+    Dibuja el árbol en un hilo de fondo y devuelve inmediatamente un Future con
+    la ruta del PNG (o None si no se pudo dibujar), sin bloquear a quien llama.
+    Los errores del dibujo se registran con `logging` aunque nadie consulte el
+    Future. Por defecto no abre el visor: hacerlo desde un hilo de fondo
+    abriría una ventana por cada análisis.
+
+    Los parámetros de límite son los mismos que en `generar_dot`.
+    """
+    if not root_node:
+        print("El árbol está vacío, no se puede dibujar.")
+        futuro = Future()
+        futuro.set_result(None)
+        return futuro
+
+    output_path = _ruta_de_salida(filename)
+    lineas = generar_dot(root_node, max_niveles=max_niveles, max_nodos=max_nodos,
+                         probabilidades=probabilidades)
+    futuro = _EJECUTOR_DIBUJO.submit(_renderizar_dot, lineas, output_path, view)
+    futuro.add_done_callback(_registrar_error_de_dibujo)
+    return futuro
+
+def abrir_imagen(ruta_png):
+    """
+    Abre una imagen ya renderizada con el visor del sistema. Debe llamarse desde
+    el hilo de la interfaz, no desde el hilo de dibujo.
+    """
+    import graphviz  # Se carga solo al mostrar: importarlo retrasa el arranque
+    graphviz.view(ruta_png)
+
+def dibujar_arbol(root_node, filename='obst_tree', max_niveles=None, max_nodos=None,
+                  probabilidades=None, view=True):
+    """
+    Dibuja un árbol binario usando Graphviz con alta resolución y lo muestra.
+    Es la versión bloqueante de `dibujar_arbol_async`.
+    """
+    ruta_png = dibujar_arbol_async(root_node, filename, max_niveles=max_niveles, max_nodos=max_nodos,
+                                   probabilidades=probabilidades, view=view).result()
+    if ruta_png:
+        print(f"Árbol de alta resolución guardado temporalmente y mostrado.")
+    return ruta_png
@@ -0,0 +1,236 @@
+# src/projects_management/code_index.py
+import hashlib
+import json
+import os
+from collections import namedtuple
+
+from ..utils.sqlite_wal import conectar, Lectura, Transaccion
+
+# Ruta de la base de datos del índice de código
+CODE_INDEX_DB_PATH = 'data/indice_codigo.db'
+
+# Extensiones de los archivos fuente que se indexan
+EXTENSIONES_CODIGO = ('.py',)
+
+# Carpetas que nunca contienen código fuente del proyecto
+CARPETAS_IGNORADAS = {'__pycache__', '.git', '.venv', 'venv', 'node_modules'}
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS archivos (
+    proyecto TEXT NOT NULL,
+    ruta TEXT NOT NULL,
+    tamano INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    tokens TEXT NOT NULL,
+    pesos TEXT NOT NULL,
+    generacion INTEGER NOT NULL,
+    PRIMARY KEY (proyecto, ruta)
+);
+CREATE INDEX IF NOT EXISTS archivos_por_generacion ON archivos (proyecto, generacion);
+CREATE TABLE IF NOT EXISTS eliminados (
+    proyecto TEXT NOT NULL,
+    ruta TEXT NOT NULL,
+    generacion INTEGER NOT NULL,
+    PRIMARY KEY (proyecto, ruta)
+);
+CREATE INDEX IF NOT EXISTS eliminados_por_generacion ON eliminados (proyecto, generacion);
+CREATE TABLE IF NOT EXISTS generaciones (
+    proyecto TEXT PRIMARY KEY,
+    generacion INTEGER NOT NULL
+);
+"""
+
+# Resultado de una indexación: rutas relativas agregadas, modificadas y eliminadas.
+CambiosIndice = namedtuple('CambiosIndice', ['generacion', 'agregados', 'modificados', 'eliminados'])
+
+
+def _recorrer_codigo(ruta_codigo, extensiones):
+    """
+    Genera (ruta relativa con '/', ruta absoluta) de cada archivo fuente.
+    """
+    for raiz, carpetas, archivos in os.walk(ruta_codigo):
+        carpetas[:] = sorted(c for c in carpetas if c not in CARPETAS_IGNORADAS and not c.startswith('.'))
+        for nombre in sorted(archivos):
+            if nombre.endswith(extensiones):
+                ruta = os.path.join(raiz, nombre)
+                yield os.path.relpath(ruta, ruta_codigo).replace(os.sep, '/'), ruta
+
+
+def instantanea_de_carpeta(ruta_codigo, extensiones=EXTENSIONES_CODIGO):
+    """
+    Devuelve {ruta relativa: (tamaño, mtime_ns)} de los archivos fuente, solo
+    con `stat` (sin leerlos). Sirve para detectar barato si algo cambió.
+    """
+    instantanea = {}
+    for ruta, ruta_absoluta in _recorrer_codigo(ruta_codigo, tuple(extensiones)):
+        try:
+            info = os.stat(ruta_absoluta)
+        except FileNotFoundError:
+            continue
+        instantanea[ruta] = (info.st_size, info.st_mtime_ns)
+    return instantanea
+
+
+class IndiceCodigo:
+    """
+    Índice incremental de los archivos fuente de cada proyecto.
+
+    Guarda por archivo su tamaño, mtime, hash SHA-256 y los tokens normalizados
+    (con sus pesos) que usa `CodeComparator`. Al reindexar, un archivo con el
+    mismo tamaño y mtime no se vuelve a leer, y uno leído cuyo hash no cambió
+    no se vuelve a tokenizar. Cada indexación que encuentra cambios avanza la
+    generación del proyecto, así que "qué cambió desde la ejecución N" es una
+    consulta por índice proporcional al número de archivos cambiados.
+    """
+    def __init__(self, ruta_db=CODE_INDEX_DB_PATH, extensiones=EXTENSIONES_CODIGO, pesos=None):
+        """
+        :param ruta_db: Ruta del archivo SQLite (se crea si no existe)
+        :param extensiones: Extensiones de archivo que se indexan
+        :param pesos: Pesos por tipo de token (por defecto, los de `CodeComparator`)
+        """
+        from ..lcs_detector.comparator import DEFAULT_TOKEN_WEIGHTS
+        from ..lcs_detector.tokenizer import RegexTokenizer, TOKEN_DEFINITIONS
+
+        self.extensiones = tuple(extensiones)
+        self.pesos = pesos if pesos else DEFAULT_TOKEN_WEIGHTS
+        self._tokenizer = RegexTokenizer(TOKEN_DEFINITIONS)
+        self._conexion = conectar(ruta_db)
+        self._conexion.executescript(_ESQUEMA)
+
+    def generacion(self, proyecto):
+        """
+        :return: Generación actual del índice del proyecto (0 si nunca se indexó).
+        """
+        with Lectura(self._conexion) as conexion:
+            fila = conexion.execute(
+                "SELECT generacion FROM generaciones WHERE proyecto = ?", (proyecto,)
+            ).fetchone()
+        return fila[0] if fila else 0
+
+    def indexar(self, proyecto, ruta_codigo):
+        """
+        Actualiza el índice del proyecto con el estado actual de su carpeta.
+
+        Se hace un `stat` por archivo; solo se leen y hashean los que cambiaron
+        de tamaño o mtime, y solo se tokenizan los que cambiaron de contenido.
+
+        :return: CambiosIndice con la nueva generación y las rutas relativas
+                 agregadas, modificadas y eliminadas.
+        """
+        with Lectura(self._conexion) as conexion:
+            previos = {
+                ruta: (tamano, mtime_ns, hash_)
+                for ruta, tamano, mtime_ns, hash_ in conexion.execute(
+                    "SELECT ruta, tamano, mtime_ns, hash FROM archivos WHERE proyecto = ?", (proyecto,)
+                )
+            }
+        agregados, modificados, solo_stat, nuevos = [], [], [], []
+        vistos = set()
+        for ruta, ruta_absoluta in _recorrer_codigo(ruta_codigo, self.extensiones):
+            try:
+                info = os.stat(ruta_absoluta)
+            except FileNotFoundError:
+                continue  # Se borró durante el recorrido
+            vistos.add(ruta)
+            previo = previos.get(ruta)
+            if previo and previo[0] == info.st_size and previo[1] == info.st_mtime_ns:
+                continue
+            with open(ruta_absoluta, 'rb') as archivo:
+                contenido = archivo.read()
+            hash_ = hashlib.sha256(contenido).hexdigest()
+            if previo and previo[2] == hash_:
+                solo_stat.append((info.st_size, info.st_mtime_ns, proyecto, ruta))
+                continue
+            tokens, pesos = self._tokenizer.tokenize_and_normalize(
+                contenido.decode('utf-8', errors='replace'), self.pesos
+            )
+            nuevos.append((proyecto, ruta, info.st_size, info.st_mtime_ns, hash_,
+                           json.dumps(tokens), json.dumps(pesos)))
+            (modificados if previo else agregados).append(ruta)
+        eliminados = sorted(set(previos) - vistos)
+
+        with Transaccion(self._conexion) as cursor:
+            generacion = self.generacion(proyecto)
+            if nuevos or eliminados:
+                generacion += 1
+                cursor.execute(
+                    "INSERT INTO generaciones (proyecto, generacion) VALUES (?, ?) "
+                    "ON CONFLICT(proyecto) DO UPDATE SET generacion = excluded.generacion",
+                    (proyecto, generacion)
+                )
+            cursor.executemany(
+                "UPDATE archivos SET tamano = ?, mtime_ns = ? WHERE proyecto = ? AND ruta = ?", solo_stat
+            )
+            cursor.executemany(
+                "INSERT OR REPLACE INTO archivos "
+                "(proyecto, ruta, tamano, mtime_ns, hash, tokens, pesos, generacion) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [fila + (generacion,) for fila in nuevos]
+            )
+            cursor.executemany(
+                "DELETE FROM eliminados WHERE proyecto = ? AND ruta = ?",
+                [(proyecto, fila[1]) for fila in nuevos]
+            )
+            cursor.executemany(
+                "DELETE FROM archivos WHERE proyecto = ? AND ruta = ?",
+                [(proyecto, ruta) for ruta in eliminados]
+            )
+            cursor.executemany(
+                "INSERT OR REPLACE INTO eliminados (proyecto, ruta, generacion) VALUES (?, ?, ?)",
+                [(proyecto, ruta, generacion) for ruta in eliminados]
+            )
+        return CambiosIndice(generacion, agregados, modificados, eliminados)
+
+    def cambios_desde(self, proyecto, generacion):
+        """
+        Devuelve lo que cambió en el proyecto después de la generación indicada.
+
+        :return: Tupla (rutas agregadas o modificadas, rutas eliminadas)
+        """
+        with Lectura(self._conexion) as conexion:
+            cambiados = [fila[0] for fila in conexion.execute(
+                "SELECT ruta FROM archivos WHERE proyecto = ? AND generacion > ? ORDER BY ruta",
+                (proyecto, generacion)
+            )]
+            eliminados = [fila[0] for fila in conexion.execute(
+                "SELECT ruta FROM eliminados WHERE proyecto = ? AND generacion > ? ORDER BY ruta",
+                (proyecto, generacion)
+            )]
+        return cambiados, eliminados
+
+    def archivos(self, proyecto):
+        """
+        :return: Rutas relativas indexadas del proyecto, en orden.
+        """
+        with Lectura(self._conexion) as conexion:
+            return [fila[0] for fila in conexion.execute(
+                "SELECT ruta FROM archivos WHERE proyecto = ? ORDER BY ruta", (proyecto,)
+            )]
+
+    def tokens(self, proyecto, ruta):
+        """
+        :return: Tupla (tokens normalizados, pesos) del archivo, o None si no está indexado.
+        """
+        with Lectura(self._conexion) as conexion:
+            fila = conexion.execute(
+                "SELECT tokens, pesos FROM archivos WHERE proyecto = ? AND ruta = ?", (proyecto, ruta)
+            ).fetchone()
+        return (json.loads(fila[0]), json.loads(fila[1])) if fila else None
+
+    def eliminar_proyecto(self, proyecto):
+        """
+        Borra del índice todos los archivos del proyecto.
+        """
+        with Transaccion(self._conexion) as cursor:
+            for tabla in ('archivos', 'eliminados', 'generaciones'):
+                cursor.execute(f"DELETE FROM {tabla} WHERE proyecto = ?", (proyecto,))
+
+    def cerrar(self):
+        self._conexion.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
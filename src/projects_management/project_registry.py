@@ -0,0 +1,125 @@
+# src/projects_management/project_registry.py
+import json
+import os
+
+from .project_manager import Proyecto, PROJ_FILE_PATH
+from ..utils.sqlite_wal import conectar, Lectura, Transaccion
+
+# Ruta de la base de datos donde se almacenarán los proyectos
+REGISTRY_DB_PATH = 'data/proyectos.db'
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS proyectos (
+    id INTEGER PRIMARY KEY,
+    nombre TEXT NOT NULL UNIQUE,
+    ruta_codigo TEXT NOT NULL,
+    ruta_documento TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metadatos (
+    clave TEXT PRIMARY KEY,
+    valor TEXT NOT NULL
+);
+"""
+
+class RegistroProyectos:
+    """
+    Registro de proyectos sobre SQLite en modo WAL.
+
+    El índice único sobre `nombre` da búsquedas O(log n) por nombre y hace que
+    registrar sea un upsert atómico; cada operación es una transacción, así
+    que varios procesos pueden escribir a la vez sin corromper el registro (a
+    diferencia de reescribir `proyectos.json` completo).
+    """
+    def __init__(self, ruta_db=REGISTRY_DB_PATH, ruta_json=PROJ_FILE_PATH):
+        """
+        :param ruta_db: Ruta del archivo SQLite (se crea si no existe)
+        :param ruta_json: Archivo JSON heredado que se importa la primera vez
+        """
+        self._conexion = conectar(ruta_db)
+        self._conexion.executescript(_ESQUEMA)
+        if ruta_json:
+            self.importar_json(ruta_json)
+
+    def importar_json(self, ruta_json):
+        """
+        Importa los proyectos del archivo JSON heredado una sola vez: la marca se
+        guarda en la misma transacción, así que las siguientes aperturas no lo
+        vuelven a leer. Si el JSON tiene nombres repetidos se conserva el primero.
+
+        :return: Número de proyectos importados
+        """
+        with self._transaccion() as cursor:
+            if cursor.execute("SELECT 1 FROM metadatos WHERE clave = 'json_importado'").fetchone():
+                return 0
+            importados = 0
+            if os.path.exists(ruta_json):
+                with open(ruta_json, 'r') as file:
+                    proyectos_data = json.load(file)
+                for data in proyectos_data:
+                    cursor.execute(
+                        "INSERT OR IGNORE INTO proyectos (nombre, ruta_codigo, ruta_documento) VALUES (?, ?, ?)",
+                        (data['nombre'], data['ruta_codigo'], data['ruta_documento'])
+                    )
+                    importados += cursor.rowcount
+            cursor.execute("INSERT INTO metadatos (clave, valor) VALUES ('json_importado', ?)", (ruta_json,))
+            return importados
+
+    def _transaccion(self):
+        return Transaccion(self._conexion)
+
+    def guardar(self, nombre, ruta_codigo, ruta_documento):
+        """
+        Registra un proyecto o, si ya existe uno con ese nombre, actualiza sus rutas.
+
+        :return: True si el proyecto es nuevo, False si se actualizó uno existente.
+        """
+        with self._transaccion() as cursor:
+            existia = cursor.execute("SELECT 1 FROM proyectos WHERE nombre = ?", (nombre,)).fetchone()
+            cursor.execute(
+                "INSERT INTO proyectos (nombre, ruta_codigo, ruta_documento) VALUES (?, ?, ?) "
+                "ON CONFLICT(nombre) DO UPDATE SET "
+                "ruta_codigo = excluded.ruta_codigo, ruta_documento = excluded.ruta_documento",
+                (nombre, ruta_codigo, ruta_documento)
+            )
+            return existia is None
+
+    def obtener(self, nombre):
+        """
+        :return: El Proyecto con ese nombre, o None si no existe.
+        """
+        with Lectura(self._conexion) as conexion:
+            fila = conexion.execute(
+                "SELECT nombre, ruta_codigo, ruta_documento FROM proyectos WHERE nombre = ?", (nombre,)
+            ).fetchone()
+        return Proyecto(*fila) if fila else None
+
+    def listar(self):
+        """
+        :return: Lista de objetos Proyecto en orden de registro.
+        """
+        with Lectura(self._conexion) as conexion:
+            filas = conexion.execute(
+                "SELECT nombre, ruta_codigo, ruta_documento FROM proyectos ORDER BY id"
+            ).fetchall()
+        return [Proyecto(*fila) for fila in filas]
+
+    def eliminar(self, nombre):
+        """
+        :return: True si el proyecto existía y se eliminó, False en caso contrario.
+        """
+        with self._transaccion() as cursor:
+            cursor.execute("DELETE FROM proyectos WHERE nombre = ?", (nombre,))
+            return cursor.rowcount > 0
+
+    def __len__(self):
+        with Lectura(self._conexion) as conexion:
+            return conexion.execute("SELECT COUNT(*) FROM proyectos").fetchone()[0]
+
+    def cerrar(self):
+        self._conexion.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
@@ -0,0 +1,132 @@
+# src/utils/corpus_cache.py
+import gzip
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+
+from .probability_calculator import obtener_stopwords
+
+# Directorio por defecto de la caché y tamaño máximo en disco (en bytes).
+DIRECTORIO_CACHE = os.path.join('data', 'corpus_cache')
+TAM_MAXIMO_CACHE = 256 * 1024 * 1024
+
+# Se incrementa si cambia el formato de las entradas o la limpieza de tokens.
+VERSION_FORMATO = 1
+
+# Un temporal más antiguo que esto (en segundos) es de un escritor que se
+# interrumpió a medias y se elimina al desalojar.
+ANTIGUEDAD_TEMPORAL = 3600
+
+
+class CorpusCache:
+    """
+    Caché en disco del texto extraído de cada PDF y del conteo completo de sus
+    palabras limpias, para no volver a leer ni tokenizar el mismo documento.
+
+    Las entradas se identifican por el hash SHA-256 del contenido del PDF (no
+    por su ruta) y por una versión que depende de la lista de stopwords: si
+    esta cambia, las entradas antiguas dejan de coincidir y acaban desalojadas.
+    Cuando el directorio supera `tam_maximo` bytes se eliminan primero las
+    entradas usadas hace más tiempo (LRU según la fecha de modificación).
+    """
+    def __init__(self, directorio=DIRECTORIO_CACHE, tam_maximo=TAM_MAXIMO_CACHE, stop_words=None):
+        self.directorio = directorio
+        self.tam_maximo = tam_maximo
+        palabras = sorted(stop_words if stop_words is not None else obtener_stopwords())
+        huella = hashlib.sha256(f"{VERSION_FORMATO}\n{chr(10).join(palabras)}".encode('utf-8'))
+        self.version = huella.hexdigest()[:16]
+        os.makedirs(directorio, exist_ok=True)
+
+    @staticmethod
+    def hash_de_archivo(ruta):
+        """
+        Calcula el SHA-256 del contenido del archivo leyéndolo por bloques.
+        """
+        sha = hashlib.sha256()
+        with open(ruta, 'rb') as archivo:
+            for bloque in iter(lambda: archivo.read(1 << 20), b''):
+                sha.update(bloque)
+        return sha.hexdigest()
+
+    def _ruta_entrada(self, hash_pdf):
+        return os.path.join(self.directorio, f"{hash_pdf}-{self.version}.json.gz")
+
+    def obtener(self, ruta_pdf, hash_pdf=None):
+        """
+        :param hash_pdf: SHA-256 del PDF si ya se calculó (evita volver a leerlo)
+        :return: Tupla (texto, Counter de palabras) si el PDF está en caché, o None.
+        """
+        ruta_entrada = self._ruta_entrada(hash_pdf or self.hash_de_archivo(ruta_pdf))
+        try:
+            with gzip.open(ruta_entrada, 'rt', encoding='utf-8') as archivo:
+                entrada = json.load(archivo)
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+        try:
+            os.utime(ruta_entrada)  # Marca la entrada como usada recientemente
+        except FileNotFoundError:
+            pass  # Otro proceso la desalojó después de leerla; el contenido ya es válido
+        return entrada["texto"], Counter(entrada["conteo"])
+
+    def guardar(self, ruta_pdf, texto, conteo_palabras, hash_pdf=None):
+        """
+        Guarda el texto (comprimido) y el conteo de palabras del PDF y aplica la
+        política de desalojo.
+
+        :param hash_pdf: SHA-256 del PDF si ya se calculó (evita volver a leerlo)
+        """
+        ruta_entrada = self._ruta_entrada(hash_pdf or self.hash_de_archivo(ruta_pdf))
+        temporal = f"{ruta_entrada}.{os.getpid()}.tmp"
+        try:
+            with gzip.open(temporal, 'wt', encoding='utf-8') as archivo:
+                json.dump({"texto": texto, "conteo": dict(conteo_palabras)}, archivo, ensure_ascii=False)
+            # Reemplazo atómico: otro proceso nunca ve una entrada a medio escribir.
+            os.replace(temporal, ruta_entrada)
+        except BaseException:
+            try:
+                os.remove(temporal)
+            except FileNotFoundError:
+                pass
+            raise
+        self._desalojar(conservar=ruta_entrada)
+
+    def _desalojar(self, conservar=None):
+        # La entrada recién escrita nunca se desaloja, aunque sola supere el límite.
+        # Los temporales abandonados (de escritores que terminaron a medias) no
+        # cuentan para el LRU y se borran al pasar ANTIGUEDAD_TEMPORAL.
+        entradas = []
+        limite_temporal = time.time_ns() - ANTIGUEDAD_TEMPORAL * 1_000_000_000
+        for nombre in os.listdir(self.directorio):
+            if not nombre.endswith(('.json.gz', '.tmp')):
+                continue
+            ruta = os.path.join(self.directorio, nombre)
+            try:
+                info = os.stat(ruta)
+                if nombre.endswith('.tmp'):
+                    if info.st_mtime_ns < limite_temporal:
+                        os.remove(ruta)
+                    continue
+            except FileNotFoundError:
+                continue
+            entradas.append((info.st_mtime_ns, info.st_size, ruta))
+        total = sum(tam for _, tam, _ in entradas)
+        for _, tam, ruta in sorted(entradas):
+            if total <= self.tam_maximo:
+                break
+            if ruta == conservar:
+                continue
+            try:
+                os.remove(ruta)
+            except FileNotFoundError:
+                pass
+            total -= tam
+
+    def limpiar(self):
+        """
+        Elimina todas las entradas de la caché.
+        """
+        for nombre in os.listdir(self.directorio):
+            if nombre.endswith('.json.gz'):
+                os.remove(os.path.join(self.directorio, nombre))
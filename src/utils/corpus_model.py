@@ -0,0 +1,93 @@
+# src/utils/corpus_model.py
+import os
+from collections import Counter
+from multiprocessing import Pool
+
+from .probability_calculator import conteo_de_documento, probabilidades_desde_conteo
+
+
+def _contar_documento(args):
+    """
+    Tarea de un proceso trabajador (fase map): conteo de palabras de un PDF.
+    """
+    ruta_pdf, cache = args
+    return ruta_pdf, conteo_de_documento(ruta_pdf, cache=cache)
+
+
+class ModeloCorpus:
+    """
+    Modelo de probabilidades sobre un corpus de varios documentos.
+
+    Cada documento se cuenta por separado (en paralelo con un grupo de procesos)
+    y los Counter se combinan en un conteo total (fase reduce). Como se guarda
+    el conteo de cada documento, agregar o quitar uno solo ajusta el total, sin
+    volver a contar los demás.
+    """
+    def __init__(self, procesos=None, cache=None):
+        """
+        :param procesos: Número de procesos para contar documentos (por defecto, os.cpu_count())
+        :param cache: Instancia opcional de `CorpusCache` que comparten los trabajadores
+        """
+        self.procesos = procesos or os.cpu_count() or 1
+        self.cache = cache
+        self._conteos = {}  # ruta -> Counter del documento
+        self.total = Counter()
+
+    def __len__(self):
+        return len(self._conteos)
+
+    def __contains__(self, ruta_pdf):
+        return ruta_pdf in self._conteos
+
+    @property
+    def documentos(self):
+        return list(self._conteos)
+
+    def agregar_documentos(self, rutas_pdf):
+        """
+        Cuenta los documentos indicados y los suma al total. Un documento que ya
+        estaba se vuelve a contar (por si cambió) y reemplaza a su versión anterior.
+        """
+        pendientes = list(dict.fromkeys(rutas_pdf))
+        if not pendientes:
+            return
+        tareas = [(ruta, self.cache) for ruta in pendientes]
+        procesos = min(self.procesos, len(tareas))
+        if procesos <= 1:
+            self._combinar(map(_contar_documento, tareas))
+        else:
+            with Pool(procesos) as pool:
+                # Los conteos se combinan a medida que llegan.
+                self._combinar(pool.imap_unordered(_contar_documento, tareas))
+
+    def agregar_documento(self, ruta_pdf):
+        self.agregar_documentos([ruta_pdf])
+
+    def _combinar(self, resultados):
+        for ruta_pdf, conteo in resultados:
+            self.eliminar_documento(ruta_pdf)
+            self._conteos[ruta_pdf] = conteo
+            self.total.update(conteo)
+
+    def eliminar_documento(self, ruta_pdf):
+        """
+        Resta del total el conteo del documento.
+
+        :return: True si el documento formaba parte del corpus, False en caso contrario.
+        """
+        conteo = self._conteos.pop(ruta_pdf, None)
+        if conteo is None:
+            return False
+        self.total.subtract(conteo)
+        for palabra in conteo:
+            if self.total[palabra] <= 0:
+                del self.total[palabra]
+        return True
+
+    def probabilidades(self, top_n=50, prob_exito_total=0.85, distribucion_q='huecos'):
+        """
+        Construye un único modelo p/q para un OBST sobre todo el corpus.
+
+        :return: Tupla (claves ordenadas, p, q), como `obtener_probabilidades_de_documento`
+        """
+        return probabilidades_desde_conteo(self.total, top_n, prob_exito_total, distribucion_q)
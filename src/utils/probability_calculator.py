@@ -1,78 +1,218 @@
-import PyPDF2
 import re
 from collections import Counter
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+
+# PyPDF2 y NLTK se importan dentro de las funciones que los usan: cargarlos
+# cuesta cientos de milisegundos y muchos usos del sistema (listar proyectos,
+# comparar código) nunca los necesitan.
 
 # --- Asegúrate de haber descargado los recursos de NLTK ---
 # import nltk
 # nltk.download('stopwords')
 # nltk.download('punkt')
 
-def extraer_texto_pdf(ruta_pdf):
-    # (Esta función no cambia)
+# Páginas que extrae cada tarea en el modo con procesos: bloques grandes
+# amortizan el costo de abrir el PDF en cada trabajador.
+PAGINAS_POR_BLOQUE = 16
+
+def _extraer_rango_de_paginas(args):
+    """
+    Tarea de un proceso trabajador: abre el PDF y extrae las páginas [inicio, fin).
+    """
+    import PyPDF2
+
+    ruta_pdf, inicio, fin = args
     with open(ruta_pdf, 'rb') as file:
         lector_pdf = PyPDF2.PdfReader(file)
-        texto = ""
-        for page in lector_pdf.pages:
-            texto += page.extract_text() or ""
-    return texto
+        return [lector_pdf.pages[i].extract_text() or "" for i in range(inicio, fin)]
 
-def generar_terminos_dinamicamente(texto, top_n=50):
-    # (Esta función no cambia, pero el resultado será diferente con las stopwords correctas)
-    
-    # Usar stopwords en español
-    stop_words = set(stopwords.words('spanish'))
+def iterar_paginas_pdf(ruta_pdf, procesos=None):
+    """
+    Genera el texto de cada página del PDF de forma perezosa, en orden.
+
+    :param ruta_pdf: Ruta del archivo PDF
+    :param procesos: Si es mayor que 1, los rangos de páginas se extraen en
+                     paralelo con ese número de procesos (útil en libros de
+                     cientos de páginas); por defecto se lee página a página.
+    """
+    import PyPDF2
 
-    tokens = word_tokenize(texto.lower())
-    palabras_limpias = [
-        palabra for palabra in tokens 
-        if palabra.isalpha() and len(palabra) > 2 and palabra not in stop_words
+    with open(ruta_pdf, 'rb') as file:
+        lector_pdf = PyPDF2.PdfReader(file)
+        if not procesos or procesos <= 1:
+            for page in lector_pdf.pages:
+                yield page.extract_text() or ""
+            return
+        num_paginas = len(lector_pdf.pages)
+
+    from multiprocessing import Pool
+    rangos = [
+        (ruta_pdf, inicio, min(inicio + PAGINAS_POR_BLOQUE, num_paginas))
+        for inicio in range(0, num_paginas, PAGINAS_POR_BLOQUE)
     ]
-    conteo_palabras = Counter(palabras_limpias)
+    with Pool(procesos) as pool:
+        # imap conserva el orden de las páginas y entrega cada bloque en
+        # cuanto está listo.
+        for paginas in pool.imap(_extraer_rango_de_paginas, rangos):
+            yield from paginas
+
+def extraer_texto_pdf(ruta_pdf, procesos=None):
+    """
+    Devuelve el texto completo del PDF. Une las páginas con un solo `join`
+    en lugar de concatenar en un bucle (que copia el texto una y otra vez).
+    """
+    return "".join(iterar_paginas_pdf(ruta_pdf, procesos))
+
+def obtener_stopwords():
+    """
+    Devuelve el conjunto de stopwords en español que se filtran de los términos.
+    """
+    from nltk.corpus import stopwords
+
+    return set(stopwords.words('spanish'))
+
+def contar_palabras(fuente):
+    """
+    Cuenta las palabras relevantes (alfabéticas, de más de 2 letras y que no
+    son stopwords en español) de un texto o de un iterable de páginas, que se
+    tokenizan una a una sin construir nunca el texto completo.
+
+    :param fuente: Cadena de texto o iterable de cadenas (p. ej. `iterar_paginas_pdf`)
+    :return: Counter con la frecuencia de cada palabra en minúsculas
+    """
+    from nltk.tokenize import word_tokenize
+
+    if isinstance(fuente, str):
+        fuente = (fuente,)
+    stop_words = obtener_stopwords()
+    conteo_palabras = Counter()
+    for fragmento in fuente:
+        conteo_palabras.update(
+            palabra for palabra in word_tokenize(fragmento.lower())
+            if palabra.isalpha() and len(palabra) > 2 and palabra not in stop_words
+        )
+    return conteo_palabras
+
+def generar_terminos_dinamicamente(texto, top_n=50):
+    """
+    Devuelve, ordenados alfabéticamente, los `top_n` términos más frecuentes.
+
+    :param texto: Cadena de texto, iterable de páginas o un Counter ya calculado
+                  (p. ej. el de `conteo_de_documento`, que puede venir de caché)
+    """
+    conteo_palabras = texto if isinstance(texto, Counter) else contar_palabras(texto)
     terminos_comunes = conteo_palabras.most_common(top_n)
     terminos_clave = sorted([termino for termino, freq in terminos_comunes])
     
     return terminos_clave
 
-def obtener_probabilidades_de_documento(ruta_pdf, top_n=50, prob_exito_total=0.85):
+def frecuencias_por_regex(texto, terminos):
     """
-    Proceso completo y corregido.
+    Cuenta cada término en el texto con una expresión regular de palabra
+    completa. Recorre el texto una vez por término, así que solo se conserva
+    para verificar los conteos de `contar_palabras`.
     """
-    texto = extraer_texto_pdf(ruta_pdf)
-    terminos_clave_ordenados = generar_terminos_dinamicamente(texto, top_n)
-    
-    if not terminos_clave_ordenados:
+    texto_lower = texto.lower()
+    return [len(re.findall(r'\b' + re.escape(term) + r'\b', texto_lower)) for term in terminos]
+
+def masa_de_huecos(conteo_palabras, claves_ordenadas):
+    """
+    Suma la frecuencia de las palabras del vocabulario que no son claves según
+    el hueco en que caen: el hueco i queda entre la clave i y la i+1 (el 0 antes
+    de la primera y el n después de la última). Se calcula con una sola mezcla
+    del vocabulario ordenado con las claves ordenadas.
+
+    :return: Lista de n + 1 frecuencias
+    """
+    masas = [0] * (len(claves_ordenadas) + 1)
+    i = 0
+    for palabra in sorted(conteo_palabras):
+        while i < len(claves_ordenadas) and claves_ordenadas[i] < palabra:
+            i += 1
+        if i < len(claves_ordenadas) and claves_ordenadas[i] == palabra:
+            continue
+        masas[i] += conteo_palabras[palabra]
+    return masas
+
+def probabilidades_desde_conteo(conteo_palabras, top_n=50, prob_exito_total=0.85, distribucion_q='huecos'):
+    """
+    Calcula las claves ordenadas y los vectores p y q a partir de un conteo ya
+    hecho, sin volver a recorrer el texto.
+
+    :param conteo_palabras: Counter de palabras (p. ej. el de `contar_palabras`)
+    :param top_n: Número de términos más frecuentes que se usan como claves
+    :param prob_exito_total: Probabilidad total repartida entre las claves
+    :param distribucion_q: 'huecos' reparte la probabilidad de fallo según la
+                           frecuencia de las palabras que no son claves y caen en
+                           cada hueco (con suavizado de Laplace); 'uniforme' la
+                           reparte por igual entre los n + 1 huecos.
+    :return: Tupla (claves ordenadas, p, q)
+    """
+    if distribucion_q not in ('huecos', 'uniforme'):
+        raise ValueError("distribucion_q debe ser 'huecos' o 'uniforme'.")
+    terminos_comunes = conteo_palabras.most_common(top_n)
+    if not terminos_comunes:
         print("Advertencia: No se encontraron términos clave relevantes.")
         return [], [], []
 
-    texto_lower = texto.lower()
-    frecuencias = [len(re.findall(r'\b' + re.escape(term) + r'\b', texto_lower)) for term in terminos_clave_ordenados]
-    #print(frecuencias)
-
+    terminos_comunes.sort()
+    terminos_clave_ordenados = [termino for termino, freq in terminos_comunes]
+    frecuencias = [freq for termino, freq in terminos_comunes]
     total_frecuencia = sum(frecuencias)
-    #print(total_frecuencia)
 
-    if total_frecuencia == 0:
-        print("Advertencia: Los términos clave no aparecen en el texto.")
-        return terminos_clave_ordenados, [], []
-
-    # CORRECCIÓN 2: Lógica de probabilidad revisada
     # 1. Calcular frecuencias relativas (cuya suma es 1)
-    frecuencias_relativas = [f / total_frecuencia for f in frecuencias]
-    #print(frecuencias_relativas)
-
     # 2. Escalar estas frecuencias para que sumen `prob_exito_total`
-    p = [freq * prob_exito_total for freq in frecuencias_relativas]
+    p = [freq / total_frecuencia * prob_exito_total for freq in frecuencias]
     
     # 3. Distribuir la probabilidad restante (1 - prob_exito_total) entre los q's
     prob_fallo_total = 1 - prob_exito_total
     n = len(terminos_clave_ordenados)
-    q_val = prob_fallo_total / (n + 1)
-    q = [q_val] * (n + 1)
+    if distribucion_q == 'huecos':
+        # Se suma 1 a cada hueco para que ninguno quede con probabilidad cero.
+        masas = [m + 1 for m in masa_de_huecos(conteo_palabras, terminos_clave_ordenados)]
+        total_masa = sum(masas)
+        q = [m / total_masa * prob_fallo_total for m in masas]
+    else:
+        q_val = prob_fallo_total / (n + 1)
+        q = [q_val] * (n + 1)
     
     return terminos_clave_ordenados, p, q
 
+def conteo_de_documento(ruta_pdf, procesos=None, cache=None):
+    """
+    Devuelve el Counter de palabras limpias del PDF.
+
+    Sin caché las páginas se cuentan en streaming. Con una `CorpusCache`, un
+    acierto evita leer y tokenizar el documento; en un fallo se guardan el
+    texto y el conteo para la próxima vez.
+
+    :param procesos: Número de procesos para extraer las páginas (ver `iterar_paginas_pdf`)
+    :param cache: Instancia opcional de `CorpusCache`
+    """
+    if cache is None:
+        return contar_palabras(iterar_paginas_pdf(ruta_pdf, procesos))
+    hash_pdf = cache.hash_de_archivo(ruta_pdf)  # Una sola lectura para buscar y guardar
+    encontrado = cache.obtener(ruta_pdf, hash_pdf)
+    if encontrado is not None:
+        return encontrado[1]
+    paginas = list(iterar_paginas_pdf(ruta_pdf, procesos))
+    conteo_palabras = contar_palabras(paginas)
+    cache.guardar(ruta_pdf, "".join(paginas), conteo_palabras, hash_pdf)
+    return conteo_palabras
+
+def obtener_probabilidades_de_documento(ruta_pdf, top_n=50, prob_exito_total=0.85, procesos=None, cache=None,
+                                        distribucion_q='huecos'):
+    """
+    Proceso completo en una sola pasada: las páginas del PDF se tokenizan a
+    medida que se extraen y del mismo conteo salen las claves, sus
+    frecuencias y los vectores p y q.
+
+    :param procesos: Número de procesos para extraer las páginas (ver `iterar_paginas_pdf`)
+    :param cache: Instancia opcional de `CorpusCache` con el conteo del documento
+    :param distribucion_q: Reparto de la probabilidad de fallo (ver `probabilidades_desde_conteo`)
+    """
+    conteo_palabras = conteo_de_documento(ruta_pdf, procesos, cache)
+    return probabilidades_desde_conteo(conteo_palabras, top_n, prob_exito_total, distribucion_q)
+
 # --- Ejemplo de uso ---
 # terminos, p, q = obtener_probabilidades_de_documento('C:/Users/DELL/OneDrive/Escritorio/Algoritmica II/Trabajo primer parcial.pdf')
 
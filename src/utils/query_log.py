@@ -0,0 +1,268 @@
+# src/utils/query_log.py
+import threading
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+
+from ..obst.obst import optimal_bst, reconstruir_arbol
+from .search_engine import search_tree, costo_esperado_arbol
+
+# Un único hilo de fondo: las reconstrucciones se encolan en lugar de competir.
+_EJECUTOR_RECONSTRUCCION = ThreadPoolExecutor(max_workers=1, thread_name_prefix='reconstruir_obst')
+
+# Cuando la escala del decaimiento supera este valor se renormalizan los pesos
+# para no desbordar los flotantes.
+_ESCALA_MAXIMA = 1e100
+
+
+def _costo_optimo(p, q):
+    """
+    Costo esperado del OBST para p y q (mismo valor que `optimal_bst`) con la
+    cota de monotonía de Knuth, raiz[i][j-1] <= raiz[i][j] <= raiz[i+1][j],
+    que reduce el trabajo total a O(n²). Solo calcula el costo, sin la tabla
+    de raíces completa que necesita la reconstrucción del árbol.
+    """
+    n = len(p)
+    ancho = n + 2
+    # Tablas planas indexadas como [i * ancho + j], con i en 1..n+1 y j en 0..n.
+    costo = [0.0] * (ancho * ancho)
+    peso = [0.0] * (ancho * ancho)
+    raiz = [0] * (ancho * ancho)
+    for i in range(1, n + 2):
+        costo[i * ancho + i - 1] = peso[i * ancho + i - 1] = q[i - 1]
+    for longitud in range(1, n + 1):
+        for i in range(1, n - longitud + 2):
+            j = i + longitud - 1
+            ij = i * ancho + j
+            peso[ij] = peso[ij - 1] + p[j - 1] + q[j]
+            desde = raiz[ij - 1] if longitud > 1 else i
+            hasta = raiz[ij + ancho] if longitud > 1 else i
+            mejor, mejor_r = float('inf'), desde
+            for r in range(desde, hasta + 1):
+                c = costo[i * ancho + r - 1] + costo[(r + 1) * ancho + j]
+                if c < mejor:
+                    mejor, mejor_r = c, r
+            costo[ij] = mejor + peso[ij]
+            raiz[ij] = mejor_r
+    return costo[ancho + n]
+
+
+class RegistroConsultas:
+    """
+    Registro compacto de las búsquedas realizadas sobre un conjunto de claves
+    ordenadas, con estimaciones de p y q que decaen exponencialmente.
+
+    Cada consulta se guarda como un evento entero en un búfer circular: i para
+    un acierto en la clave k_{i+1} y n + j para un fallo en el hueco d_j. Los
+    pesos no se multiplican por el decaimiento en cada consulta: cada evento
+    nuevo suma una escala que crece como 1/decaimiento, lo que equivale a que
+    un evento de hace t consultas pese decaimiento^t.
+    """
+    def __init__(self, claves, p=None, q=None, decaimiento=0.999, capacidad=100000, peso_previo=100.0):
+        """
+        :param claves: Claves ordenadas
+        :param p: Probabilidades previas de las claves (opcional)
+        :param q: Probabilidades previas de los huecos (opcional)
+        :param decaimiento: Factor por consulta (0 < decaimiento <= 1)
+        :param capacidad: Número de eventos recientes que conserva el registro
+        :param peso_previo: Cuántas consultas "vale" la distribución previa
+        """
+        if not 0 < decaimiento <= 1:
+            raise ValueError("El decaimiento debe estar en (0, 1].")
+        self.claves = list(claves)
+        n = len(self.claves)
+        self.decaimiento = decaimiento
+        self._pesos_p = array('d', ((x * peso_previo for x in p) if p is not None else [0.0] * n))
+        self._pesos_q = array('d', ((x * peso_previo for x in q) if q is not None else [0.0] * (n + 1)))
+        self._escala = 1.0
+        self._eventos = array('i', [-1]) * capacidad
+        self._posicion = 0
+        self._total_consultas = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total_consultas(self):
+        with self._lock:
+            return self._total_consultas
+
+    def registrar(self, clave):
+        """
+        Registra una búsqueda, exitosa o fallida.
+
+        :return: True si la clave es una de las claves del registro.
+        """
+        acierto, _ = self.registrar_con_total(clave)
+        return acierto
+
+    def registrar_con_total(self, clave):
+        """
+        Registra una búsqueda y devuelve, leído dentro del mismo bloqueo, el
+        número total de consultas tras registrarla.
+
+        :return: Tupla (acierto, total de consultas).
+        """
+        n = len(self.claves)
+        i = bisect_left(self.claves, clave)
+        acierto = i < n and self.claves[i] == clave
+        with self._lock:
+            if acierto:
+                self._pesos_p[i] += self._escala
+                evento = i
+            else:
+                self._pesos_q[i] += self._escala
+                evento = n + i
+            if self._eventos:
+                self._eventos[self._posicion] = evento
+                self._posicion = (self._posicion + 1) % len(self._eventos)
+            self._total_consultas += 1
+            total = self._total_consultas
+            self._escala /= self.decaimiento
+            if self._escala > _ESCALA_MAXIMA:
+                for pesos in (self._pesos_p, self._pesos_q):
+                    for j in range(len(pesos)):
+                        pesos[j] /= self._escala
+                self._escala = 1.0
+        return acierto, total
+
+    def eventos_recientes(self):
+        """
+        Devuelve los eventos conservados, del más antiguo al más reciente.
+        """
+        with self._lock:
+            orden = self._eventos[self._posicion:] + self._eventos[:self._posicion]
+        return [evento for evento in orden if evento != -1]
+
+    def estimar(self):
+        """
+        :return: Tupla (p, q) normalizada para que p y q sumen 1 en conjunto, o
+                 (None, None) si todavía no hay ninguna información.
+        """
+        with self._lock:
+            p = list(self._pesos_p)
+            q = list(self._pesos_q)
+        total = sum(p) + sum(q)
+        if total == 0:
+            return None, None
+        return [x / total for x in p], [x / total for x in q]
+
+
+class OBSTAdaptativo:
+    """
+    OBST que se reconstruye en segundo plano según las búsquedas reales.
+
+    Cada `intervalo_revision` búsquedas se encola, en un hilo de fondo, una
+    revisión que compara el costo esperado del árbol actual, con las
+    probabilidades estimadas por el registro, contra el costo del OBST para esas
+    mismas probabilidades (calculado en O(n²) con la cota de Knuth, sin
+    construir el árbol). Así un cambio de entropía que no vuelve subóptimo al
+    árbol no dispara nada, y un árbol claramente subóptimo siempre se detecta.
+    Si el árbol actual es más de `umbral` (en proporción) peor que el óptimo,
+    ese mismo hilo ejecuta `optimal_bst` y la nueva raíz reemplaza a la
+    anterior con una sola asignación, así que las búsquedas en curso siguen
+    usando un árbol completo y nunca se bloquean.
+    """
+    def __init__(self, claves, p, q, umbral=0.05, intervalo_revision=1000, arbol_inicial=None,
+                 **opciones_registro):
+        """
+        :param claves: Claves ordenadas
+        :param p: Probabilidades iniciales de las claves
+        :param q: Probabilidades iniciales de los huecos
+        :param umbral: Regresión relativa del costo esperado que dispara la reconstrucción
+        :param intervalo_revision: Cada cuántas búsquedas se evalúa la regresión (0 = nunca)
+        :param arbol_inicial: Tupla opcional (raíz, costo) ya calculada con p y q
+        :param opciones_registro: Argumentos para `RegistroConsultas` (decaimiento, capacidad, ...)
+        """
+        self.claves = list(claves)
+        self.umbral = umbral
+        self.intervalo_revision = intervalo_revision
+        self.registro = RegistroConsultas(self.claves, p, q, **opciones_registro)
+        self.reconstrucciones = 0
+        self._futuro = None
+        self._lock = threading.Lock()
+        if arbol_inicial is None:
+            arbol_inicial = self._construir(p, q)
+        self._publicar(arbol_inicial[0])
+
+    def _construir(self, p, q):
+        costo, root_table = optimal_bst(self.claves, p, q)
+        return reconstruir_arbol(root_table, self.claves, 1, len(self.claves)), costo
+
+    def _publicar(self, raiz):
+        # Una sola asignación: las búsquedas en curso ven la raíz vieja o la nueva.
+        self._raiz = raiz
+
+    @property
+    def raiz(self):
+        return self._raiz
+
+    def buscar(self, clave):
+        """
+        Busca en el árbol vigente y registra la consulta. La revisión periódica
+        solo se encola en el hilo de fondo, así que la búsqueda sigue siendo O(log n).
+
+        :return: Tupla (found, depth) como `search_tree`.
+        """
+        resultado = search_tree(self._raiz, clave)
+        _, total = self.registro.registrar_con_total(clave)
+        if self.intervalo_revision and total % self.intervalo_revision == 0:
+            self.revisar()
+        return resultado
+
+    def regresion(self):
+        """
+        :return: Cuánto peor (en proporción) es el costo esperado del árbol vigente
+                 con las probabilidades actuales que el del OBST para ellas.
+        """
+        p, q = self.registro.estimar()
+        if p is None:
+            return 0.0
+        optimo = _costo_optimo(p, q)
+        if optimo <= 0:
+            return 0.0
+        return costo_esperado_arbol(self._raiz, p, q) / optimo - 1
+
+    def revisar(self):
+        """
+        Evalúa la regresión en segundo plano (cuesta O(n²)) y, si supera el
+        umbral, reconstruye el árbol en ese mismo hilo. Si ya hay una revisión
+        o reconstrucción en curso, no lanza otra y devuelve esa misma.
+
+        :return: Future que se resuelve con la nueva raíz, o con None si no hizo falta.
+        """
+        return self._lanzar(self._revisar)
+
+    def _revisar(self):
+        if self.regresion() <= self.umbral:
+            return None
+        return self._reconstruir()
+
+    def reconstruir(self):
+        """
+        Reconstruye el árbol en segundo plano con las probabilidades estimadas. Si
+        ya hay una revisión o reconstrucción en curso, devuelve esa misma.
+
+        :return: Future que se resuelve con la nueva raíz.
+        """
+        return self._lanzar(self._reconstruir)
+
+    def _lanzar(self, tarea):
+        with self._lock:
+            if self._futuro is not None and not self._futuro.done():
+                return self._futuro
+            self._futuro = _EJECUTOR_RECONSTRUCCION.submit(tarea)
+            return self._futuro
+
+    def _reconstruir(self):
+        p, q = self.registro.estimar()
+        raiz, _ = self._construir(p, q)
+        self._publicar(raiz)
+        self.reconstrucciones += 1
+        return raiz
+
+    def esperar_reconstruccion(self, timeout=None):
+        """
+        Bloquea hasta que termine la revisión o reconstrucción en curso (si la hay).
+        """
+        futuro = self._futuro
+        if futuro is not None:
+            futuro.result(timeout)
@@ -1,4 +1,6 @@
 # src/utils/search_engine.py
+from array import array
+from bisect import bisect_left, bisect_right
 
 def search_tree(root, key):
     """
@@ -20,3 +22,111 @@ def search_tree(root, key):
         else:
             current_node = current_node.right
     return False, -1  # Nodo no encontrado, devolver profundidad -1
+
+
+def costo_esperado_arbol(root, p, q, centinela=None):
+    """
+    Calcula el costo esperado exacto de búsqueda de cualquier árbol binario de
+    búsqueda (Node, AVLNode o RBNode), incluyendo las hojas ficticias d_0..d_n.
+
+    El recorrido inorden de un BST alterna hojas ficticias y claves
+    (d_0, k_1, d_1, ..., k_n, d_n), así que un único recorrido iterativo basta
+    para asignar a cada clave su p y a cada hueco su q. El resultado es
+    comparable directamente con el costo que devuelve `optimal_bst`.
+
+    :param root: Raíz del árbol
+    :param p: Probabilidades de búsqueda exitosa, en el orden de las claves
+    :param q: Probabilidades de búsqueda fallida (q_0, ..., q_n)
+    :param centinela: Nodo que representa a los hijos vacíos (p. ej. `RedBlackTree.TNULL`)
+    :return: Costo esperado sum(p_i * prof(k_i)) + sum(q_i * prof(d_i)),
+             contando la raíz como profundidad 1.
+    """
+    n = len(p)
+    if len(q) != n + 1:
+        raise ValueError("q debe tener exactamente len(p) + 1 elementos.")
+
+    costo = 0.0
+    i_clave = 0  # Claves visitadas hasta ahora (índice de la siguiente p)
+    i_hueco = 0  # Hojas ficticias visitadas hasta ahora (índice de la siguiente q)
+
+    # Pila de (nodo, profundidad) para el recorrido inorden iterativo.
+    pila = []
+    nodo, profundidad = root, 1
+    while True:
+        # Descender por la izquierda; el hijo vacío al final es una hoja ficticia.
+        while nodo is not None and nodo is not centinela:
+            pila.append((nodo, profundidad))
+            nodo = nodo.left
+            profundidad += 1
+        if i_hueco > n:
+            raise ValueError("El árbol tiene más claves que probabilidades en p.")
+        costo += q[i_hueco] * profundidad
+        i_hueco += 1
+
+        if not pila:
+            break
+        nodo, profundidad = pila.pop()
+        if i_clave >= n:
+            raise ValueError("El árbol tiene más claves que probabilidades en p.")
+        costo += p[i_clave] * profundidad
+        i_clave += 1
+        nodo = nodo.right
+        profundidad += 1
+
+    if i_clave != n:
+        raise ValueError("El árbol tiene menos claves que probabilidades en p.")
+    return costo
+
+
+def search_many(root, keys, centinela=None):
+    """
+    Busca muchas claves a la vez recorriendo el árbol una sola vez, al estilo
+    de una mezcla: en cada nodo el lote ordenado de consultas se parte en las
+    menores, las iguales y las mayores, de modo que los prefijos de camino
+    comunes se recorren una única vez.
+
+    :param root: Raíz del árbol (Node, AVLNode o RBNode)
+    :param keys: Claves a buscar; si vienen ordenadas se evita reordenarlas
+    :param centinela: Nodo que representa a los hijos vacíos (p. ej. `RedBlackTree.TNULL`)
+    :return: Tupla (found, depth) de arreglos alineados con `keys`: found[i] es 1
+             o 0 y depth[i] la profundidad como en `search_tree` (-1 si no está).
+    """
+    m = len(keys)
+    encontrados = array('b', [0]) * m
+    profundidades = array('i', [-1]) * m
+    if m == 0:
+        return encontrados, profundidades
+
+    ordenadas = all(keys[i] <= keys[i + 1] for i in range(m - 1))
+    if ordenadas:
+        orden = None
+        consultas = keys
+    else:
+        orden = sorted(range(m), key=keys.__getitem__)
+        consultas = [keys[i] for i in orden]
+
+    # Pila de (nodo, inicio, fin, profundidad): el nodo recibe las consultas
+    # consultas[inicio:fin], que son las únicas que pueden estar en su subárbol.
+    pila = [(root, 0, m, 1)]
+    while pila:
+        nodo, inicio, fin, profundidad = pila.pop()
+        if nodo is None or nodo is centinela:
+            continue
+        medio_izq = bisect_left(consultas, nodo.key, inicio, fin)
+        medio_der = bisect_right(consultas, nodo.key, medio_izq, fin)
+        if medio_izq < medio_der:
+            if orden is None:
+                # Consultas ya ordenadas: las repetidas ocupan un tramo contiguo.
+                iguales = medio_der - medio_izq
+                encontrados[medio_izq:medio_der] = array('b', [1]) * iguales
+                profundidades[medio_izq:medio_der] = array('i', [profundidad]) * iguales
+            else:
+                for pos in range(medio_izq, medio_der):
+                    encontrados[orden[pos]] = 1
+                    profundidades[orden[pos]] = profundidad
+        if inicio < medio_izq:
+            pila.append((nodo.left, inicio, medio_izq, profundidad + 1))
+        if medio_der < fin:
+            pila.append((nodo.right, medio_der, fin, profundidad + 1))
+
+    return encontrados, profundidades
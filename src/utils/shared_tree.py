@@ -0,0 +1,191 @@
+# src/utils/shared_tree.py
+import struct
+from collections import deque
+from multiprocessing import resource_tracker, shared_memory
+
+# Encabezado: número mágico, cantidad de nodos, índice de la raíz (-1 si el
+# árbol está vacío) y tamaño en bytes del bloque de claves.
+_ENCABEZADO = struct.Struct('=4q')
+_MAGIA = 0x4F42535431  # "OBST1"
+
+# Estado de cada proceso trabajador (se inicializa una vez por proceso).
+_arbol_trabajador = {}
+
+
+def _adjuntar_sin_rastreo(nombre):
+    """
+    Se adjunta a un bloque existente sin registrarlo en el `resource_tracker`:
+    si no, al terminar un trabajador su rastreador podría borrar el bloque que
+    los demás siguen usando. Solo el proceso que lo creó debe liberarlo.
+    """
+    try:
+        return shared_memory.SharedMemory(name=nombre, track=False)  # Python 3.13+
+    except TypeError:
+        pass
+    registrar = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=nombre)
+    finally:
+        resource_tracker.register = registrar
+
+
+def exportar_arbol(root, centinela=None, nombre=None):
+    """
+    Copia cualquier árbol binario de búsqueda con claves de texto (Node, AVLNode
+    o RBNode) a un único bloque de `multiprocessing.shared_memory`.
+
+    El bloque contiene arreglos planos: desplazamientos int64 de cada clave
+    dentro de un blob UTF-8 y los índices int32 de los hijos izquierdo y
+    derecho (-1 si no hay). Los nodos se numeran por niveles, de modo que los
+    primeros niveles, que todas las búsquedas recorren, quedan contiguos.
+
+    :param root: Raíz del árbol
+    :param centinela: Nodo que representa a los hijos vacíos (p. ej. `RedBlackTree.TNULL`)
+    :param nombre: Nombre opcional del bloque (por defecto lo elige el sistema)
+    :return: ArbolCompartido propietario del bloque; los trabajadores se adjuntan
+             con `ArbolCompartido(arbol.nombre)`.
+    """
+    nodos = []
+    izquierdos = []
+    derechos = []
+    cola = deque()
+    if root is not None and root is not centinela:
+        cola.append(root)
+    while cola:
+        nodo = cola.popleft()
+        if not isinstance(nodo.key, str):
+            raise TypeError("exportar_arbol solo admite claves de tipo str.")
+        nodos.append(nodo.key.encode('utf-8'))
+        for hijo, indices in ((nodo.left, izquierdos), (nodo.right, derechos)):
+            if hijo is None or hijo is centinela:
+                indices.append(-1)
+            else:
+                # El hijo recibirá el siguiente índice libre en el orden por niveles.
+                indices.append(len(nodos) + len(cola))
+                cola.append(hijo)
+
+    n = len(nodos)
+    desplazamientos = [0]
+    for clave in nodos:
+        desplazamientos.append(desplazamientos[-1] + len(clave))
+    blob = b''.join(nodos)
+
+    inicio_izq = _ENCABEZADO.size + 8 * (n + 1)
+    inicio_der = inicio_izq + 4 * n
+    inicio_blob = inicio_der + 4 * n
+    shm = shared_memory.SharedMemory(name=nombre, create=True, size=inicio_blob + len(blob))
+    try:
+        _ENCABEZADO.pack_into(shm.buf, 0, _MAGIA, n, 0 if n else -1, len(blob))
+        struct.pack_into(f'={n + 1}q', shm.buf, _ENCABEZADO.size, *desplazamientos)
+        struct.pack_into(f'={n}i', shm.buf, inicio_izq, *izquierdos)
+        struct.pack_into(f'={n}i', shm.buf, inicio_der, *derechos)
+        shm.buf[inicio_blob:inicio_blob + len(blob)] = blob
+        return ArbolCompartido(shm.name, _shm=shm)
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+
+
+class ArbolCompartido:
+    """
+    Vista de solo lectura de un árbol exportado con `exportar_arbol`.
+
+    Adjuntarse por nombre no copia ni deserializa nada: las búsquedas leen
+    directamente la memoria compartida, así que N procesos comparten una
+    única copia del diccionario.
+    """
+    def __init__(self, nombre, _shm=None):
+        self._propietario = _shm is not None
+        self._shm = _shm if _shm is not None else _adjuntar_sin_rastreo(nombre)
+        buf = self._shm.buf
+        magia, n, raiz, tam_blob = _ENCABEZADO.unpack_from(buf, 0)
+        if magia != _MAGIA:
+            self._shm.close()
+            raise ValueError(f"El bloque '{nombre}' no contiene un árbol exportado.")
+        inicio_izq = _ENCABEZADO.size + 8 * (n + 1)
+        inicio_der = inicio_izq + 4 * n
+        inicio_blob = inicio_der + 4 * n
+        self._n = n
+        self._raiz = raiz
+        self._desplazamientos = buf[_ENCABEZADO.size:inicio_izq].cast('q')
+        self._izquierdos = buf[inicio_izq:inicio_der].cast('i')
+        self._derechos = buf[inicio_der:inicio_blob].cast('i')
+        self._blob = buf[inicio_blob:inicio_blob + tam_blob]
+
+    @property
+    def nombre(self):
+        return self._shm.name
+
+    def __len__(self):
+        return self._n
+
+    def buscar(self, clave):
+        """
+        Busca una clave comparando bytes UTF-8, cuyo orden coincide con el de
+        las cadenas de Python.
+
+        :return: Tupla (found, depth) con la misma convención que `search_tree`.
+        """
+        objetivo = clave.encode('utf-8')
+        desplazamientos, blob = self._desplazamientos, self._blob
+        nodo = self._raiz
+        depth = 0
+        while nodo != -1:
+            depth += 1
+            actual = bytes(blob[desplazamientos[nodo]:desplazamientos[nodo + 1]])
+            if objetivo == actual:
+                return True, depth
+            elif objetivo < actual:
+                nodo = self._izquierdos[nodo]
+            else:
+                nodo = self._derechos[nodo]
+        return False, -1
+
+    def cerrar(self):
+        """
+        Suelta la vista de este proceso sin destruir el bloque.
+        """
+        if self._shm is None:
+            return
+        for vista in (self._desplazamientos, self._izquierdos, self._derechos, self._blob):
+            vista.release()
+        self._shm.close()
+        self._shm = None
+
+    def liberar(self):
+        """
+        Cierra la vista y destruye el bloque. Debe llamarlo solo el creador,
+        cuando ningún trabajador lo vaya a usar más.
+        """
+        shm = self._shm
+        self.cerrar()
+        if shm is not None:
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self._propietario:
+            self.liberar()
+        else:
+            self.cerrar()
+
+
+def inicializar_trabajador(nombre):
+    """
+    Inicializador para `multiprocessing.Pool`: cada proceso se adjunta una vez
+    al árbol compartido.
+    """
+    _arbol_trabajador['arbol'] = ArbolCompartido(nombre)
+
+
+def buscar_compartido(clave):
+    """
+    Busca una clave en el árbol adjuntado por `inicializar_trabajador`.
+
+    :return: Tupla (found, depth) como `search_tree`.
+    """
+    return _arbol_trabajador['arbol'].buscar(clave)
@@ -0,0 +1,83 @@
+# src/utils/sqlite_wal.py
+import os
+import sqlite3
+import threading
+
+
+class ConexionSQLite(sqlite3.Connection):
+    """
+    Conexión SQLite que lleva su propio candado. La comparten varios hilos
+    (check_same_thread=False), así que las transacciones sobre ella deben
+    serializarse: dos BEGIN en la misma conexión fallarían con "cannot start a
+    transaction within a transaction". Las lecturas también lo toman, porque
+    la conexión ve sus propios cambios sin confirmar y otro hilo podría leer
+    una fila de una transacción que luego se revierte. Es reentrante para que
+    una transacción pueda leer con `Lectura` dentro de su propio hilo.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bloqueo = threading.RLock()
+
+
+def conectar(ruta_db):
+    """
+    Abre (y crea si hace falta) una base SQLite en modo WAL y autocommit, para
+    usarla desde varios hilos con `Transaccion`.
+
+    :param ruta_db: Ruta del archivo SQLite
+    :return: ConexionSQLite
+    """
+    directorio = os.path.dirname(ruta_db)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+    # Modo autocommit: las transacciones se abren explícitamente con BEGIN.
+    conexion = sqlite3.connect(ruta_db, timeout=10, isolation_level=None, check_same_thread=False,
+                               factory=ConexionSQLite)
+    conexion.execute("PRAGMA journal_mode=WAL")
+    conexion.execute("PRAGMA synchronous=NORMAL")
+    return conexion
+
+
+class Transaccion:
+    """
+    Abre una transacción de escritura inmediata (BEGIN IMMEDIATE) y la confirma
+    al salir, o la revierte si hubo una excepción. Mientras dura, retiene el
+    candado de la conexión, así que los hilos que comparten una misma conexión
+    escriben de a uno; entre procesos la serialización la hace SQLite.
+    """
+    def __init__(self, conexion):
+        self._conexion = conexion
+
+    def __enter__(self):
+        self._conexion.bloqueo.acquire()
+        try:
+            self._cursor = self._conexion.cursor()
+            self._cursor.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            self._conexion.bloqueo.release()
+            raise
+        return self._cursor
+
+    def __exit__(self, tipo, *exc):
+        try:
+            self._conexion.execute("ROLLBACK" if tipo else "COMMIT")
+            self._cursor.close()
+        finally:
+            self._conexion.bloqueo.release()
+
+
+class Lectura:
+    """
+    Lectura sobre una conexión compartida: retiene su candado mientras dura,
+    así que nunca ve los cambios a medio confirmar de la transacción de otro
+    hilo. Devuelve la conexión; los resultados deben consumirse dentro del bloque.
+    """
+    def __init__(self, conexion):
+        self._conexion = conexion
+
+    def __enter__(self):
+        self._conexion.bloqueo.acquire()
+        return self._conexion
+
+    def __exit__(self, *exc):
+        self._conexion.bloqueo.release()
@@ -0,0 +1,67 @@
+# tests/individual_tests/api_test.py
+import threading
+import pytest
+from src.integration import api
+from src.projects_management.project_registry import RegistroProyectos
+
+# --- Fixture de Pytest con un registro temporal y un documento simulado ---
+
+@pytest.fixture
+def api_temporal(tmp_path, monkeypatch):
+    """
+    Sustituye el registro compartido de la API por uno temporal con un proyecto,
+    y la extracción de probabilidades del PDF por valores fijos (sin caché de
+    corpus, que necesitaría las stopwords de NLTK).
+    """
+    registro = RegistroProyectos(str(tmp_path / "proyectos.db"), ruta_json=None)
+    registro.guardar("Proy", str(tmp_path), str(tmp_path / "doc.pdf"))
+    monkeypatch.setattr(api, '_registro', registro)
+    monkeypatch.setattr(api, '_indices_adaptativos', {})
+    monkeypatch.setattr('src.utils.corpus_cache.CorpusCache', lambda: None)
+    monkeypatch.setattr('src.utils.probability_calculator.obtener_probabilidades_de_documento',
+                        lambda ruta, **kwargs: (['algoritmos', 'datos', 'grafos'], [0.3, 0.3, 0.25],
+                                                [0.05, 0.05, 0.025, 0.025]))
+    yield registro
+    registro.cerrar()
+
+# --- Conjunto de Pruebas ---
+
+def test_analisis_avisa_la_imagen_por_callback(api_temporal, monkeypatch):
+    """
+    TEST DE INTEGRACIÓN:
+    La respuesta del análisis es un diccionario simple (sin Future) y la ruta
+    del PNG llega por `al_terminar` cuando termina el dibujo en segundo plano.
+    """
+    monkeypatch.setattr('src.obst.tree_utils._renderizar_dot',
+                        lambda lineas, output_path, view: output_path + '.png')
+    recibido = []
+    listo = threading.Event()
+
+    def al_terminar(ruta_png):
+        recibido.append(ruta_png)
+        listo.set()
+
+    respuesta = api.analizar_documentacion_api("Proy", al_terminar=al_terminar)
+    assert respuesta["status"] == "success"
+    assert set(respuesta) == {"status", "proyecto", "terminos_analizados", "costo_obst"}
+    assert listo.wait(timeout=10)
+    assert recibido[0].endswith("obst_Proy.png")
+
+def test_analisis_avisa_none_si_falla_el_dibujo(api_temporal, monkeypatch):
+    """
+    TEST DE ROBUSTEZ:
+    Si Graphviz falla, `al_terminar` recibe None en lugar de no llamarse nunca.
+    """
+    def falla(lineas, output_path, view):
+        raise RuntimeError("dot falló")
+    monkeypatch.setattr('src.obst.tree_utils._renderizar_dot', falla)
+    listo = threading.Event()
+    recibido = []
+
+    def al_terminar(ruta_png):
+        recibido.append(ruta_png)
+        listo.set()
+
+    assert api.analizar_documentacion_api("Proy", al_terminar=al_terminar)["status"] == "success"
+    assert listo.wait(timeout=10)
+    assert recibido == [None]
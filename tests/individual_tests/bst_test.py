@@ -0,0 +1,293 @@
+# tests/individual_tests/bst_test.py
+import random
+import pytest
+from src.bst.avl_tree import AVLTree
+from src.bst.red_black_tree import RedBlackTree, RED, BLACK
+from src.bst.splay_tree import SplayTree, MoveToRootTree
+from src.bst.ternary_search_tree import TernarySearchTree
+from src.obst.tree_utils import obtener_recorrido_inorden
+
+# --- Fixture de Pytest para Datos Estándar ---
+
+@pytest.fixture
+def claves_desordenadas():
+    """
+    Proporciona 500 claves enteras únicas en orden aleatorio (semilla fija).
+    """
+    claves = list(range(500))
+    random.Random(3).shuffle(claves)
+    return claves
+
+# --- Funciones de Validación ---
+
+def altura_negra_valida(arbol):
+    """
+    Verifica las propiedades rojo-negro con una pila explícita y devuelve la
+    altura negra (falla con AssertionError si alguna propiedad no se cumple).
+    """
+    assert arbol.root.color is BLACK
+    alturas = set()
+    pila = [(arbol.root, 0)]
+    while pila:
+        nodo, negros = pila.pop()
+        if nodo is arbol.TNULL:
+            alturas.add(negros)
+            continue
+        assert nodo.color in (RED, BLACK)
+        if nodo.color is RED:
+            assert nodo.left.color is BLACK and nodo.right.color is BLACK
+        for hijo in (nodo.left, nodo.right):
+            if hijo is not arbol.TNULL:
+                assert hijo.parent is nodo
+        negros += nodo.color is BLACK
+        pila.append((nodo.left, negros))
+        pila.append((nodo.right, negros))
+    assert len(alturas) == 1
+    return alturas.pop()
+
+def altura_avl_valida(nodo):
+    """
+    Verifica el balance y las alturas guardadas de un subárbol AVL y devuelve su altura.
+    """
+    if nodo is None:
+        return 0
+    izq = altura_avl_valida(nodo.left)
+    der = altura_avl_valida(nodo.right)
+    assert abs(izq - der) <= 1
+    assert nodo.height == 1 + max(izq, der)
+    return nodo.height
+
+# --- Conjunto de Pruebas ---
+
+def test_nodos_compactos_sin_dict(claves_desordenadas):
+    """
+    TEST DE REPRESENTACIÓN:
+    Los nodos AVL y Rojo-Negro usan __slots__ (sin __dict__) y el color es booleano,
+    sin romper las propiedades de cada árbol.
+    """
+    avl, rb = AVLTree(), RedBlackTree()
+    for clave in claves_desordenadas:
+        avl.insert(clave)
+        rb.insert(clave)
+
+    assert not hasattr(avl.root, '__dict__')
+    assert not hasattr(rb.root, '__dict__')
+    assert isinstance(rb.root.color, bool)
+    altura_avl_valida(avl.root)
+    altura_negra_valida(rb)
+    assert all(avl.search(c) and rb.search(c) for c in claves_desordenadas)
+
+@pytest.mark.parametrize("clase", [SplayTree, MoveToRootTree])
+def test_arboles_adaptativos_busqueda_y_orden(clase, claves_desordenadas):
+    """
+    TEST DE CORRECTITUD:
+    Tras insertar y buscar, el árbol sigue siendo un BST válido, encuentra todas
+    las claves y sube la clave accedida a la raíz.
+    """
+    arbol = clase()
+    for clave in claves_desordenadas:
+        arbol.insert(clave)
+    arbol.insert(claves_desordenadas[0])  # Duplicado: no se vuelve a insertar
+
+    for clave in claves_desordenadas[:100]:
+        assert arbol.search(clave)
+        assert arbol.root.key == clave
+    assert not arbol.search(-1)
+    assert not arbol.search(1000)
+    assert obtener_recorrido_inorden(arbol.root) == sorted(claves_desordenadas)
+
+def test_splay_se_adapta_a_consultas_repetidas(claves_desordenadas):
+    """
+    TEST DE COMPORTAMIENTO:
+    Buscar repetidamente la misma clave cuesta una sola comparación tras el primer acceso.
+    """
+    arbol = SplayTree()
+    for clave in claves_desordenadas:
+        arbol.insert(clave)
+    arbol.search(250)
+    arbol.comparisons = 0
+    for _ in range(10):
+        arbol.search(250)
+    assert arbol.comparisons == 10
+
+def test_splay_cuenta_cada_nodo_del_camino_una_vez(claves_desordenadas):
+    """
+    TEST DE MEDICIÓN:
+    Cada búsqueda suma exactamente los nodos del camino de acceso (como se
+    cuentan en los árboles estáticos), aunque el splay mire hijos por
+    adelantado en los pasos zig-zag o al encontrar la clave en un hijo.
+    """
+    arbol = SplayTree()
+    for clave in claves_desordenadas:
+        arbol.insert(clave)
+
+    def nodos_del_camino(nodo, clave):
+        visitados = 0
+        while nodo:
+            visitados += 1
+            if clave == nodo.key:
+                break
+            nodo = nodo.left if clave < nodo.key else nodo.right
+        return visitados
+
+    rng = random.Random(5)
+    for _ in range(500):
+        clave = rng.randrange(-10, 1010)
+        esperado = nodos_del_camino(arbol.root, clave)
+        antes = arbol.comparisons
+        arbol.search(clave)
+        assert arbol.comparisons - antes == esperado
+
+@pytest.mark.parametrize("n", [0, 1, 2, 7, 8, 100, 1023, 1500])
+def test_from_sorted_construye_arboles_validos(n):
+    """
+    TEST DE CONSTRUCCIÓN EN BLOQUE:
+    `from_sorted` produce árboles AVL y Rojo-Negro válidos, de altura mínima,
+    que siguen admitiendo inserciones normales.
+    """
+    claves = list(range(0, 2 * n, 2))
+
+    avl = AVLTree.from_sorted(claves)
+    altura = altura_avl_valida(avl.root)
+    assert altura == n.bit_length()
+    assert obtener_recorrido_inorden(avl.root) == claves
+
+    rb = RedBlackTree.from_sorted(claves)
+    if n:
+        altura_negra_valida(rb)
+    assert all(rb.search(c) for c in claves)
+    assert not rb.search(1)
+
+    for arbol in (avl, rb):
+        arbol.insert(-1)
+        arbol.insert(2 * n + 1)
+    altura_avl_valida(avl.root)
+    altura_negra_valida(rb)
+
+def test_avl_insercion_eliminacion_rank_select_range():
+    """
+    TEST DE DICCIONARIO ORDENADO:
+    Tras una secuencia aleatoria de inserciones y eliminaciones el AVL sigue
+    balanceado y rank, select y range coinciden con una lista ordenada de referencia.
+    """
+    import bisect
+    rng = random.Random(21)
+    arbol, referencia = AVLTree(), []
+
+    for _ in range(3000):
+        clave = rng.randint(0, 200)
+        if rng.random() < 0.6:
+            arbol.insert(clave)
+            bisect.insort(referencia, clave)
+        else:
+            assert arbol.delete(clave) == (clave in referencia)
+            if clave in referencia:
+                referencia.remove(clave)
+
+    altura_avl_valida(arbol.root)
+    assert len(arbol) == len(referencia)
+    assert obtener_recorrido_inorden(arbol.root) == referencia
+    for consulta in range(-1, 202, 3):
+        assert arbol.rank(consulta) == bisect.bisect_left(referencia, consulta)
+    assert [arbol.select(i) for i in range(len(referencia))] == referencia
+    assert list(arbol.range(50, 120)) == [c for c in referencia if 50 <= c <= 120]
+    with pytest.raises(IndexError):
+        arbol.select(len(referencia))
+
+def test_avl_operaciones_de_conjuntos_por_join():
+    """
+    TEST DE OPERACIONES DE CONJUNTOS:
+    union, intersection, difference, split y join producen AVL válidos con el
+    contenido esperado; los árboles operandos quedan vacíos.
+    """
+    rng = random.Random(8)
+    grande = set(rng.sample(range(2000), 800))
+    pequeno = set(rng.sample(range(2000), 30))
+
+    def construir(claves):
+        return AVLTree.from_sorted(sorted(claves))
+
+    for operacion, esperado in (("union", grande | pequeno),
+                                ("intersection", grande & pequeno),
+                                ("difference", grande - pequeno)):
+        arbol, otro = construir(grande), construir(pequeno)
+        getattr(arbol, operacion)(otro)
+        altura_avl_valida(arbol.root)
+        assert obtener_recorrido_inorden(arbol.root) == sorted(esperado)
+        assert len(arbol) == len(esperado)
+        assert otro.root is None
+
+    menores, encontrado, mayores = construir(grande).split(1000)
+    assert encontrado == (1000 in grande)
+    assert obtener_recorrido_inorden(menores.root) == sorted(c for c in grande if c < 1000)
+    assert obtener_recorrido_inorden(mayores.root) == sorted(c for c in grande if c > 1000)
+
+    unido = AVLTree.join(menores, 1000, mayores)
+    altura_avl_valida(unido.root)
+    assert obtener_recorrido_inorden(unido.root) == sorted(grande | {1000})
+
+def test_avl_persistente_comparte_estructura(claves_desordenadas):
+    """
+    TEST DE PERSISTENCIA:
+    Cada versión conserva su contenido después de nuevas actualizaciones, sigue
+    balanceada y comparte con la anterior todo salvo O(log n) nodos.
+    """
+    from src.bst.persistent_avl_tree import PersistentAVLTree
+
+    versiones = [PersistentAVLTree()]
+    for clave in claves_desordenadas:
+        versiones.append(versiones[-1].insert(clave))
+    completo = versiones[-1]
+    assert completo.insert(claves_desordenadas[0]) is completo  # Ya existe
+
+    # Las instantáneas antiguas no cambian al seguir insertando.
+    assert len(versiones[10]) == 10
+    assert obtener_recorrido_inorden(versiones[10].root) == sorted(claves_desordenadas[:10])
+    altura_avl_valida(completo.root)
+
+    sin_pares = completo
+    for clave in range(0, 500, 2):
+        sin_pares = sin_pares.delete(clave)
+    altura_avl_valida(sin_pares.root)
+    assert obtener_recorrido_inorden(sin_pares.root) == list(range(1, 500, 2))
+    assert completo.search(0) and not sin_pares.search(0)
+
+    # Una actualización solo crea los nodos de su camino.
+    def ids(raiz):
+        pila, vistos = [raiz], set()
+        while pila:
+            nodo = pila.pop()
+            if nodo is not None:
+                vistos.add(id(nodo))
+                pila.extend((nodo.left, nodo.right))
+        return vistos
+
+    nuevo = completo.insert(10_000)
+    assert len(ids(nuevo.root) - ids(completo.root)) <= 2 * completo.root.height + 2
+
+def test_arbol_ternario_busqueda_prefijos_y_autocompletado():
+    """
+    TEST DE CORRECTITUD:
+    El árbol ternario debe encontrar todas las claves insertadas (ignorando
+    repetidas), rechazar prefijos que no son claves, y devolver en orden las
+    claves de un prefijo, con o sin límite.
+    """
+    rng = random.Random(5)
+    palabras = sorted({''.join(rng.choice('abcñ') for _ in range(rng.randint(1, 6))) for _ in range(2000)})
+    arbol = TernarySearchTree()
+    for palabra in palabras + palabras[:50]:
+        arbol.insert(palabra)
+
+    assert len(arbol) == len(palabras)
+    assert all(arbol.search(palabra) for palabra in palabras)
+    assert not arbol.search('abcabcabc') and not arbol.search('z') and not arbol.search('')
+    assert arbol.search_depth('z') == (False, -1)
+    encontrado, profundidad = arbol.search_depth(palabras[0])
+    assert encontrado and profundidad >= len(palabras[0])
+
+    assert arbol.autocomplete('') == palabras
+    con_prefijo = [p for p in palabras if p.startswith('ab')]
+    assert arbol.autocomplete('ab') == con_prefijo
+    assert arbol.autocomplete('ab', limit=3) == con_prefijo[:3]
+    assert arbol.starts_with('ñ') and not arbol.starts_with('z')
+    assert arbol.autocomplete('z') == []
@@ -0,0 +1,86 @@
+# tests/individual_tests/code_index_test.py
+import os
+import pytest
+from src.projects_management.code_index import IndiceCodigo
+from src.lcs_detector.comparator import CodeComparator, DEFAULT_TOKEN_WEIGHTS
+
+# --- Fixture de Pytest para un proyecto temporal ---
+
+@pytest.fixture
+def proyecto_temporal(tmp_path):
+    """
+    Crea una carpeta de código con dos archivos fuente, un archivo que no es
+    código y una carpeta ignorada, y un índice vacío.
+    """
+    codigo = tmp_path / "codigo"
+    (codigo / "pkg").mkdir(parents=True)
+    (codigo / "__pycache__").mkdir()
+    (codigo / "main.py").write_text("def suma(a, b):\n    return a + b\n")
+    (codigo / "pkg" / "util.py").write_text("x = 1\n")
+    (codigo / "notas.txt").write_text("no es código")
+    (codigo / "__pycache__" / "main.py").write_text("basura = 0\n")
+    indice = IndiceCodigo(str(tmp_path / "indice.db"))
+    yield codigo, indice
+    indice.cerrar()
+
+def _tocar(ruta, contenido=None):
+    # Cambia el contenido (opcional) y fuerza un mtime distinto.
+    if contenido is not None:
+        ruta.write_text(contenido)
+    info = os.stat(ruta)
+    os.utime(ruta, ns=(info.st_atime_ns, info.st_mtime_ns + 1_000_000_000))
+
+# --- Conjunto de Pruebas ---
+
+def test_indexacion_inicial_y_tokens(proyecto_temporal):
+    """
+    TEST DE CORRECTITUD:
+    La primera indexación agrega solo los archivos fuente (ignorando otras
+    extensiones y __pycache__) y guarda los mismos tokens que usa CodeComparator.
+    """
+    codigo, indice = proyecto_temporal
+    cambios = indice.indexar("P", str(codigo))
+
+    assert cambios.generacion == 1
+    assert cambios.agregados == ["main.py", "pkg/util.py"]
+    assert cambios.modificados == [] and cambios.eliminados == []
+    assert indice.archivos("P") == ["main.py", "pkg/util.py"]
+
+    esperado = CodeComparator().tokenizer.tokenize_and_normalize(
+        (codigo / "main.py").read_text(), DEFAULT_TOKEN_WEIGHTS
+    )
+    assert indice.tokens("P", "main.py") == tuple(map(list, esperado))
+    assert indice.tokens("P", "notas.txt") is None
+
+def test_reindexar_solo_procesa_cambios(proyecto_temporal, monkeypatch):
+    """
+    TEST INCREMENTAL:
+    Sin cambios no se tokeniza nada ni avanza la generación; tocar un archivo sin
+    cambiar su contenido tampoco lo retokeniza; modificar, agregar y borrar sí
+    aparecen en los cambios y en `cambios_desde`.
+    """
+    codigo, indice = proyecto_temporal
+    indice.indexar("P", str(codigo))
+
+    tokenizados = []
+    original = indice._tokenizer.tokenize_and_normalize
+    def contar(code, weights):
+        tokenizados.append(code)
+        return original(code, weights)
+    monkeypatch.setattr(indice._tokenizer, 'tokenize_and_normalize', contar)
+
+    assert indice.indexar("P", str(codigo)) == (1, [], [], [])
+    _tocar(codigo / "main.py")  # Mismo contenido, otro mtime
+    assert indice.indexar("P", str(codigo)) == (1, [], [], [])
+    assert tokenizados == []
+
+    _tocar(codigo / "main.py", "def resta(a, b):\n    return a - b\n")
+    (codigo / "nuevo.py").write_text("y = 2\n")
+    (codigo / "pkg" / "util.py").unlink()
+    cambios = indice.indexar("P", str(codigo))
+
+    assert cambios == (2, ["nuevo.py"], ["main.py"], ["pkg/util.py"])
+    assert len(tokenizados) == 2
+    assert indice.cambios_desde("P", 1) == (["main.py", "nuevo.py"], ["pkg/util.py"])
+    assert indice.cambios_desde("P", 2) == ([], [])
+    assert indice.cambios_desde("Otro", 0) == ([], [])
@@ -0,0 +1,142 @@
+# tests/individual_tests/corpus_cache_test.py
+import os
+from collections import Counter
+import pytest
+from src.utils.corpus_cache import CorpusCache
+from src.utils.probability_calculator import conteo_de_documento, generar_terminos_dinamicamente
+
+STOPWORDS_PRUEBA = ['el', 'la', 'de']
+
+# --- Fixture de Pytest para un PDF y una caché temporales ---
+
+@pytest.fixture
+def pdf_y_cache(tmp_path):
+    """
+    Crea un "PDF" (basta con su contenido binario, que es lo que se hashea) y una
+    caché vacía en un directorio temporal.
+    """
+    ruta_pdf = tmp_path / "documento.pdf"
+    ruta_pdf.write_bytes(b"%PDF-1.4 contenido de prueba")
+    cache = CorpusCache(str(tmp_path / "cache"), stop_words=STOPWORDS_PRUEBA)
+    return str(ruta_pdf), cache
+
+# --- Conjunto de Pruebas ---
+
+def test_guardar_y_obtener_por_contenido(pdf_y_cache, tmp_path):
+    """
+    TEST DE CORRECTITUD:
+    Una entrada guardada se recupera con el mismo texto y conteo, también desde
+    otra ruta con el mismo contenido; un contenido distinto no acierta.
+    """
+    ruta_pdf, cache = pdf_y_cache
+    assert cache.obtener(ruta_pdf) is None
+
+    conteo = Counter({'algoritmos': 3, 'árbol': 2})
+    cache.guardar(ruta_pdf, "texto extraído", conteo)
+    assert cache.obtener(ruta_pdf) == ("texto extraído", conteo)
+
+    copia = tmp_path / "copia.pdf"
+    copia.write_bytes(open(ruta_pdf, 'rb').read())
+    assert cache.obtener(str(copia)) == ("texto extraído", conteo)
+
+    otro = tmp_path / "otro.pdf"
+    otro.write_bytes(b"%PDF-1.4 otro contenido")
+    assert cache.obtener(str(otro)) is None
+
+def test_version_depende_de_las_stopwords(pdf_y_cache):
+    """
+    TEST DE VERSIONADO:
+    Si cambia la lista de stopwords, las entradas anteriores dejan de ser válidas.
+    """
+    ruta_pdf, cache = pdf_y_cache
+    cache.guardar(ruta_pdf, "texto", Counter({'datos': 1}))
+
+    otra = CorpusCache(cache.directorio, stop_words=STOPWORDS_PRUEBA + ['los'])
+    assert otra.version != cache.version
+    assert otra.obtener(ruta_pdf) is None
+    assert CorpusCache(cache.directorio, stop_words=list(reversed(STOPWORDS_PRUEBA))).obtener(ruta_pdf) is not None
+
+def test_desalojo_lru_por_tamano(tmp_path):
+    """
+    TEST DE DESALOJO:
+    Al superar el tamaño máximo se eliminan primero las entradas usadas hace
+    más tiempo.
+    """
+    cache = CorpusCache(str(tmp_path / "cache"), tam_maximo=1, stop_words=STOPWORDS_PRUEBA)
+    rutas = []
+    for i in range(3):
+        ruta = tmp_path / f"doc{i}.pdf"
+        ruta.write_bytes(f"contenido {i}".encode())
+        rutas.append(str(ruta))
+        cache.guardar(str(ruta), "texto " * 50, Counter({'palabra': i}))
+
+    # Con un límite de 1 byte solo sobrevive la última entrada escrita.
+    assert len(os.listdir(cache.directorio)) == 1
+    assert cache.obtener(rutas[2]) is not None
+    assert cache.obtener(rutas[0]) is None
+
+def test_conteo_de_documento_acierta_en_cache(pdf_y_cache, monkeypatch):
+    """
+    TEST DE INTEGRACIÓN:
+    Con la entrada en caché no se vuelve a leer el PDF, y los términos de
+    cualquier top_n salen del mismo conteo.
+    """
+    ruta_pdf, cache = pdf_y_cache
+    conteo = Counter({'algoritmos': 5, 'datos': 3, 'estructuras': 2})
+    cache.guardar(ruta_pdf, "texto", conteo)
+
+    def no_leer(*args, **kwargs):
+        raise AssertionError("El PDF no debería volver a leerse")
+    monkeypatch.setattr('src.utils.probability_calculator.iterar_paginas_pdf', no_leer)
+
+    resultado = conteo_de_documento(ruta_pdf, cache=cache)
+    assert resultado == conteo
+    assert generar_terminos_dinamicamente(resultado, top_n=2) == ['algoritmos', 'datos']
+    assert generar_terminos_dinamicamente(resultado, top_n=3) == ['algoritmos', 'datos', 'estructuras']
+
+def test_temporales_abandonados_y_desalojo_concurrente(pdf_y_cache, monkeypatch):
+    """
+    TEST DE ROBUSTEZ:
+    Los temporales viejos de escritores interrumpidos se eliminan al desalojar
+    (los recientes se respetan), y si otro proceso borra la entrada justo
+    después de leerla, `obtener` igual devuelve el contenido leído.
+    """
+    ruta_pdf, cache = pdf_y_cache
+    viejo = os.path.join(cache.directorio, "abc-def.json.gz.999.tmp")
+    reciente = os.path.join(cache.directorio, "abc-def.json.gz.998.tmp")
+    for ruta in (viejo, reciente):
+        with open(ruta, 'wb') as archivo:
+            archivo.write(b"a medio escribir")
+    os.utime(viejo, (0, 0))
+
+    conteo = Counter({'datos': 1})
+    cache.guardar(ruta_pdf, "texto", conteo)
+    assert not os.path.exists(viejo)
+    assert os.path.exists(reciente)
+
+    def desalojada(ruta, *args, **kwargs):
+        raise FileNotFoundError(ruta)
+    monkeypatch.setattr('src.utils.corpus_cache.os.utime', desalojada)
+    assert cache.obtener(ruta_pdf) == ("texto", conteo)
+
+def test_conteo_de_documento_hashea_una_vez(pdf_y_cache, monkeypatch):
+    """
+    TEST DE EFICIENCIA:
+    En un fallo de caché el PDF se hashea una sola vez para buscar y guardar.
+    """
+    ruta_pdf, cache = pdf_y_cache
+    llamadas = []
+    hash_original = CorpusCache.hash_de_archivo
+
+    def contar_hash(ruta):
+        llamadas.append(ruta)
+        return hash_original(ruta)
+    monkeypatch.setattr(cache, 'hash_de_archivo', contar_hash)
+    monkeypatch.setattr('src.utils.probability_calculator.iterar_paginas_pdf',
+                        lambda ruta, procesos=None: iter(["algoritmos y datos"]))
+    monkeypatch.setattr('src.utils.probability_calculator.contar_palabras',
+                        lambda paginas: Counter({'algoritmos': 1, 'datos': 1}))
+
+    conteo_de_documento(ruta_pdf, cache=cache)
+    assert llamadas == [ruta_pdf]
+    assert cache.obtener(ruta_pdf) is not None
@@ -0,0 +1,88 @@
+# tests/individual_tests/corpus_model_test.py
+import multiprocessing
+from collections import Counter
+import pytest
+from src.utils.corpus_model import ModeloCorpus
+from src.utils.probability_calculator import probabilidades_desde_conteo
+
+# Conteos simulados por documento (evita leer PDFs reales y depender de NLTK).
+CONTEOS_SIMULADOS = {
+    'a.pdf': Counter({'algoritmos': 4, 'datos': 1}),
+    'b.pdf': Counter({'datos': 3, 'grafos': 2}),
+    'c.pdf': Counter({'algoritmos': 1, 'grafos': 5, 'árbol': 2}),
+}
+
+# --- Fixture de Pytest para Mockear el conteo de cada documento ---
+
+@pytest.fixture
+def conteos_simulados(monkeypatch):
+    """
+    Intercepta `conteo_de_documento` y registra cuántas veces se cuenta cada documento.
+    """
+    llamadas = Counter()
+
+    def mock_conteo(ruta_pdf, procesos=None, cache=None):
+        llamadas[ruta_pdf] += 1
+        return Counter(CONTEOS_SIMULADOS[ruta_pdf])
+
+    monkeypatch.setattr('src.utils.corpus_model.conteo_de_documento', mock_conteo)
+    return llamadas
+
+# --- Conjunto de Pruebas ---
+
+def test_conteo_total_del_corpus(conteos_simulados):
+    """
+    TEST DE CORRECTITUD:
+    El modelo combina los conteos de todos los documentos y construye un único
+    modelo p/q.
+    """
+    esperado = sum(CONTEOS_SIMULADOS.values(), Counter())
+    modelo = ModeloCorpus(procesos=1)
+    modelo.agregar_documentos(CONTEOS_SIMULADOS)
+    assert modelo.total == esperado
+    assert sorted(modelo.documentos) == sorted(CONTEOS_SIMULADOS)
+
+    terminos, p, q = modelo.probabilidades(top_n=3, prob_exito_total=0.9)
+    assert (terminos, p, q) == probabilidades_desde_conteo(esperado, 3, 0.9)
+    assert terminos == ['algoritmos', 'datos', 'grafos']
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(),
+                    reason="El mock solo llega a los trabajadores si heredan la memoria (fork)")
+def test_conteo_total_con_grupo_de_procesos(conteos_simulados, monkeypatch):
+    """
+    TEST DE PARALELISMO:
+    Con un grupo de procesos el total es el mismo que en serie. Se pide
+    explícitamente el contexto 'fork' para que los trabajadores hereden el
+    `conteo_de_documento` simulado (con 'spawn' importarían el real).
+    """
+    monkeypatch.setattr('src.utils.corpus_model.Pool', multiprocessing.get_context('fork').Pool)
+    modelo = ModeloCorpus(procesos=2)
+    modelo.agregar_documentos(CONTEOS_SIMULADOS)
+    assert modelo.total == sum(CONTEOS_SIMULADOS.values(), Counter())
+    assert sorted(modelo.documentos) == sorted(CONTEOS_SIMULADOS)
+
+def test_agregar_y_eliminar_incremental(conteos_simulados):
+    """
+    TEST INCREMENTAL:
+    Agregar o quitar un documento no vuelve a contar los demás, y el total
+    queda igual que si se hubiera contado el corpus resultante desde cero.
+    """
+    modelo = ModeloCorpus(procesos=1)
+    modelo.agregar_documentos(['a.pdf', 'b.pdf'])
+    modelo.agregar_documento('c.pdf')
+    assert conteos_simulados == Counter({'a.pdf': 1, 'b.pdf': 1, 'c.pdf': 1})
+
+    assert modelo.eliminar_documento('b.pdf')
+    assert not modelo.eliminar_documento('b.pdf')
+    assert 'b.pdf' not in modelo and len(modelo) == 2
+    assert modelo.total == CONTEOS_SIMULADOS['a.pdf'] + CONTEOS_SIMULADOS['c.pdf']
+    assert conteos_simulados['a.pdf'] == 1 and conteos_simulados['c.pdf'] == 1
+
+    # Volver a agregar un documento existente lo reemplaza en lugar de sumarlo dos veces.
+    modelo.agregar_documento('a.pdf')
+    assert modelo.total == CONTEOS_SIMULADOS['a.pdf'] + CONTEOS_SIMULADOS['c.pdf']
+
+    modelo.eliminar_documento('a.pdf')
+    modelo.eliminar_documento('c.pdf')
+    assert modelo.total == Counter()
+    assert modelo.probabilidades() == ([], [], [])
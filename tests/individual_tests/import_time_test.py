@@ -0,0 +1,74 @@
+# tests/individual_tests/import_time_test.py
+import json
+import os
+import subprocess
+import sys
+
+# Raíz del repositorio, para ejecutar los subprocesos como si fueran la aplicación.
+RAIZ_REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Dependencias pesadas que no deben cargarse para listar proyectos o comparar código.
+MODULOS_PESADOS = ('PyPDF2', 'nltk', 'graphviz')
+
+# Presupuesto de tiempo para importar la API y atender la primera llamada.
+PRESUPUESTO_SEGUNDOS = 0.1
+
+def _ejecutar(programa, directorio):
+    # Intérprete nuevo con el repositorio en el path pero trabajando en
+    # `directorio`, para que las rutas relativas (data/...) no toquen el árbol real.
+    entorno = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [RAIZ_REPO, os.environ.get('PYTHONPATH')])))
+    return subprocess.run(
+        [sys.executable, '-c', programa], cwd=directorio, env=entorno, capture_output=True, text=True, check=True
+    ).stdout
+
+def _medir_en_subproceso(codigo, directorio):
+    """
+    Ejecuta `codigo` en un intérprete nuevo (sin módulos ya cargados por pytest)
+    dentro de `directorio` y devuelve el tiempo medido y los módulos pesados
+    que quedaron importados.
+    """
+    programa = (
+        "import sys, time, json\n"
+        "inicio = time.perf_counter()\n"
+        f"{codigo}\n"
+        "fin = time.perf_counter()\n"
+        f"print(json.dumps([fin - inicio, [m for m in {MODULOS_PESADOS!r} if m in sys.modules]]))\n"
+    )
+    salida = _ejecutar(programa, directorio)
+    tiempo, cargados = json.loads(salida.strip().splitlines()[-1])
+    return tiempo, cargados
+
+def test_listar_proyectos_sin_dependencias_pesadas(tmp_path):
+    """
+    TEST DE ARRANQUE:
+    Importar la API y listar proyectos no debe cargar PyPDF2, NLTK ni Graphviz
+    y debe caber en el presupuesto de tiempo. El registro se crea antes en otro
+    proceso, así que solo se mide el arranque con una base ya existente.
+    """
+    _ejecutar(
+        "from src.projects_management.project_registry import RegistroProyectos\n"
+        "RegistroProyectos().cerrar()", tmp_path
+    )
+    tiempo, cargados = _medir_en_subproceso(
+        "from src.integration.api import listar_proyectos_api\n"
+        "assert listar_proyectos_api()['proyectos'] == []", tmp_path
+    )
+    assert cargados == []
+    assert tiempo < PRESUPUESTO_SEGUNDOS, f"El arranque tardó {tiempo * 1000:.1f} ms"
+
+def test_comparar_codigo_sin_dependencias_pesadas(tmp_path):
+    """
+    TEST DE ARRANQUE:
+    Una comparación LCS tampoco necesita las dependencias del análisis de documentos.
+    """
+    archivo1 = tmp_path / "a.py"
+    archivo2 = tmp_path / "b.py"
+    archivo1.write_text("def suma(a, b):\n    return a + b\n", encoding='utf-8')
+    archivo2.write_text("def sumar(x, y):\n    return x + y\n", encoding='utf-8')
+
+    tiempo, cargados = _medir_en_subproceso(
+        "from src.integration.api import comparar_archivos_codigo_api\n"
+        f"assert comparar_archivos_codigo_api({str(archivo1)!r}, {str(archivo2)!r})['status'] == 'success'", tmp_path
+    )
+    assert cargados == []
+    assert tiempo < PRESUPUESTO_SEGUNDOS, f"La comparación tardó {tiempo * 1000:.1f} ms"
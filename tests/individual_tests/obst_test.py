@@ -2,6 +2,7 @@
 import pytest
 from src.obst.obst import optimal_bst, reconstruir_arbol
 from src.obst.tree_utils import obtener_recorrido_inorden, Node
+from src.obst.parallel_obst import optimal_bst_paralelo
 # --- Fixture de Pytest para Datos Estándar ---
 
 @pytest.fixture
@@ -103,4 +104,164 @@ def test_comportamiento_con_probabilidades_sesgadas():
     arbol = reconstruir_arbol(root_table, keys, 1, len(keys))
     
     # La raíz del árbol completo (subárbol de 1 a n) debe ser la clave más probable
-    assert arbol.key == 'MUY_PROBABLE', "La clave con mayor probabilidad debería ser la raíz."
\ No newline at end of file
+    assert arbol.key == 'MUY_PROBABLE', "La clave con mayor probabilidad debería ser la raíz."
+
+def test_paralelo_identico_al_serial():
+    """
+    TEST DE EQUIVALENCIA:
+    El solucionador por diagonales en memoria compartida debe devolver exactamente
+    el mismo costo y la misma tabla de raíces que la versión serial.
+    """
+    import random
+    rng = random.Random(7)
+    n = 60
+    keys = [f"k{i:03d}" for i in range(n)]
+    p = [rng.random() for _ in range(n)]
+    q = [rng.random() for _ in range(n + 1)]
+    total = sum(p) + sum(q)
+    p = [x / total for x in p]
+    q = [x / total for x in q]
+
+    costo_serial, raices_serial = optimal_bst(keys, p, q)
+    costo_paralelo, raices_paralelo = optimal_bst_paralelo(keys, p, q, num_procesos=2, umbral_serial=0)
+
+    assert costo_paralelo == costo_serial
+    assert raices_paralelo == raices_serial
+
+def test_garsia_wachs_coincide_con_obst_sin_p():
+    """
+    TEST DE EQUIVALENCIA:
+    Con p = 0, el árbol alfabético de Garsia–Wachs debe tener el mismo costo que
+    el OBST y ser un BST válido sobre las mismas claves.
+    """
+    import random
+    from src.obst.garsia_wachs import arbol_alfabetico_optimo
+    from src.utils.search_engine import costo_esperado_arbol
+
+    rng = random.Random(11)
+    for _ in range(200):
+        n = rng.randint(0, 10)
+        keys = [f"k{i:02d}" for i in range(n)]
+        q = [rng.choice([0.0, 0.1, 0.2, rng.random()]) for _ in range(n + 1)]
+
+        costo, raiz = arbol_alfabetico_optimo(keys, q)
+        costo_obst, _ = optimal_bst(keys, [0.0] * n, q)
+
+        assert abs(costo - costo_obst) < 1e-9
+        assert obtener_recorrido_inorden(raiz) == keys
+        assert abs(costo_esperado_arbol(raiz, [0.0] * n, q) - costo) < 1e-9
+
+    # Instancias más grandes, donde se fusionan muchos bloques de Hu–Tucker.
+    for n in (40, 60):
+        keys = [f"k{i:02d}" for i in range(n)]
+        q = [rng.random() for _ in range(n + 1)]
+        costo, raiz = arbol_alfabetico_optimo(keys, q)
+        costo_obst, _ = optimal_bst(keys, [0.0] * n, q)
+        assert abs(costo - costo_obst) < 1e-9
+        assert obtener_recorrido_inorden(raiz) == keys
+
+def test_multiway_k2_coincide_y_busqueda_aplanada(clrs_example_data):
+    """
+    TEST DE CORRECTITUD:
+    Con k = 2 el árbol multivía es el OBST; con k mayor el costo no empeora y la
+    búsqueda aplanada encuentra todas las claves respetando el límite de k - 1 claves.
+    """
+    from src.obst.multiway_obst import (
+        optimal_multiway_bst, reconstruir_multiway, aplanar_multiway, buscar_multiway
+    )
+    keys, p, q = clrs_example_data["keys"], clrs_example_data["p"], clrs_example_data["q"]
+
+    costo_k2, _ = optimal_multiway_bst(keys, p, q, 2)
+    assert abs(costo_k2 - clrs_example_data["expected_cost"]) < 1e-9
+
+    costo_k3, tablas = optimal_multiway_bst(keys, p, q, 3)
+    assert costo_k3 <= costo_k2 + 1e-9
+
+    raiz = reconstruir_multiway(tablas, keys, 3)
+    plano = aplanar_multiway(raiz)
+    assert sorted(plano.claves) == keys
+    assert all(1 <= len(plano.claves[plano.inicio[t]:plano.inicio[t + 1]]) <= 2
+               for t in range(len(plano.inicio) - 1))
+
+    # El costo esperado recorrido sobre el árbol aplanado coincide con la tabla:
+    # las búsquedas fallidas cuentan la hoja ficticia como una visita más.
+    costo = sum(pi * buscar_multiway(plano, clave)[1] for pi, clave in zip(p, keys))
+    huecos = ['k0'] + [clave + '~' for clave in keys]
+    for qi, consulta in zip(q, huecos):
+        encontrado, visitas = buscar_multiway(plano, consulta)
+        assert not encontrado
+        costo += qi * (visitas + 1)
+    assert abs(costo - costo_k3) < 1e-9
+
+def test_generar_dot_sin_duplicados_y_con_limites(clrs_example_data):
+    """
+    TEST DE VISUALIZACIÓN:
+    El DOT generado declara cada nodo una sola vez y respeta los límites de
+    niveles y de nodos (eligiendo el subárbol más probable si se dan probabilidades).
+    """
+    from src.obst.tree_utils import generar_dot
+    keys, p, q = clrs_example_data["keys"], clrs_example_data["p"], clrs_example_data["q"]
+    _, root_table = optimal_bst(keys, p, q)
+    raiz = reconstruir_arbol(root_table, keys, 1, len(keys))
+
+    def etiquetas(lineas):
+        return [l.split('"')[1] for l in lineas if '[label=' in l]
+
+    completo = list(generar_dot(raiz))
+    assert sorted(etiquetas(completo)) == keys
+    assert sum('->' in l for l in completo) == len(keys) - 1
+
+    # k2 es la raíz; en dos niveles solo aparecen sus hijos k1 y k5.
+    assert sorted(etiquetas(generar_dot(raiz, max_niveles=2))) == ['k1', 'k2', 'k5']
+
+    # Con probabilidades, el siguiente nodo más probable tras la raíz es k5 (0.20), no k1.
+    limitado = list(generar_dot(raiz, max_nodos=2, probabilidades=dict(zip(keys, p))))
+    assert etiquetas(limitado) == ['k2', 'k5']
+    assert sum('->' in l for l in limitado) == 1
+
+def test_reconstruccion_iterativa_arbol_degenerado():
+    """
+    TEST DE ESCALABILIDAD:
+    Un árbol completamente sesgado (cada raíz es la primera clave del intervalo)
+    más profundo que el límite de recursión se reconstruye y recorre sin errores.
+    """
+    import sys
+    from src.obst.tree_utils import iterar_inorden
+
+    n = sys.getrecursionlimit() + 500
+    keys = list(range(n))
+    # Tabla de raíces 0-indexada como la de optimal_bst: ROOT[i-1][j-1] = i.
+    root_table = [[i + 1] * (n + 1) for i in range(n + 1)]
+
+    raiz = reconstruir_arbol(root_table, keys, 1, n)
+    assert raiz.key == 0 and raiz.left is None
+    assert obtener_recorrido_inorden(raiz) == keys
+
+    # El iterador es perezoso: se pueden pedir solo las primeras claves.
+    iterador = iterar_inorden(raiz)
+    assert [next(iterador) for _ in range(3)] == [0, 1, 2]
+
+def test_dibujo_async_registra_errores_y_no_abre_visor(monkeypatch, caplog):
+    """
+    TEST DE ROBUSTEZ:
+    Un fallo de Graphviz en el hilo de fondo se registra aunque nadie consulte
+    el Future, y el dibujo en segundo plano no abre el visor por defecto.
+    """
+    import logging
+    import subprocess
+    from src.obst import tree_utils
+
+    vistas = []
+    def renderizar_con_error(lineas, output_path, view):
+        vistas.append(view)
+        raise subprocess.CalledProcessError(1, 'dot')
+    monkeypatch.setattr(tree_utils, '_renderizar_dot', renderizar_con_error)
+
+    with caplog.at_level(logging.ERROR, logger='src.obst.tree_utils'):
+        futuro = tree_utils.dibujar_arbol_async(Node('k1'), filename='prueba_error')
+        assert isinstance(futuro.exception(timeout=10), subprocess.CalledProcessError)
+        tree_utils._EJECUTOR_DIBUJO.submit(lambda: None).result(timeout=10)  # Espera los callbacks
+
+    assert vistas == [False]
+    assert any(registro.exc_info and registro.exc_info[0] is subprocess.CalledProcessError
+               for registro in caplog.records)
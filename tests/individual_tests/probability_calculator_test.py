@@ -5,8 +5,15 @@ import os
 import json
 from src.utils.probability_calculator import (
     generar_terminos_dinamicamente,
-    obtener_probabilidades_de_documento
+    obtener_probabilidades_de_documento,
+    iterar_paginas_pdf,
+    extraer_texto_pdf,
+    contar_palabras,
+    frecuencias_por_regex,
+    masa_de_huecos,
+    probabilidades_desde_conteo
 )
+from collections import Counter
 
 # --- Datos de Prueba y Mocks ---
 # Se usará en los tests que dependen de obtener_probabilidades_de_documento
@@ -21,15 +28,16 @@ El estudio de algoritmos y datos es clave.
 @pytest.fixture
 def mock_pdf_extraction(monkeypatch):
     """
-    Este fixture intercepta la llamada a `extraer_texto_pdf` y, en su lugar,
-    devuelve nuestro texto de prueba (MOCK_TEXTO_PDF).
+    Este fixture intercepta la llamada a `iterar_paginas_pdf` y, en su lugar,
+    devuelve nuestro texto de prueba (MOCK_TEXTO_PDF) repartido en dos páginas.
     """
-    def mock_extraer(ruta_pdf):
-        return MOCK_TEXTO_PDF
+    def mock_paginas(ruta_pdf, procesos=None):
+        mitad = MOCK_TEXTO_PDF.index("Las estructuras")
+        return iter([MOCK_TEXTO_PDF[:mitad], MOCK_TEXTO_PDF[mitad:]])
     
     monkeypatch.setattr(
-        'src.utils.probability_calculator.extraer_texto_pdf', 
-        mock_extraer
+        'src.utils.probability_calculator.iterar_paginas_pdf', 
+        mock_paginas
     )
 
 # --- Conjunto de Pruebas ---
@@ -65,7 +73,7 @@ def test_probability_distribution(mock_pdf_extraction):
     # Frecuencias relativas: 3/8, 3/8, 2/8
     # Probabilidades 'p' (escaladas por 0.85): 0.85 * 3/8, 0.85 * 3/8, 0.85 * 2/8
     
-    terminos, p, q = obtener_probabilidades_de_documento("dummy_path.pdf", top_n=3)
+    terminos, p, q = obtener_probabilidades_de_documento("dummy_path.pdf", top_n=3, distribucion_q='uniforme')
     print(terminos)
     print(p)
     print(q)
@@ -147,8 +155,8 @@ def test_empty_text_input(monkeypatch):
     Verifica que el sistema maneje correctamente un texto vacío.
     """
     monkeypatch.setattr(
-        'src.utils.probability_calculator.extraer_texto_pdf', 
-        lambda ruta: ""
+        'src.utils.probability_calculator.iterar_paginas_pdf', 
+        lambda ruta, procesos=None: iter([""])
     )
 
     terminos, p, q = obtener_probabilidades_de_documento("dummy_path.pdf")
@@ -165,12 +173,58 @@ def test_no_relevant_terms(monkeypatch):
     """
     texto_irrelevante = "el la los un y que con por de a b c"
     monkeypatch.setattr(
-        'src.utils.probability_calculator.extraer_texto_pdf', 
-        lambda ruta: texto_irrelevante
+        'src.utils.probability_calculator.iterar_paginas_pdf', 
+        lambda ruta, procesos=None: iter([texto_irrelevante])
     )
     
     terminos, p, q = obtener_probabilidades_de_documento("dummy_path.pdf")
     
     assert terminos == []
     assert p == []
-    assert q == []
\ No newline at end of file
+    assert q == []
+
+def test_paginas_pdf_en_paralelo_identicas_a_serial():
+    """
+    TEST DE EQUIVALENCIA:
+    Extraer las páginas por rangos con un grupo de procesos debe dar las mismas
+    páginas, en el mismo orden, que la lectura serial, y `extraer_texto_pdf`
+    debe ser su concatenación.
+    """
+    ruta = os.path.join(os.path.dirname(__file__), '..', '..', 'docs', 'reporte_final.pdf')
+    paginas = list(iterar_paginas_pdf(ruta))
+
+    assert len(paginas) > 1
+    assert list(iterar_paginas_pdf(ruta, procesos=2)) == paginas
+    assert extraer_texto_pdf(ruta) == "".join(paginas)
+
+def test_conteo_en_una_pasada_coincide_con_regex():
+    """
+    TEST DE VERIFICACIÓN:
+    Las frecuencias que salen de la única pasada de tokenización deben
+    coincidir con el conteo por expresión regular de cada término.
+    """
+    conteo = contar_palabras(MOCK_TEXTO_PDF)
+    terminos = sorted(conteo)
+
+    assert [conteo[t] for t in terminos] == frecuencias_por_regex(MOCK_TEXTO_PDF, terminos)
+
+def test_q_por_huecos_segun_vocabulario():
+    """
+    TEST DE DISTRIBUCIÓN DE FALLOS:
+    Cada q_i debe ser proporcional a la frecuencia (más 1 de suavizado) de las
+    palabras que no son claves y caen entre la clave i y la i+1.
+    """
+    conteo = Counter({'datos': 9, 'grafos': 8, 'arbol': 5, 'cola': 3, 'heap': 1, 'zeta': 1, 'pila': 1})
+    terminos, p, q = probabilidades_desde_conteo(conteo, top_n=2, prob_exito_total=0.8)
+
+    assert terminos == ['datos', 'grafos']
+    # Huecos: (< datos) arbol, cola | (datos, grafos) nada | (> grafos) heap, pila, zeta
+    assert masa_de_huecos(conteo, terminos) == [8, 0, 3]
+    masas = [9, 1, 4]
+    assert all(abs(qi - m / 14 * 0.2) < 1e-12 for qi, m in zip(q, masas))
+    assert abs(sum(p) + sum(q) - 1.0) < 1e-12
+
+    _, _, q_uniforme = probabilidades_desde_conteo(conteo, top_n=2, prob_exito_total=0.8, distribucion_q='uniforme')
+    assert len(set(q_uniforme)) == 1
+    with pytest.raises(ValueError):
+        probabilidades_desde_conteo(conteo, distribucion_q='otra')
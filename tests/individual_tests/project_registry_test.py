@@ -0,0 +1,145 @@
+# tests/individual_tests/project_registry_test.py
+import json
+import threading
+import pytest
+from src.projects_management.project_registry import RegistroProyectos
+
+# --- Fixture de Pytest para un registro temporal ---
+
+@pytest.fixture
+def rutas_temporales(tmp_path):
+    """
+    Proporciona rutas temporales para la base de datos y para un JSON heredado
+    con dos proyectos (uno de ellos repetido).
+    """
+    ruta_json = tmp_path / "proyectos.json"
+    ruta_json.write_text(json.dumps([
+        {"nombre": "Proy A", "ruta_codigo": "/code/a", "ruta_documento": "/doc/a.pdf"},
+        {"nombre": "Proy B", "ruta_codigo": "/code/b", "ruta_documento": "/doc/b.pdf"},
+        {"nombre": "Proy A", "ruta_codigo": "/code/otra", "ruta_documento": "/doc/otra.pdf"},
+    ]))
+    return str(tmp_path / "proyectos.db"), str(ruta_json)
+
+# --- Conjunto de Pruebas ---
+
+def test_importacion_json_una_sola_vez(rutas_temporales):
+    """
+    TEST DE MIGRACIÓN:
+    Los proyectos del JSON se importan al abrir el registro por primera vez
+    (conservando el primero de los repetidos) y nunca más después.
+    """
+    ruta_db, ruta_json = rutas_temporales
+    with RegistroProyectos(ruta_db, ruta_json) as registro:
+        assert [p.nombre for p in registro.listar()] == ["Proy A", "Proy B"]
+        assert registro.obtener("Proy A").ruta_codigo == "/code/a"
+        assert registro.eliminar("Proy B")
+
+    # Reabrir no vuelve a importar: el proyecto eliminado no reaparece.
+    with RegistroProyectos(ruta_db, ruta_json) as registro:
+        assert [p.nombre for p in registro.listar()] == ["Proy A"]
+        assert registro.importar_json(ruta_json) == 0
+
+def test_upsert_obtener_y_eliminar(rutas_temporales):
+    """
+    TEST DE CORRECTITUD:
+    Registrar un nombre existente actualiza sus rutas sin duplicarlo, y
+    eliminar informa si el proyecto existía.
+    """
+    ruta_db, _ = rutas_temporales
+    with RegistroProyectos(ruta_db, ruta_json=None) as registro:
+        assert registro.guardar("Alpha", "/code/1", "/doc/1.pdf")
+        assert not registro.guardar("Alpha", "/code/2", "/doc/2.pdf")
+        assert len(registro) == 1
+        assert registro.obtener("Alpha").ruta_documento == "/doc/2.pdf"
+        assert registro.obtener("Fantasma") is None
+
+        assert registro.eliminar("Alpha")
+        assert not registro.eliminar("Alpha")
+        assert registro.listar() == []
+
+def test_escrituras_concurrentes(rutas_temporales):
+    """
+    TEST DE CONCURRENCIA:
+    Varios escritores con conexiones propias no pierden ni corrompen registros.
+    """
+    ruta_db, _ = rutas_temporales
+    RegistroProyectos(ruta_db, ruta_json=None).cerrar()
+
+    def escribir(hilo):
+        with RegistroProyectos(ruta_db, ruta_json=None) as registro:
+            for i in range(25):
+                registro.guardar(f"P{hilo}-{i}", f"/code/{i}", f"/doc/{i}.pdf")
+
+    hilos = [threading.Thread(target=escribir, args=(h,)) for h in range(4)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    with RegistroProyectos(ruta_db, ruta_json=None) as registro:
+        assert len(registro) == 100
+
+def test_hilos_comparten_una_conexion(rutas_temporales):
+    """
+    TEST DE CONCURRENCIA:
+    Varios hilos que escriben sobre el mismo registro (como hace la API) se
+    turnan para abrir sus transacciones en la conexión compartida.
+    """
+    ruta_db, _ = rutas_temporales
+    errores = []
+
+    with RegistroProyectos(ruta_db, ruta_json=None) as registro:
+        def escribir(hilo):
+            try:
+                for i in range(50):
+                    registro.guardar(f"P{hilo}-{i}", f"/code/{i}", f"/doc/{i}.pdf")
+                    registro.eliminar(f"P{hilo}-{i - 1}")
+            except Exception as error:
+                errores.append(error)
+
+        hilos = [threading.Thread(target=escribir, args=(h,)) for h in range(8)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        assert errores == []
+        assert sorted(p.nombre for p in registro.listar()) == sorted(f"P{h}-49" for h in range(8))
+
+def test_lecturas_no_ven_transacciones_sin_confirmar(rutas_temporales):
+    """
+    TEST DE AISLAMIENTO:
+    Una lectura desde otro hilo espera a que termine la transacción abierta en
+    la conexión compartida, así que nunca ve una fila que luego se revierte.
+    """
+    ruta_db, _ = rutas_temporales
+    insertado, revertir = threading.Event(), threading.Event()
+    leidos = []
+
+    with RegistroProyectos(ruta_db, ruta_json=None) as registro:
+        def escribir_y_revertir():
+            try:
+                with registro._transaccion() as cursor:
+                    cursor.execute("INSERT INTO proyectos (nombre, ruta_codigo, ruta_documento) "
+                                   "VALUES ('Fantasma', '/code/f', '/doc/f.pdf')")
+                    insertado.set()
+                    revertir.wait(timeout=10)
+                    raise RuntimeError("revertir")
+            except RuntimeError:
+                pass
+
+        def leer():
+            leidos.append((registro.obtener("Fantasma"), len(registro), registro.listar()))
+
+        escritor = threading.Thread(target=escribir_y_revertir)
+        escritor.start()
+        assert insertado.wait(timeout=10)
+        lector = threading.Thread(target=leer)
+        lector.start()
+        lector.join(timeout=0.2)
+        assert lector.is_alive()  # Espera a que se libere la conexión
+        revertir.set()
+        escritor.join()
+        lector.join()
+
+        assert leidos == [(None, 0, [])]
@@ -0,0 +1,134 @@
+# tests/individual_tests/query_log_test.py
+import pytest
+from src.obst.obst import optimal_bst
+from src.obst.tree_utils import obtener_recorrido_inorden
+from src.utils.query_log import RegistroConsultas, OBSTAdaptativo
+from src.utils.search_engine import costo_esperado_arbol, search_tree
+
+# --- Fixture de Pytest para Datos Estándar ---
+
+@pytest.fixture
+def claves_uniformes():
+    """
+    Proporciona 30 claves ordenadas con probabilidades previas uniformes.
+    """
+    claves = [f"t{i:02d}" for i in range(30)]
+    p = [0.9 / 30] * 30
+    q = [0.1 / 31] * 31
+    return claves, p, q
+
+# --- Conjunto de Pruebas ---
+
+def test_registro_clasifica_aciertos_y_fallos():
+    """
+    TEST DE CORRECTITUD:
+    Cada búsqueda suma en su clave o en su hueco, y el búfer circular conserva
+    solo los eventos más recientes en orden.
+    """
+    registro = RegistroConsultas(['b', 'd', 'f'], capacidad=4, decaimiento=1.0)
+    for clave in ['d', 'a', 'e', 'z', 'd', 'b']:
+        registro.registrar(clave)
+
+    p, q = registro.estimar()
+    assert p == [1 / 6, 2 / 6, 0.0]
+    assert q == [1 / 6, 0.0, 1 / 6, 1 / 6]
+    # Eventos: claves 0..2, huecos 3 + j. Solo quedan los últimos cuatro.
+    assert registro.eventos_recientes() == [3 + 2, 3 + 3, 1, 0]
+    assert RegistroConsultas(['a']).estimar() == (None, None)
+
+def test_registro_decae_exponencialmente():
+    """
+    TEST DE DECAIMIENTO:
+    Un evento de hace t consultas pesa decaimiento^t respecto del más reciente,
+    también después de renormalizar la escala.
+    """
+    registro = RegistroConsultas(['a', 'b'], decaimiento=0.5, capacidad=0)
+    for _ in range(400):  # Fuerza varias renormalizaciones
+        registro.registrar('a')
+    registro.registrar('b')
+    p, _ = registro.estimar()
+    assert abs(p[1] / p[0] - 1.0) < 1e-9  # 'b' pesa 1 y toda la historia de 'a' ~ 1
+
+def test_obst_adaptativo_se_reconstruye_con_las_consultas(claves_uniformes):
+    """
+    TEST DE ADAPTACIÓN:
+    Si las búsquedas se concentran en unas pocas claves, el costo esperado del
+    árbol vigente empeora, se reconstruye en segundo plano y el nuevo árbol es
+    el óptimo para la distribución estimada.
+    """
+    claves, p, q = claves_uniformes
+    arbol = OBSTAdaptativo(claves, p, q, umbral=0.05, intervalo_revision=50, decaimiento=0.99)
+    raiz_inicial = arbol.raiz
+    assert arbol.regresion() == pytest.approx(0.0)
+
+    for _ in range(10):
+        for clave in ('t29', 't28', 't27'):
+            for _ in range(20):
+                arbol.buscar(clave)
+    arbol.esperar_reconstruccion(timeout=10)
+
+    assert arbol.reconstrucciones >= 1
+    assert arbol.raiz is not raiz_inicial
+    assert obtener_recorrido_inorden(arbol.raiz) == claves
+    encontrado, profundidad = arbol.buscar('t29')
+    assert encontrado and profundidad <= 2
+
+    p_est, q_est = arbol.registro.estimar()
+    costo_optimo, _ = optimal_bst(claves, p_est, q_est)
+    assert costo_esperado_arbol(arbol.raiz, p_est, q_est) < costo_esperado_arbol(raiz_inicial, p_est, q_est)
+    assert costo_esperado_arbol(arbol.raiz, p_est, q_est) <= costo_optimo * (1 + arbol.umbral) + 1e-9
+
+def test_distribucion_mas_plana_no_reconstruye_un_arbol_optimo():
+    """
+    TEST DE REGRESIÓN:
+    Si las búsquedas se vuelven más uniformes, el costo esperado del árbol sube
+    (aumenta la entropía) pero el árbol sigue siendo óptimo: la regresión se
+    mide contra el óptimo de la nueva distribución y no dispara reconstrucciones.
+    """
+    claves = [f"k{i}" for i in range(7)]
+    # Pesos por nivel del árbol completo: el OBST es el mismo que con p uniforme.
+    p = [0.02, 0.1, 0.02, 0.62, 0.02, 0.1, 0.02]
+    q = [0.01] * 8
+    arbol = OBSTAdaptativo(claves, p, q, umbral=0.05, intervalo_revision=70, decaimiento=0.99)
+    costo_inicial = costo_esperado_arbol(arbol.raiz, *arbol.registro.estimar())
+
+    for _ in range(30):
+        for clave in claves:
+            arbol.buscar(clave)
+    arbol.esperar_reconstruccion(timeout=10)
+
+    p_est, q_est = arbol.registro.estimar()
+    assert costo_esperado_arbol(arbol.raiz, p_est, q_est) > costo_inicial * 1.2
+    assert arbol.regresion() == pytest.approx(0.0, abs=1e-9)
+    assert arbol.reconstrucciones == 0
+
+def test_revision_no_bloquea_la_busqueda(claves_uniformes, monkeypatch):
+    """
+    TEST DE LATENCIA:
+    La búsqueda que cae en el intervalo de revisión solo encola la revisión:
+    el cálculo O(n²) corre en el hilo de fondo, y mientras está pendiente no
+    se encolan otras.
+    """
+    import threading
+    from src.utils import query_log
+
+    claves, p, q = claves_uniformes
+    arbol = OBSTAdaptativo(claves, p, q, intervalo_revision=1)
+    liberar = threading.Event()
+    hilos, llamadas = [], []
+    costo_real = query_log._costo_optimo
+
+    def costo_lento(p_est, q_est):
+        hilos.append(threading.current_thread())
+        llamadas.append(1)
+        liberar.wait(timeout=10)
+        return costo_real(p_est, q_est)
+    monkeypatch.setattr(query_log, '_costo_optimo', costo_lento)
+
+    for _ in range(20):
+        assert arbol.buscar('t05') == search_tree(arbol.raiz, 't05')
+    liberar.set()
+    arbol.esperar_reconstruccion(timeout=10)
+
+    assert len(llamadas) == 1
+    assert hilos[0] is not threading.current_thread()
@@ -0,0 +1,140 @@
+# tests/individual_tests/search_engine_test.py
+import pytest
+from src.obst.obst import optimal_bst, reconstruir_arbol
+from src.bst.avl_tree import AVLTree
+from src.bst.red_black_tree import RedBlackTree
+from src.utils.search_engine import search_tree, search_many, costo_esperado_arbol
+from src.utils.shared_tree import exportar_arbol, ArbolCompartido, inicializar_trabajador, buscar_compartido
+
+# --- Fixture de Pytest para Datos Estándar ---
+
+@pytest.fixture
+def clrs_example_data():
+    """
+    Ejemplo clásico de CLRS: claves, probabilidades p y q, y costo óptimo.
+    """
+    return {
+        "keys": ['k1', 'k2', 'k3', 'k4', 'k5'],
+        "p": [0.15, 0.10, 0.05, 0.10, 0.20],
+        "q": [0.05, 0.10, 0.05, 0.05, 0.05, 0.10],
+        "expected_cost": 2.75,
+    }
+
+# --- Conjunto de Pruebas ---
+
+def test_costo_esperado_coincide_con_obst(clrs_example_data):
+    """
+    TEST DE CORRECTITUD:
+    El costo evaluado sobre el árbol reconstruido debe ser exactamente el costo
+    óptimo que calcula la programación dinámica (incluyendo las q).
+    """
+    keys, p, q = clrs_example_data["keys"], clrs_example_data["p"], clrs_example_data["q"]
+    _, root_table = optimal_bst(keys, p, q)
+    raiz = reconstruir_arbol(root_table, keys, 1, len(keys))
+
+    costo = costo_esperado_arbol(raiz, p, q)
+    assert abs(costo - clrs_example_data["expected_cost"]) < 1e-9
+
+def test_costo_esperado_avl_y_rojo_negro(clrs_example_data):
+    """
+    TEST DE EQUIVALENCIA:
+    Para AVL y Rojo-Negro (con su centinela TNULL) el evaluador debe coincidir con
+    sumar búsqueda por búsqueda, contando cada hueco a la profundidad de su padre + 1.
+    """
+    keys, p, q = clrs_example_data["keys"], clrs_example_data["p"], clrs_example_data["q"]
+    avl, rb = AVLTree(), RedBlackTree()
+    for clave in keys:
+        avl.insert(clave)
+        rb.insert(clave)
+
+    # Costo de referencia: p por la profundidad de cada clave; cada hueco se
+    # alcanza desde la más profunda de sus dos claves vecinas.
+    def costo_referencia(raiz):
+        profundidades = [search_tree(raiz, clave)[1] for clave in keys]
+        costo = sum(pi * d for pi, d in zip(p, profundidades))
+        vecinos = [profundidades[0]] + [max(a, b) for a, b in zip(profundidades, profundidades[1:])] + [profundidades[-1]]
+        return costo + sum(qi * (d + 1) for qi, d in zip(q, vecinos))
+
+    assert abs(costo_esperado_arbol(avl.root, p, q) - costo_referencia(avl.root)) < 1e-9
+    assert abs(costo_esperado_arbol(rb.root, p, q, centinela=rb.TNULL) - costo_referencia(rb.root)) < 1e-9
+    # El OBST nunca puede ser peor que un árbol balanceado.
+    assert costo_esperado_arbol(avl.root, p, q) >= clrs_example_data["expected_cost"] - 1e-9
+
+def test_costo_esperado_arbol_vacio_y_tamano_incorrecto():
+    """
+    TEST DE CASO LÍMITE:
+    Un árbol vacío cuesta q[0]; si el número de claves no coincide con p, se
+    lanza ValueError.
+    """
+    assert costo_esperado_arbol(None, [], [0.25]) == 0.25
+
+    avl = AVLTree()
+    avl.insert('a')
+    with pytest.raises(ValueError):
+        costo_esperado_arbol(avl.root, [0.5, 0.5], [0.0, 0.0, 0.0])
+
+def test_search_many_coincide_con_search_tree(clrs_example_data):
+    """
+    TEST DE EQUIVALENCIA:
+    La búsqueda por lotes debe devolver, en el orden de entrada, lo mismo que
+    llamar a `search_tree` clave por clave, con consultas ordenadas o no,
+    repetidas e inexistentes, y también sobre un Rojo-Negro con centinela.
+    """
+    keys, p, q = clrs_example_data["keys"], clrs_example_data["p"], clrs_example_data["q"]
+    _, root_table = optimal_bst(keys, p, q)
+    raiz = reconstruir_arbol(root_table, keys, 1, len(keys))
+
+    consultas = ['k3', 'a', 'k1', 'k5', 'k3', 'k35', 'z', 'k2']
+    for lote in (consultas, sorted(consultas)):
+        found, depth = search_many(raiz, lote)
+        assert [(bool(f), d) for f, d in zip(found, depth)] == [search_tree(raiz, k) for k in lote]
+
+    rb = RedBlackTree()
+    for clave in keys:
+        rb.insert(clave)
+    found, depth = search_many(rb.root, consultas, centinela=rb.TNULL)
+    assert list(found) == [1, 0, 1, 1, 1, 0, 0, 1]
+    assert all(d == -1 for f, d in zip(found, depth) if not f)
+    assert len(search_many(raiz, [])[0]) == 0
+
+def test_arbol_compartido_entre_procesos(clrs_example_data):
+    """
+    TEST DE EQUIVALENCIA:
+    Un árbol exportado a memoria compartida debe responder igual que el árbol
+    original, tanto en el proceso creador como en trabajadores que se adjuntan
+    por nombre, y admitir claves no ASCII.
+    """
+    from multiprocessing import Pool
+
+    keys = clrs_example_data["keys"] + ['ñandú', 'árbol']
+    avl = AVLTree()
+    for clave in keys:
+        avl.insert(clave)
+    consultas = keys + ['a', 'k0', 'zzz', '']
+
+    with exportar_arbol(avl.root) as compartido:
+        esperado = [search_tree(avl.root, clave) for clave in consultas]
+        assert len(compartido) == len(keys)
+        assert [compartido.buscar(clave) for clave in consultas] == esperado
+
+        with ArbolCompartido(compartido.nombre) as vista:
+            assert vista.buscar('ñandú') == search_tree(avl.root, 'ñandú')
+
+        with Pool(2, initializer=inicializar_trabajador, initargs=(compartido.nombre,)) as pool:
+            assert pool.map(buscar_compartido, consultas) == esperado
+
+    rb = RedBlackTree()
+    for clave in keys:
+        rb.insert(clave)
+    with exportar_arbol(rb.root, centinela=rb.TNULL) as compartido:
+        assert all(compartido.buscar(clave) == search_tree_rb(rb, clave) for clave in consultas)
+
+def search_tree_rb(rb, clave):
+    # search_tree no conoce el centinela TNULL; se recorre a mano.
+    nodo, depth = rb.root, 0
+    while nodo is not rb.TNULL:
+        depth += 1
+        if clave == nodo.key:
+            return True, depth
+        nodo = nodo.left if clave < nodo.key else nodo.right
+    return False, -1
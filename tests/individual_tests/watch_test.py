@@ -0,0 +1,101 @@
+# tests/individual_tests/watch_test.py
+import os
+import pytest
+from src.integration.watch import TablaSimilitudes, VigilanteSimilitud
+from src.lcs_detector.comparator import CodeComparator
+from src.projects_management.code_index import IndiceCodigo
+from src.projects_management.project_registry import RegistroProyectos
+
+# --- Fixture de Pytest con dos proyectos registrados ---
+
+@pytest.fixture
+def vigilante(tmp_path):
+    """
+    Registra dos proyectos con dos archivos cada uno y crea un vigilante con
+    registro, índice y tabla de resultados temporales.
+    """
+    for nombre in ("A", "B"):
+        codigo = tmp_path / nombre
+        codigo.mkdir()
+        (codigo / "suma.py").write_text("def suma(a, b):\n    return a + b\n")
+        (codigo / "otro.py").write_text(f"x_{nombre} = [i * 2 for i in range(10)]\n")
+    registro = RegistroProyectos(str(tmp_path / "proyectos.db"), ruta_json=None)
+    registro.guardar("A", str(tmp_path / "A"), "doc_a.pdf")
+    registro.guardar("B", str(tmp_path / "B"), "doc_b.pdf")
+    indice = IndiceCodigo(str(tmp_path / "indice.db"))
+    tabla = TablaSimilitudes(str(tmp_path / "similitudes.db"))
+    yield tmp_path, VigilanteSimilitud(registro, indice, tabla, intervalo=0, espera_estable=1.0)
+    registro.cerrar()
+    indice.cerrar()
+    tabla.cerrar()
+
+def _tocar(ruta, contenido):
+    # Cambia el contenido y fuerza un mtime distinto.
+    ruta.write_text(contenido)
+    info = os.stat(ruta)
+    os.utime(ruta, ns=(info.st_atime_ns, info.st_mtime_ns + 1_000_000_000))
+
+# --- Conjunto de Pruebas ---
+
+def test_calculo_inicial_igual_a_code_comparator(vigilante):
+    """
+    TEST DE CORRECTITUD:
+    La primera pasada calcula los 4 pares entre proyectos (nunca dentro de un
+    mismo proyecto) con el mismo score que CodeComparator.compare.
+    """
+    ruta, v = vigilante
+    assert v.procesar() == 4
+    assert len(v.tabla) == 4
+
+    comparador = CodeComparator()
+    for a in ("suma.py", "otro.py"):
+        for b in ("suma.py", "otro.py"):
+            esperado = comparador.compare((ruta / "A" / a).read_text(), (ruta / "B" / b).read_text())["similarity_score"]
+            assert v.tabla.score(("A", a), ("B", b)) == pytest.approx(esperado)
+    assert v.tabla.score(("A", "suma.py"), ("A", "otro.py")) is None
+
+    # Sin cambios, una nueva pasada no recalcula nada.
+    assert v.procesar() == 0
+
+def test_solo_se_recalculan_pares_del_archivo_modificado(vigilante):
+    """
+    TEST DE INCREMENTALIDAD:
+    Al modificar un archivo solo se recalculan sus pares con el otro proyecto,
+    y hasta que la carpeta no está estable (debounce) no se recalcula nada.
+    """
+    ruta, v = vigilante
+    assert v.sondear(ahora=0.0) == 0  # Cambio detectado, esperando estabilidad
+    assert v.sondear(ahora=1.0) == 4
+
+    _tocar(ruta / "A" / "otro.py", "def suma(x, y):\n    return x + y\n")
+    assert v.sondear(ahora=2.0) == 0
+    assert v.sondear(ahora=2.5) == 0
+    assert v.sondear(ahora=3.0) == 2  # otro.py contra los dos archivos de B
+
+    assert v.tabla.score(("A", "otro.py"), ("B", "suma.py")) == pytest.approx(1.0)
+    assert v.tabla.mayores(0.99)[0][:4] in (("A", "otro.py", "B", "suma.py"), ("A", "suma.py", "B", "suma.py"))
+    assert v.sondear(ahora=10.0) == 0
+
+def test_eliminaciones_borran_pares(vigilante):
+    """
+    TEST DE CONSISTENCIA:
+    Borrar un archivo elimina sus pares, y quitar un proyecto del registro
+    elimina todos los pares en los que participaba.
+    """
+    ruta, v = vigilante
+    v.procesar()
+
+    os.remove(ruta / "B" / "otro.py")
+    assert v.procesar() == 0
+    assert len(v.tabla) == 2
+    assert v.tabla.score(("A", "suma.py"), ("B", "otro.py")) is None
+
+    (ruta / "C").mkdir()
+    (ruta / "C" / "suma.py").write_text("def suma(a, b):\n    return a + b\n")
+    v.registro.guardar("C", str(ruta / "C"), "doc_c.pdf")
+    assert v.procesar() == 3  # C/suma.py contra A (2 archivos) y B (1 archivo)
+    assert len(v.tabla) == 5
+
+    v.registro.eliminar("C")
+    v.procesar()
+    assert len(v.tabla) == 2